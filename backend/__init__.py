@@ -87,7 +87,7 @@ def create_app():
 
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        return db.session.get(User, int(user_id))
 
     # --------------------------------------------------------------------
     # BLOCK UNAPPROVED USERS
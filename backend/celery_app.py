@@ -28,6 +28,14 @@ celery.conf.update(
     worker_prefetch_multiplier=1,  # Process one task at a time
     worker_max_tasks_per_child=50,  # Restart worker after 50 tasks (prevent memory leaks)
     result_expires=86400,  # Keep results for 24 hours
+    # Minutes-long profile LLM calls get their own queue so they can be
+    # given a dedicated worker (-Q profiles) and never sit in front of
+    # quick tasks. The stock worker commands consume both queues.
+    task_routes={
+        'backend.tasks.exports.generate_user_profile': {'queue': 'profiles'},
+        'backend.tasks.exports.update_user_profile': {'queue': 'profiles'},
+        'backend.tasks.exports.integrate_user_profile': {'queue': 'profiles'},
+    },
     beat_schedule={
         'check-profile-updates': {
             'task': 'backend.tasks.exports.check_pending_profile_updates',
@@ -66,6 +74,11 @@ celery.conf.update(
             'task': 'backend.tasks.poll_draft.collect_poll_draft_batches',
             'schedule': 60.0,  # batches typically finish in 1-5 min
         },
+        # /stats daily token rollup; today's tokens are always summed live.
+        'refresh-daily-node-tokens': {
+            'task': 'backend.tasks.stats_rollup.refresh_daily_node_tokens',
+            'schedule': 900.0,  # every 15 min
+        },
         # Nightly X bookmark refresh (#208): an HOURLY gate that dispatches
         # each account when its user's local clock hits ~3am (User.timezone)
         # — users sync in their own night, wherever they are. A 20h min-gap
@@ -102,3 +115,5 @@ from backend.tasks import embeddings  # noqa: F401
 from backend.tasks import poll_draft  # noqa: F401
 from backend.tasks import external_sync  # noqa: F401
 from backend.tasks import external_digest  # noqa: F401
+from backend.tasks import stats_rollup  # noqa: F401
+from backend.tasks import notifications  # noqa: F401
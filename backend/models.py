@@ -310,6 +310,19 @@ class Node(db.Model):
             "human_owner_id", "source_key",
             name="uq_node_human_owner_source_key",
         ),
+        # /stats sums distributed_tokens for a created_at range (today's
+        # live part on top of the DailyNodeTokens rollup), per user and
+        # globally; INCLUDE lets Postgres answer both from the index alone.
+        db.Index('ix_node_user_created', 'user_id', 'created_at',
+                 postgresql_include=['distributed_tokens']),
+        db.Index('ix_node_created_at', 'created_at',
+                 postgresql_include=['distributed_tokens']),
+        # Profile heartbeat / chunk loop: SUM(token_count) and "anything
+        # newer?" probes over a user's AI-readable nodes, answered from the
+        # index without heap fetches.
+        db.Index('ix_node_user_ai_created', 'user_id', 'created_at',
+                 postgresql_include=['token_count', 'updated_at'],
+                 postgresql_where=db.text("ai_usage IN ('chat', 'train')")),
     )
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -352,7 +365,7 @@ class Node(db.Model):
         for a in self.context_artifacts:
             if a.artifact_type != "user_artifact":
                 continue
-            row = UserArtifact.query.get(a.artifact_id)
+            row = db.session.get(UserArtifact, a.artifact_id)
             if row is not None:
                 result[row.kind] = row
         return result
@@ -363,13 +376,13 @@ class Node(db.Model):
         if row is None:
             return None
         if artifact_type == "prompt":
-            return UserPrompt.query.get(row.artifact_id)
+            return db.session.get(UserPrompt, row.artifact_id)
         if artifact_type == "profile":
-            return UserProfile.query.get(row.artifact_id)
+            return db.session.get(UserProfile, row.artifact_id)
         if artifact_type == "todo":
-            return UserTodo.query.get(row.artifact_id)
+            return db.session.get(UserTodo, row.artifact_id)
         if artifact_type == "recent_context":
-            return UserRecentContext.query.get(row.artifact_id)
+            return db.session.get(UserRecentContext, row.artifact_id)
         # ai_preferences is a UserArtifact now (#158 Slice 5), resolved via
         # get_user_artifacts() like other artifact kinds — not here.
         return None
@@ -385,7 +398,7 @@ class Node(db.Model):
         # Artifact-based prompt resolution
         prompt_artifact = self.get_artifact_row("prompt")
         if prompt_artifact is not None:
-            prompt = UserPrompt.query.get(prompt_artifact.artifact_id)
+            prompt = db.session.get(UserPrompt, prompt_artifact.artifact_id)
             return prompt.get_content() if prompt else ""
         if self.content is None:
             return ""
@@ -498,14 +511,24 @@ class Draft(db.Model):
     # condition can use it.
     streaming_warning = db.Column(db.Text, nullable=True)
 
+    # Bumped by set_content() on every write so the draft SSE stream can
+    # detect content changes without re-reading and decrypting the blob.
+    content_version = db.Column(db.Integer, nullable=False, default=0,
+                                server_default="0")
+
     # Relationships
     user = db.relationship("User", backref="drafts")
     node = db.relationship("Node", foreign_keys=[node_id])
     parent = db.relationship("Node", foreign_keys=[parent_id])
 
     def set_content(self, plaintext: str):
-        """Set content with encryption."""
+        """Set content with encryption and bump content_version."""
         self.content = encrypt_content(plaintext)
+        if self.id is None:
+            self.content_version = (self.content_version or 0) + 1
+        else:
+            # Increment in SQL so concurrent writers never reuse a version
+            self.content_version = Draft.content_version + 1
 
     def get_content(self) -> str:
         """Get decrypted content."""
@@ -612,6 +635,13 @@ class UserTodo(db.Model):
 
     user = db.relationship("User", backref="todos")
 
+    # Every todo endpoint reads "this user's versions, newest first": the
+    # latest is an index seek + LIMIT 1, the versions list an ordered range
+    # scan (Postgres walks the btree backwards, so no DESC column needed).
+    __table_args__ = (
+        db.Index('ix_user_todo_user_created', 'user_id', 'created_at'),
+    )
+
     def set_content(self, plaintext):
         self.content = encrypt_content(plaintext)
 
@@ -849,10 +879,17 @@ class NodeTranscriptChunk(db.Model):
     # Relationship back to node
     node = db.relationship("Node", backref="transcript_chunks")
 
-    # Unique constraint: one chunk per index per session OR per node
+    # Unique constraint: one chunk per index per session OR per node.
+    # The covering indexes match the SSE poll (owner = X AND chunk_index > N
+    # AND status IN (...) ORDER BY chunk_index): INCLUDE (status) lets
+    # Postgres evaluate the status filter without touching the heap.
     __table_args__ = (
         db.UniqueConstraint('session_id', 'chunk_index', name='uq_session_chunk_index'),
         db.UniqueConstraint('node_id', 'chunk_index', name='uq_node_chunk_index'),
+        db.Index('ix_ntc_node_chunk_status', 'node_id', 'chunk_index',
+                 postgresql_include=['status']),
+        db.Index('ix_ntc_session_chunk_status', 'session_id', 'chunk_index',
+                 postgresql_include=['status']),
     )
 
     def set_text(self, plaintext: str):
@@ -1080,10 +1117,15 @@ class TTSChunk(db.Model):
     node = db.relationship("Node", backref="tts_chunks")
     profile = db.relationship("UserProfile", backref="tts_chunks")
 
-    # Unique constraints: one chunk per index per node/profile
+    # Unique constraints: one chunk per index per node/profile, plus
+    # covering indexes for the SSE poll (see NodeTranscriptChunk).
     __table_args__ = (
         db.UniqueConstraint('node_id', 'chunk_index', name='uq_node_tts_chunk_index'),
         db.UniqueConstraint('profile_id', 'chunk_index', name='uq_profile_tts_chunk_index'),
+        db.Index('ix_tts_chunk_node_chunk_status', 'node_id', 'chunk_index',
+                 postgresql_include=['status']),
+        db.Index('ix_tts_chunk_profile_chunk_status', 'profile_id', 'chunk_index',
+                 postgresql_include=['status']),
     )
 
 
@@ -1242,3 +1284,22 @@ class PollDraftBatchJob(db.Model):
     submitted_at = db.Column(
         db.DateTime, nullable=False, default=datetime.utcnow)
     collected_at = db.Column(db.DateTime, nullable=True)
+
+
+class DailyNodeTokens(db.Model):
+    """Per-user, per-day SUM(Node.distributed_tokens) rollup backing /stats.
+
+    Holds completed (UTC) days only and is rebuilt wholesale by the
+    refresh-daily-node-tokens beat task; /stats adds today's live sum on
+    top, so the full node scan runs once per refresh instead of on every
+    request. See backend/utils/stats_rollup.py.
+    """
+    __tablename__ = "daily_node_tokens"
+
+    user_id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    tokens = db.Column(db.BigInteger, nullable=False, default=0)
+    __table_args__ = (
+        # Global series reads every user's row for a day range
+        db.Index('ix_daily_node_tokens_day', 'day'),
+    )
@@ -118,7 +118,7 @@ def list_users():
 @login_required
 @admin_required
 def toggle_user_status(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     user.approved = not user.approved  # Toggle the approved flag
     if not user.approved:
         # Record deactivation time (terms acceptance fields are preserved for audit)
@@ -134,7 +134,7 @@ def update_user_email(user_id):
     email = data.get("email")
     if email is None:
         return jsonify({"error": "Email is required."}), 400
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     user.email = email
     db.session.commit()
     return jsonify({"message": "Email updated", "email": user.email}), 200
@@ -147,7 +147,7 @@ def update_user_plan(user_id):
     plan = data.get("plan")
     if plan not in User.ALLOWED_PLANS:
         return jsonify({"error": f"Invalid plan. Allowed: {sorted(User.ALLOWED_PLANS)}"}), 400
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     user.plan = plan
     db.session.commit()
     return jsonify({"message": "Plan updated", "plan": user.plan}), 200
@@ -171,7 +171,7 @@ def update_user_spend_limit(user_id):
     if limit < 0:
         return jsonify({"error": "limit_usd must be >= 0."}), 400
 
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     user.monthly_spend_limit_usd = limit
     state = reconcile_user_spend_block(user, current_app.config)
     db.session.commit()
@@ -223,7 +223,7 @@ def whitelist_user():
 @login_required
 @admin_required
 def activate_and_welcome(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
 
     if not user.email:
         return jsonify({"error": "User has no email address. Add one first."}), 400
@@ -347,7 +347,7 @@ def list_feedback():
 def update_feedback_status(feedback_id):
     from backend.models import UserFeedback
 
-    feedback = UserFeedback.query.get_or_404(feedback_id)
+    feedback = db.get_or_404(UserFeedback, feedback_id)
     status = (request.get_json() or {}).get("status")
     if status not in ("new", "reviewed", "done"):
         return jsonify({"error": "Invalid status"}), 400
@@ -434,7 +434,7 @@ def list_polls():
 def list_poll_responses(poll_id):
     from backend.models import Poll, PollResponse
 
-    poll = Poll.query.get_or_404(poll_id)
+    poll = db.get_or_404(Poll, poll_id)
     responses = PollResponse.query.filter_by(
         poll_id=poll.id, status="sent").order_by(
         PollResponse.sent_at.asc()).all()
@@ -459,7 +459,7 @@ def list_poll_responses(poll_id):
 def close_poll(poll_id):
     from backend.models import Poll
 
-    poll = Poll.query.get_or_404(poll_id)
+    poll = db.get_or_404(Poll, poll_id)
     if poll.closed_at is None:
         poll.closed_at = datetime.utcnow()
         db.session.commit()
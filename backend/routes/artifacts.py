@@ -163,7 +163,7 @@ def get_artifact_versions(kind):
 @artifacts_bp.route("/versions/<int:version_id>", methods=["GET"])
 @login_required
 def get_artifact_version(version_id):
-    artifact = UserArtifact.query.get_or_404(version_id)
+    artifact = db.get_or_404(UserArtifact, version_id)
     if artifact.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
     return jsonify({"artifact": _serialize(artifact)}), 200
@@ -173,7 +173,7 @@ def get_artifact_version(version_id):
 @login_required
 def revert_artifact(kind, version_id):
     """Create a new artifact version from a historical one."""
-    old = UserArtifact.query.get_or_404(version_id)
+    old = db.get_or_404(UserArtifact, version_id)
     if old.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
     if old.kind != kind:
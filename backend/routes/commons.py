@@ -40,7 +40,7 @@ def _author_name(node):
     account — the frontend renders "model · via <human>"."""
     if node.node_type == "llm":
         owner_id = node.human_owner_id or node.user_id
-        owner = User.query.get(owner_id) if owner_id else None
+        owner = db.session.get(User, owner_id) if owner_id else None
         return owner.username if owner else None
     return node.user.username if node.user else None
 
@@ -134,7 +134,7 @@ def public_thread(node_id):
     endpoint never confirms the existence of anything non-public."""
     if not _enabled():
         return jsonify({"error": "Not found"}), 404
-    node = Node.query.get(node_id)
+    node = db.session.get(Node, node_id)
     if (node is None or node.deleted_at is not None
             or node.privacy_level != PrivacyLevel.PUBLIC.value):
         return jsonify({"error": "Not found"}), 404
@@ -145,7 +145,7 @@ def public_thread(node_id):
     visited = set()
     while (root.parent_id and root.id not in visited):
         visited.add(root.id)
-        parent = Node.query.get(root.parent_id)
+        parent = db.session.get(Node, root.parent_id)
         if (parent is None or parent.deleted_at is not None
                 or parent.privacy_level != PrivacyLevel.PUBLIC.value):
             break
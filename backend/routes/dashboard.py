@@ -64,7 +64,7 @@ def _serialize_node_for_list(node):
     # Determine human owner username for LLM nodes
     human_owner_username = None
     if display_node.node_type == "llm" and display_node.human_owner_id:
-        human_owner = User.query.get(display_node.human_owner_id)
+        human_owner = db.session.get(User, display_node.human_owner_id)
         if human_owner:
             human_owner_username = human_owner.username
 
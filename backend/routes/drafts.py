@@ -75,7 +75,7 @@ def get_draft():
 
     # Validate node_id if provided - user must own the node OR be LLM requester (parent node owner)
     if node_id:
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node:
             return jsonify({"error": "Node not found"}), 404
         # Soft-deleted target — treat as gone (per plan §17). The
@@ -96,7 +96,7 @@ def get_draft():
     # the draft-fetch logic below decides the actual lookup key.
     parent_deleted = False
     if parent_id:
-        parent = Node.query.get(parent_id)
+        parent = db.session.get(Node, parent_id)
         if parent is not None and parent.deleted_at is not None:
             parent_deleted = True
 
@@ -274,7 +274,7 @@ def save_draft():
 
     # Validate node_id if provided - user must own the node OR be LLM requester (parent node owner)
     if node_id:
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node:
             return jsonify({"error": "Node not found"}), 404
         # Soft-deleted edit target — match the create endpoint's 410
@@ -289,7 +289,7 @@ def save_draft():
 
     # Validate parent_id if provided - parent must exist
     if parent_id:
-        parent = Node.query.get(parent_id)
+        parent = db.session.get(Node, parent_id)
         if not parent:
             return jsonify({"error": "Parent node not found"}), 404
         if parent.deleted_at is not None:
@@ -356,7 +356,7 @@ def delete_draft():
 
     # Validate node_id if provided - user must own the node OR be LLM requester (parent node owner)
     if node_id:
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node:
             return jsonify({"error": "Node not found"}), 404
 
@@ -798,7 +798,7 @@ def finalize_streaming(session_id):
         # node creation falls back to the frontend POST /voice path, which
         # re-posts the draft's titled content. Walks ancestry from parent_id
         # (if any) → user.preferred_model → DEFAULT.
-        parent_node = Node.query.get(parent_id) if parent_id else None
+        parent_node = db.session.get(Node, parent_id) if parent_id else None
         model = pick_model_for_generation(parent_node, current_user)
 
     if total_chunks is None:
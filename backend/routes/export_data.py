@@ -1732,7 +1732,7 @@ def get_profile_status(task_id):
         result = task.result if isinstance(task.result, dict) else {}
         profile_id = result.get('profile_id')
         if profile_id:
-            profile = UserProfile.query.get(profile_id)
+            profile = db.session.get(UserProfile, profile_id)
             if profile and profile.user_id == current_user.id:
                 profile_data = {
                     "id": profile.id,
@@ -167,12 +167,12 @@ def get_feed():
             # we want here.
             newest_id = newest_map.get(node.id)
             if newest_id and newest_id != node.id:
-                display_node = Node.query.get(newest_id) or node
+                display_node = db.session.get(Node, newest_id) or node
 
         # Determine human owner username for LLM nodes
         human_owner_username = None
         if display_node.node_type == "llm" and display_node.human_owner_id:
-            human_owner = User.query.get(display_node.human_owner_id)
+            human_owner = db.session.get(User, display_node.human_owner_id)
             if human_owner:
                 human_owner_username = human_owner.username
 
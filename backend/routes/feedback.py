@@ -23,7 +23,7 @@ def submit():
     if not llm_node_id:
         return jsonify({"error": "llm_node_id is required"}), 400
 
-    llm_node = Node.query.get(llm_node_id)
+    llm_node = db.session.get(Node, llm_node_id)
     if not llm_node:
         return jsonify({"error": "Node not found"}), 404
 
@@ -48,7 +48,7 @@ def submit():
     if draft.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
-    origin_node = Node.query.get(draft.parent_id)
+    origin_node = db.session.get(Node, draft.parent_id)
     if not origin_node:
         return jsonify({"error": "Origin node not found"}), 404
 
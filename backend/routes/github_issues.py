@@ -19,7 +19,7 @@ def create_issue():
         return jsonify({"error": "llm_node_id is required"}), 400
 
     # Find the pending draft by walking ancestor chain
-    llm_node = Node.query.get(llm_node_id)
+    llm_node = db.session.get(Node, llm_node_id)
     if not llm_node:
         return jsonify({"error": "Node not found"}), 404
 
@@ -44,7 +44,7 @@ def create_issue():
         return jsonify({"error": "Unauthorized"}), 403
 
     # Parse issue from the originating LLM node content
-    origin_node = Node.query.get(draft.parent_id)
+    origin_node = db.session.get(Node, draft.parent_id)
     if not origin_node:
         return jsonify({"error": "Origin node not found"}), 404
 
@@ -163,7 +163,7 @@ def _restore_node(node_id, content, privacy_level, ai_usage,
     node id, so existing child links stay intact. Privacy/AI-usage are
     set to this import's choices, like any other (re)imported node.
     """
-    node = Node.query.get(node_id)
+    node = db.session.get(Node, node_id)
     node.content = content
     node.token_count = (
         token_count if token_count is not None
@@ -521,7 +521,7 @@ def confirm_import():
         profile_update_task_id = None
         if ai_usage in AI_ALLOWED:
             try:
-                user_obj = User.query.get(current_user.id)
+                user_obj = db.session.get(User, current_user.id)
                 if (user_obj and (user_obj.plan or "free")
                         in User.VOICE_MODE_PLANS):
                     latest_profile = UserProfile.query.filter_by(
@@ -1025,7 +1025,7 @@ def confirm_claude_import():
         profile_update_task_id = None
         if ai_usage in AI_ALLOWED:
             try:
-                user_obj = User.query.get(current_user.id)
+                user_obj = db.session.get(User, current_user.id)
                 if (user_obj and (user_obj.plan or "free")
                         in User.VOICE_MODE_PLANS):
                     latest_profile = UserProfile.query.filter_by(
@@ -1313,7 +1313,7 @@ def confirm_twitter_import():
         profile_update_task_id = None
         if ai_usage in AI_ALLOWED:
             try:
-                user_obj = User.query.get(current_user.id)
+                user_obj = db.session.get(User, current_user.id)
                 if (user_obj and (user_obj.plan or "free")
                         in User.VOICE_MODE_PLANS):
                     latest_profile = UserProfile.query.filter_by(
@@ -1748,7 +1748,7 @@ def confirm_chatgpt_import():
         profile_update_task_id = None
         if ai_usage in AI_ALLOWED:
             try:
-                user_obj = User.query.get(current_user.id)
+                user_obj = db.session.get(User, current_user.id)
                 if (user_obj and (user_obj.plan or "free")
                         in User.VOICE_MODE_PLANS):
                     latest_profile = UserProfile.query.filter_by(
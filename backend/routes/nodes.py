@@ -360,7 +360,7 @@ def _context_artifact_fields(n):
     artifacts = {}
     for row in n.context_artifacts:
         if row.artifact_type == "prompt":
-            prompt = UserPrompt.query.get(row.artifact_id)
+            prompt = db.session.get(UserPrompt, row.artifact_id)
             if prompt:
                 artifacts["prompt"] = {
                     "id": prompt.id,
@@ -369,7 +369,7 @@ def _context_artifact_fields(n):
                     "prompt_key": prompt.prompt_key,
                 }
         elif row.artifact_type == "profile":
-            profile = UserProfile.query.get(row.artifact_id)
+            profile = db.session.get(UserProfile, row.artifact_id)
             if profile:
                 artifacts["profile"] = {
                     "id": profile.id,
@@ -380,7 +380,7 @@ def _context_artifact_fields(n):
                     "content": profile.get_content(),
                 }
         elif row.artifact_type == "todo":
-            todo = UserTodo.query.get(row.artifact_id)
+            todo = db.session.get(UserTodo, row.artifact_id)
             if todo:
                 artifacts["todo"] = {
                     "id": todo.id,
@@ -391,7 +391,7 @@ def _context_artifact_fields(n):
                     "content": todo.get_content(),
                 }
         elif row.artifact_type == "recent_context":
-            rc = UserRecentContext.query.get(row.artifact_id)
+            rc = db.session.get(UserRecentContext, row.artifact_id)
             if rc:
                 artifacts["recent"] = {
                     "id": rc.id,
@@ -404,7 +404,7 @@ def _context_artifact_fields(n):
             # pinned content under the kind key for QuotedContent to resolve.
             # Non-inline kinds reach the model via the artifacts index / tools
             # and have no inline placeholder, so they're skipped here.
-            art = UserArtifact.query.get(row.artifact_id)
+            art = db.session.get(UserArtifact, row.artifact_id)
             if art and art.kind in UserArtifact.INLINE_KINDS:
                 artifacts[art.kind] = {
                     "id": art.id,
@@ -612,7 +612,7 @@ def create_node():
 
         # Public threads stay fully public (#228) — see the text path.
         if parent_id:
-            parent = Node.query.get(parent_id)
+            parent = db.session.get(Node, parent_id)
             if (parent is not None
                     and parent.privacy_level == PrivacyLevel.PUBLIC
                     and privacy_level != PrivacyLevel.PUBLIC):
@@ -706,7 +706,7 @@ def create_node():
     # through quoting it in your own threads instead. The frontend shows a
     # consent dialog before sending; this is the structural backstop.
     if parent_id:
-        parent = Node.query.get(parent_id)
+        parent = db.session.get(Node, parent_id)
         if (parent is not None
                 and parent.privacy_level == PrivacyLevel.PUBLIC
                 and privacy_level != PrivacyLevel.PUBLIC):
@@ -782,7 +782,7 @@ def create_node():
 @nodes_bp.route("/<int:node_id>", methods=["PUT"])
 @login_required
 def update_node(node_id):
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check authorization: owner OR LLM requester (parent node owner)
     if not can_user_edit_node(node):
@@ -868,7 +868,7 @@ def update_node(node_id):
 @nodes_bp.route("/<int:node_id>", methods=["GET"])
 @login_required
 def get_node(node_id):
-    node = Node.query.get(node_id)
+    node = db.session.get(Node, node_id)
     if node is None:
         return jsonify({"error": "Node not found"}), 404
 
@@ -1027,7 +1027,7 @@ def resolve_node_quotes(node_id):
             "has_quotes": true
         }
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check if user has permission to access this node
     if not can_user_access_node(node, current_user.id):
@@ -1065,7 +1065,7 @@ def resolve_node_quotes(node_id):
 @nodes_bp.route("/<int:node_id>/children", methods=["GET"])
 @login_required
 def get_children(node_id):
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
     def make_preview(text, length=200):
         return text[:length] + ("..." if len(text) > length else "")
     children = Node.query.filter_by(parent_id=node_id).all()
@@ -1130,7 +1130,7 @@ def get_suggested_model(node_id):
     4. If the model is deprecated or legacy, fall through to default
     5. If no predecessor found, return system default
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
     supported = current_app.config["SUPPORTED_MODELS"]
 
     # Walk up the ancestry to find the most recent LLM node
@@ -1173,7 +1173,7 @@ def get_suggested_model(node_id):
 def request_llm_response(node_id):
     from backend.llm_providers import LLMProvider
 
-    parent_node = Node.query.get_or_404(node_id)
+    parent_node = db.get_or_404(Node, node_id)
 
     # Generation is allowed only on your OWN nodes (#228): on a public
     # thread you respond first (a public reply of yours), then generate on
@@ -1248,7 +1248,7 @@ def add_linked_node(node_id):
     # Validate that the node to be linked exists and is alive (privacy filter
     # also excludes soft-deleted, but we want a distinct 410 if specifically
     # the target is deleted vs 404 if it never existed).
-    linked_node = Node.query.get(linked_node_id)
+    linked_node = db.session.get(Node, linked_node_id)
     if not linked_node:
         return jsonify({"error": "Linked node not found"}), 404
     if linked_node.deleted_at is not None:
@@ -1258,7 +1258,7 @@ def add_linked_node(node_id):
     err = assert_parent_alive(node_id)
     if err is not None:
         return err
-    parent_node = Node.query.get_or_404(node_id)
+    parent_node = db.get_or_404(Node, node_id)
     from backend.utils.tokens import approximate_token_count as _atc5
     new_node = Node(
         user_id=current_user.id,
@@ -1301,7 +1301,7 @@ def get_audio_urls(node_id):
               202 Accepted – when TTS generation is in progress
               404     – when neither audio exists and no generation in progress.
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Public nodes: any authenticated user can listen.
     # Non-public nodes: require voice-mode (admin or paid plan).
@@ -1365,7 +1365,7 @@ def get_audio_chunks(node_id):
     Browsers incorrectly calculate duration from timestamps for WebM files
     with non-zero start times (common with MediaRecorder timeslice recordings).
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Public nodes: any authenticated user can listen.
     # Non-public nodes: require voice-mode (admin or paid plan).
@@ -1446,7 +1446,7 @@ def download_audio(node_id):
     if fmt not in ('original', 'mp3'):
         return jsonify({"error": "Unsupported format, use 'original' or 'mp3'"}), 400
 
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     if node.privacy_level != "public":
         if not current_user.has_voice_mode:
@@ -1548,7 +1548,7 @@ def generate_tts(node_id):
     `202 Accepted` (if generation was triggered) or `200 OK` (if it already
     exists).
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # If original recording exists we stream that – generating TTS is not
     # allowed.
@@ -1611,7 +1611,7 @@ def generate_tts(node_id):
 @login_required
 def get_transcription_status(node_id):
     """Get the current transcription status for a node."""
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check ownership (can_user_access_node handles LLM nodes by walking
     # up the parent chain to find the human owner)
@@ -1654,7 +1654,7 @@ def get_transcription_status(node_id):
 @login_required
 def get_llm_status(node_id):
     """Get the current LLM completion status for a node."""
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check ownership (can_user_access_node handles LLM nodes by walking
     # up the parent chain to find the human owner)
@@ -1676,7 +1676,7 @@ def get_llm_status(node_id):
                 db.session.commit()
                 # Get the created node ID from task result
                 if task.result and 'llm_node_id' in task.result:
-                    llm_node = Node.query.get(task.result['llm_node_id'])
+                    llm_node = db.session.get(Node, task.result['llm_node_id'])
                     if llm_node:
                         created_node = {
                             "id": llm_node.id,
@@ -1734,7 +1734,7 @@ def get_llm_status(node_id):
 @login_required
 def get_tts_status(node_id):
     """Get the current TTS generation status for a node."""
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check ownership (can_user_access_node handles LLM nodes by walking
     # up the parent chain to find the human owner)
@@ -1924,7 +1924,7 @@ def upload_chunk():
         return jsonify({"error": "Invalid chunk_index or node_id"}), 400
 
     # Verify node ownership
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
     if node.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
@@ -1988,7 +1988,7 @@ def finalize_chunked_upload():
         return jsonify({"error": "Invalid node_id"}), 400
 
     # Verify node ownership
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
     if node.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
@@ -2232,7 +2232,7 @@ def upload_audio_chunk(node_id):
 
     Returns: { "chunk_index": 0, "task_id": "celery-task-id" }
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Verify ownership
     if node.user_id != current_user.id:
@@ -2349,7 +2349,7 @@ def finalize_streaming_transcription(node_id):
 
     Returns: Node info with assembled transcript
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Verify ownership
     if node.user_id != current_user.id:
@@ -2405,7 +2405,7 @@ def get_streaming_status(node_id):
 
     Returns status of all chunks and overall transcription progress.
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check ownership
     if node.user_id != current_user.id and not getattr(current_user, "is_admin", False):
@@ -2455,7 +2455,7 @@ def get_streaming_status(node_id):
 @login_required
 def pin_node(node_id):
     """Pin a node to the current user's profile (Dashboard + Feed)."""
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     owner_id = node.human_owner_id or node.user_id
     if owner_id != current_user.id:
@@ -2481,7 +2481,7 @@ def pin_node(node_id):
 @login_required
 def unpin_node(node_id):
     """Unpin a node from the current user's profile."""
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     owner_id = node.human_owner_id or node.user_id
     if owner_id != current_user.id:
@@ -2512,7 +2512,7 @@ def delete_node(node_id):
 
     # Pre-lock 403 short-circuit — cheap and avoids holding a row lock to
     # tell an unauthorized client they can't delete.
-    pre = Node.query.get_or_404(node_id)
+    pre = db.get_or_404(Node, node_id)
     if not can_user_edit_node(pre, current_user.id):
         return jsonify({"error": "Not authorized"}), 403
 
@@ -2559,7 +2559,7 @@ def get_tts_chapters(node_id):
     chunk durations) so the player can jump within the merged file and
     map chapters onto the chunked queue alike.
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
     if not can_user_access_node(node) and not getattr(
             current_user, "is_admin", False):
         return jsonify({"error": "Unauthorized"}), 403
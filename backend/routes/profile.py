@@ -65,7 +65,7 @@ def get_profile_versions():
 @login_required
 def get_profile_version(version_id):
     """Get a specific profile version's content."""
-    profile = UserProfile.query.get_or_404(version_id)
+    profile = db.get_or_404(UserProfile, version_id)
 
     if profile.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -87,7 +87,7 @@ def revert_profile(version_id):
     """Create a new profile version from a historical one. Mirrors the
     in-pipeline revert (tasks/exports.py): a new row typed 'revert' that
     carries the source version's attribution and ai_usage (#191)."""
-    old = UserProfile.query.get_or_404(version_id)
+    old = db.get_or_404(UserProfile, version_id)
     if old.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
@@ -130,7 +130,7 @@ def revert_profile(version_id):
 @login_required
 def get_audio(profile_id):
     """Return JSON with URL for TTS audio associated with a profile."""
-    profile = UserProfile.query.get_or_404(profile_id)
+    profile = db.get_or_404(UserProfile, profile_id)
 
     if profile.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -159,7 +159,7 @@ def get_audio(profile_id):
 @require_spend_headroom
 def generate_tts(profile_id):
     """Trigger TTS generation for the user profile."""
-    profile = UserProfile.query.get_or_404(profile_id)
+    profile = db.get_or_404(UserProfile, profile_id)
 
     if profile.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -194,7 +194,7 @@ def generate_tts(profile_id):
 @login_required
 def get_tts_status(profile_id):
     """Get the current TTS generation status for a profile."""
-    profile = UserProfile.query.get_or_404(profile_id)
+    profile = db.get_or_404(UserProfile, profile_id)
 
     if profile.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -291,7 +291,7 @@ def update_profile(profile_id):
     """Update the content of a user profile."""
     from flask import request
 
-    profile = UserProfile.query.get_or_404(profile_id)
+    profile = db.get_or_404(UserProfile, profile_id)
 
     if profile.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
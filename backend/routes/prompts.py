@@ -208,7 +208,7 @@ def get_default_prompt(prompt_key):
 @login_required
 def get_prompt_version(prompt_key, version_id):
     """Get content of a specific version."""
-    prompt = UserPrompt.query.get_or_404(version_id)
+    prompt = db.get_or_404(UserPrompt, version_id)
 
     if prompt.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -232,7 +232,7 @@ def revert_prompt(prompt_key, version_id):
     if prompt_key not in PROMPT_DEFAULTS:
         return jsonify({"error": "Unknown prompt key"}), 404
 
-    old_prompt = UserPrompt.query.get_or_404(version_id)
+    old_prompt = db.get_or_404(UserPrompt, version_id)
 
     if old_prompt.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -346,7 +346,7 @@ def semantic_neighbors():
     if not node_id:
         return jsonify({"error": "Provide a node_id."}), 400
 
-    node = Node.query.get(node_id)
+    node = db.session.get(Node, node_id)
     if node is None or node.deleted_at is not None:
         return jsonify({"error": "Node not found."}), 404
     if (node.user_id != current_user.id
@@ -35,7 +35,7 @@ def _permalink(share):
     """/@<username>/<slug> when published with a slug, else None."""
     if not share.public_node_id:
         return None
-    node = Node.query.get(share.public_node_id)
+    node = db.session.get(Node, share.public_node_id)
     if node is None or not node.public_slug:
         return None
     return f"/@{share.user.username}/{node.public_slug}"
@@ -58,7 +58,7 @@ def _serialize(share):
 
 
 def _get_own_share_or_404(share_id):
-    share = ShareDraft.query.get(share_id)
+    share = db.session.get(ShareDraft, share_id)
     if not share or share.user_id != current_user.id:
         return None
     return share
@@ -165,7 +165,7 @@ def publish_share(share_id):
     # correctly severed.
     public_node = None
     if share.public_node_id:
-        prior = Node.query.get(share.public_node_id)
+        prior = db.session.get(Node, share.public_node_id)
         if (prior is not None and prior.deleted_at is not None
                 and (prior.get_content() or "") == content):
             prior.deleted_at = None
@@ -201,7 +201,7 @@ def publish_share(share_id):
     share.public_node_id = public_node.id
     # Back-link from the private proposal node to its public artifact.
     if share.source_node_id:
-        origin = Node.query.get(share.source_node_id)
+        origin = db.session.get(Node, share.source_node_id)
         if origin is not None and origin.linked_node_id is None:
             origin.linked_node_id = public_node.id
 
@@ -255,7 +255,7 @@ def save_proposal():
     if not llm_node_id:
         return jsonify({"error": "llm_node_id is required"}), 400
 
-    llm_node = Node.query.get(llm_node_id)
+    llm_node = db.session.get(Node, llm_node_id)
     if not llm_node:
         return jsonify({"error": "Node not found"}), 404
 
@@ -277,7 +277,7 @@ def save_proposal():
     if not draft:
         return jsonify({"error": "No pending share found"}), 404
 
-    origin_node = Node.query.get(draft.parent_id)
+    origin_node = db.session.get(Node, draft.parent_id)
     if not origin_node:
         return jsonify({"error": "Origin node not found"}), 404
 
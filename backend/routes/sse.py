@@ -10,19 +10,218 @@ from flask import Blueprint, Response, request, jsonify, current_app
 from flask_login import login_required, current_user
 from backend.models import Node, UserProfile, NodeTranscriptChunk, TTSChunk, Draft
 from backend.extensions import db
+from backend.utils import sse_notify
+from backend.utils.encryption import decrypt_content
+from sqlalchemy import and_, bindparam, case, func, select
 import json
 import time
 
 sse_bp = Blueprint("sse_bp", __name__)
 
+# Response headers shared by every stream. Content-Encoding: identity keeps
+# gzip/deflate middleware (and proxies honouring it) from compressing the
+# stream: compressors hold output back until a block fills, which stalls
+# per-event delivery and costs CPU on every tiny frame.
+SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'Content-Encoding': 'identity',
+    'X-Accel-Buffering': 'no',  # Disable nginx buffering
+}
+
+
+# Pre-encoded "event: <name>\ndata: " prefixes for every event these streams
+# emit, so a frame is two bytes concatenations instead of string formatting
+# plus a re-encode by the WSGI server.
+_EVENT_PREFIXES = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in (
+        "chunk_complete", "chunks_batch", "chunk_error", "chunk_ready",
+        "content_update", "all_complete", "error", "heartbeat", "close",
+    )
+}
+_DATA_PREFIX = b"data: "
+_FRAME_END = b"\n\n"
+
 
 def format_sse_message(data, event=None):
-    """Format data as an SSE message."""
-    msg = ""
+    """Format data as an SSE message (bytes, ready for the WSGI server)."""
     if event:
-        msg += f"event: {event}\n"
-    msg += f"data: {json.dumps(data)}\n\n"
-    return msg
+        prefix = _EVENT_PREFIXES.get(event) or f"event: {event}\ndata: ".encode()
+    else:
+        prefix = _DATA_PREFIX
+    return prefix + json.dumps(data, separators=(",", ":")).encode() + _FRAME_END
+
+
+def format_sse_retry(app):
+    """
+    Format the ``retry:`` field sent once when a stream opens.
+
+    It sets how long the browser waits before reconnecting after the
+    server closes a stream (e.g. on the max-connection timeout). The
+    browser default of ~3s turns an hour-long idle client into dozens of
+    reconnects, each re-running the auth and ownership checks.
+    """
+    return f"retry: {app.config.get('SSE_RETRY_MS', 15000)}\n\n".encode()
+
+
+def _next_poll_interval(app, interval, had_activity, pushed=False):
+    """
+    Return how long a stream generator sleeps before its next poll.
+
+    Polls fast right after something was sent and backs off exponentially
+    (up to a cap) while idle, so an idle stream costs a handful of queries
+    per minute instead of one per second. Pass ``interval=None`` to get
+    the starting (fastest) interval. When the stream is subscribed to push
+    wake-ups (``pushed``) the poll is only a fallback, so the cap is higher.
+    """
+    fastest = app.config.get('SSE_POLL_MIN_INTERVAL', 0.1)
+    if interval is None or had_activity:
+        return fastest
+    if pushed:
+        cap = app.config.get('SSE_PUSH_POLL_MAX_INTERVAL', 10.0)
+    else:
+        cap = app.config.get('SSE_POLL_MAX_INTERVAL', 2.0)
+    return min(interval * app.config.get('SSE_POLL_BACKOFF', 1.5), cap)
+
+
+# ── Poll statements ──────────────────────────────────────────────────────
+# Built once at import as Core selects with bind parameters: every tick
+# reuses the compiled-statement cache entry and gets plain rows back, with
+# no per-tick Query construction and no ORM instances for read-only columns.
+# Each is "entity LEFT JOIN new chunks", keyed by :entity_id / :last_chunk.
+
+_TRANSCRIPT_CHUNK_COLUMNS = (
+    NodeTranscriptChunk.chunk_index.label("chunk_index"),
+    NodeTranscriptChunk.status.label("chunk_status"),
+    NodeTranscriptChunk.text.label("chunk_text"),
+    NodeTranscriptChunk.error.label("chunk_error"),
+)
+
+
+def _new_transcript_chunks_on(owner_column):
+    return and_(
+        owner_column,
+        NodeTranscriptChunk.chunk_index > bindparam("last_chunk"),
+        NodeTranscriptChunk.status.in_(['completed', 'failed']),
+    )
+
+
+_NODE_TRANSCRIPT_POLL = select(
+    Node.transcription_status,
+    Node.transcription_error,
+    Node.streaming_completed_chunks,
+    Node.streaming_total_chunks,
+    *_TRANSCRIPT_CHUNK_COLUMNS,
+).outerjoin(
+    NodeTranscriptChunk,
+    _new_transcript_chunks_on(NodeTranscriptChunk.node_id == Node.id),
+).where(Node.id == bindparam("entity_id")).order_by(NodeTranscriptChunk.chunk_index)
+
+_DRAFT_TRANSCRIPT_POLL = select(
+    Draft.id,
+    Draft.content_version,
+    Draft.streaming_status,
+    Draft.streaming_completed_chunks,
+    Draft.streaming_total_chunks,
+    *_TRANSCRIPT_CHUNK_COLUMNS,
+).outerjoin(
+    NodeTranscriptChunk,
+    _new_transcript_chunks_on(NodeTranscriptChunk.session_id == Draft.session_id),
+).where(Draft.session_id == bindparam("entity_id")).order_by(NodeTranscriptChunk.chunk_index)
+
+_DRAFT_CONTENT = select(Draft.content_version, Draft.content).where(
+    Draft.id == bindparam("draft_id"))
+
+
+def _tts_poll(entity_cls, chunk_fk_attr):
+    return select(
+        entity_cls.tts_task_status,
+        entity_cls.audio_tts_url,
+        entity_cls.tts_task_progress,
+        TTSChunk.chunk_index.label("chunk_index"),
+        TTSChunk.audio_url,
+        TTSChunk.duration,
+        TTSChunk.section_index,
+        TTSChunk.section_title,
+    ).outerjoin(TTSChunk, and_(
+        getattr(TTSChunk, chunk_fk_attr) == entity_cls.id,
+        TTSChunk.chunk_index > bindparam("last_chunk"),
+        TTSChunk.status == 'completed',
+    )).where(entity_cls.id == bindparam("entity_id")).order_by(TTSChunk.chunk_index)
+
+
+def _tts_counts(chunk_fk_attr):
+    return select(
+        func.count(TTSChunk.id),
+        func.count(case((TTSChunk.status == 'completed', 1))),
+    ).where(getattr(TTSChunk, chunk_fk_attr) == bindparam("entity_id"))
+
+
+# Keyed by the TTSChunk foreign key the stream follows
+_TTS_POLL = {
+    "node_id": _tts_poll(Node, "node_id"),
+    "profile_id": _tts_poll(UserProfile, "profile_id"),
+}
+_TTS_COUNTS = {fk: _tts_counts(fk) for fk in _TTS_POLL}
+
+
+def _joined_chunks(rows):
+    """
+    Pick the chunk rows out of an entity LEFT JOIN chunk result.
+
+    An entity with no new chunks comes back as a single row whose chunk
+    columns are all None.
+    """
+    return [row for row in rows if row.chunk_index is not None]
+
+
+def _transcript_chunk_events(new_chunks):
+    """
+    Yield SSE messages for newly finished transcript chunks, in chunk order.
+
+    Takes rows carrying the ``_TRANSCRIPT_CHUNK_COLUMNS`` labels.
+
+    A run of consecutive completed chunks (e.g. a burst after a network
+    hiccup) is folded into one ``chunks_batch`` event carrying an array, so
+    it costs one JSON encode and one write instead of N. A lone completed
+    chunk still goes out as ``chunk_complete`` for minimum latency. Failed
+    chunks are sent individually as ``chunk_error`` and flush any pending
+    run first, so events always arrive in ``chunk_index`` order.
+    """
+    run = []
+
+    def flush():
+        if len(run) == 1:
+            chunk = run[0]
+            return format_sse_message({
+                "chunk_index": chunk.chunk_index,
+                "text": decrypt_content(chunk.chunk_text),
+                "status": "completed"
+            }, event="chunk_complete")
+        return format_sse_message({
+            "chunks": [{
+                "chunk_index": c.chunk_index,
+                "text": decrypt_content(c.chunk_text),
+                "status": "completed"
+            } for c in run]
+        }, event="chunks_batch")
+
+    for chunk in new_chunks:
+        if chunk.chunk_status == 'completed':
+            run.append(chunk)
+            continue
+        if run:
+            yield flush()
+            run = []
+        yield format_sse_message({
+            "chunk_index": chunk.chunk_index,
+            "error": chunk.chunk_error,
+            "status": "failed"
+        }, event="chunk_error")
+
+    if run:
+        yield flush()
 
 
 @sse_bp.route("/nodes/<int:node_id>/transcription-stream")
@@ -33,6 +232,7 @@ def transcription_stream(node_id):
 
     Sends events as transcript chunks complete:
     - event: chunk_complete - A chunk has been transcribed
+    - event: chunks_batch - Several chunks were transcribed at once
     - event: all_complete - All chunks have been transcribed
     - event: error - An error occurred
     - event: heartbeat - Keep-alive ping
@@ -40,7 +240,7 @@ def transcription_stream(node_id):
     Query params:
     - last_chunk: Index of the last chunk the client has received
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check ownership
     if node.user_id != current_user.id and not getattr(current_user, "is_admin", False):
@@ -62,81 +262,159 @@ def transcription_stream(node_id):
         last_heartbeat = time.time()
         max_idle_time = 600  # 10 minutes max connection time
         start_time = time.time()
+        poll_interval = _next_poll_interval(app, None, False)
 
-        while True:
-            # Check for timeout
-            if time.time() - start_time > max_idle_time:
-                yield format_sse_message({"message": "Connection timeout"}, event="close")
-                break
+        yield format_sse_retry(app)
 
-            # Use app context for database operations (generator runs outside request context)
+        pubsub = sse_notify.subscribe(app.config, sse_notify.transcript_channel(node_id=node_id))
+        try:
+            # One app context for the whole stream instead of a push/pop per
+            # poll; the scoped session is removed explicitly after each poll.
             with app.app_context():
-                # Re-fetch node to get fresh data
-                current_node = Node.query.get(node_id)
-                if not current_node:
-                    yield format_sse_message({"error": "Node not found"}, event="error")
-                    break
-
-                # Get any new completed chunks
-                new_chunks = NodeTranscriptChunk.query.filter(
-                    NodeTranscriptChunk.node_id == node_id,
-                    NodeTranscriptChunk.chunk_index > last_sent_chunk,
-                    NodeTranscriptChunk.status.in_(['completed', 'failed'])
-                ).order_by(NodeTranscriptChunk.chunk_index).all()
+                while True:
+                    # Check for timeout
+                    if time.time() - start_time > max_idle_time:
+                        yield format_sse_message({"message": "Connection timeout"}, event="close")
+                        break
+
+                    # Ownership was checked once up front; per tick we only need
+                    # the status-bearing columns, not a hydrated Node. One LEFT
+                    # JOIN fetches them together with any new finished chunks.
+                    rows = db.session.execute(_NODE_TRANSCRIPT_POLL, {
+                        "entity_id": node_id, "last_chunk": last_sent_chunk,
+                    }).all()
+                    if not rows:
+                        yield format_sse_message({"error": "Node not found"}, event="error")
+                        break
+                    current_node = rows[0]
+                    new_chunks = _joined_chunks(rows)
+
+                    yield from _transcript_chunk_events(new_chunks)
+                    if new_chunks:
+                        last_sent_chunk = new_chunks[-1].chunk_index
+                    poll_interval = _next_poll_interval(
+                        app, poll_interval, bool(new_chunks), pubsub is not None)
+
+                    # Check if transcription is complete (status is 'completed')
+                    if current_node.transcription_status == 'completed':
+                        yield format_sse_message({
+                            "message": "Transcription complete",
+                            "content": db.session.get(Node, node_id).get_content()
+                        }, event="all_complete")
+                        break
 
-                for chunk in new_chunks:
-                    if chunk.status == 'completed':
+                    # Check if transcription failed
+                    if current_node.transcription_status == 'failed':
                         yield format_sse_message({
-                            "chunk_index": chunk.chunk_index,
-                            "text": chunk.get_text(),
-                            "status": "completed"
-                        }, event="chunk_complete")
-                    else:
+                            "message": "Transcription failed",
+                            "error": current_node.transcription_error
+                        }, event="error")
+                        break
+
+                    # Send heartbeat to keep connection alive
+                    if time.time() - last_heartbeat > heartbeat_interval:
                         yield format_sse_message({
-                            "chunk_index": chunk.chunk_index,
-                            "error": chunk.error,
-                            "status": "failed"
-                        }, event="chunk_error")
+                            "timestamp": time.time(),
+                            "completed_chunks": current_node.streaming_completed_chunks or 0,
+                            "total_chunks": current_node.streaming_total_chunks
+                        }, event="heartbeat")
+                        last_heartbeat = time.time()
+
+                    # Release the session (and its pooled DB connection) before
+                    # idling; the next poll checks out a fresh one. A push
+                    # wake-up cuts the wait short as soon as a worker commits.
+                    db.session.remove()
+                    sse_notify.wait_for_update(pubsub, poll_interval)
+        finally:
+            sse_notify.close(pubsub)
 
-                    last_sent_chunk = chunk.chunk_index
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers=SSE_HEADERS
+    )
 
-                # Check if transcription is complete (status is 'completed')
-                if current_node.transcription_status == 'completed':
-                    yield format_sse_message({
-                        "message": "Transcription complete",
-                        "content": current_node.get_content()
-                    }, event="all_complete")
-                    break
 
-                # Check if transcription failed
-                if current_node.transcription_status == 'failed':
-                    yield format_sse_message({
-                        "message": "Transcription failed",
-                        "error": current_node.transcription_error
-                    }, event="error")
-                    break
+def _tts_chunk_payload(chunk):
+    chunk_data = {
+        "chunk_index": chunk.chunk_index,
+        "audio_url": chunk.audio_url,
+        "status": "ready"
+    }
+    if chunk.duration is not None:
+        chunk_data["duration"] = chunk.duration
+    # Chapter metadata (#145)
+    if chunk.section_index is not None:
+        chunk_data["section_index"] = chunk.section_index
+        chunk_data["section_title"] = chunk.section_title
+    return chunk_data
 
-                # Send heartbeat to keep connection alive
-                if time.time() - last_heartbeat > heartbeat_interval:
-                    yield format_sse_message({
-                        "timestamp": time.time(),
-                        "completed_chunks": current_node.streaming_completed_chunks or 0,
-                        "total_chunks": current_node.streaming_total_chunks
-                    }, event="heartbeat")
-                    last_heartbeat = time.time()
 
-            # Sleep briefly before checking again (outside app context)
-            time.sleep(1)
+def _tts_chunk_events(new_chunks):
+    """
+    Yield SSE messages for newly ready TTS chunks.
 
-    return Response(
-        generate(),
-        mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'X-Accel-Buffering': 'no'  # Disable nginx buffering
-        }
-    )
+    Same framing as ``_transcript_chunk_events``: several chunks found in
+    one poll go out as a single ``chunks_batch`` event, a lone chunk as
+    ``chunk_ready``. Only completed TTS chunks are polled, so every run is
+    already in ``chunk_index`` order.
+    """
+    if len(new_chunks) == 1:
+        yield format_sse_message(_tts_chunk_payload(new_chunks[0]), event="chunk_ready")
+    elif new_chunks:
+        yield format_sse_message({
+            "chunks": [_tts_chunk_payload(c) for c in new_chunks]
+        }, event="chunks_batch")
+
+
+# draft_id -> (content_version, plaintext). Process-local on purpose: draft
+# text stays out of Redis, like the Pub/Sub nudges. Bounded FIFO.
+_draft_content_cache = {}
+_DRAFT_CONTENT_CACHE_SIZE = 256
+
+
+def _draft_content(draft_id, min_version):
+    """Decrypted draft content at *min_version* or newer.
+
+    Every stream watching a draft needs the same blob after each version
+    bump; only the first to ask reads and decrypts it.
+    """
+    cached = _draft_content_cache.get(draft_id)
+    if cached and cached[0] >= min_version:
+        return cached[1]
+
+    version, content = db.session.execute(
+        _DRAFT_CONTENT, {"draft_id": draft_id}).one()
+    plaintext = decrypt_content(content)
+
+    _draft_content_cache.pop(draft_id, None)
+    if len(_draft_content_cache) >= _DRAFT_CONTENT_CACHE_SIZE:
+        _draft_content_cache.pop(next(iter(_draft_content_cache)))
+    _draft_content_cache[draft_id] = (version, plaintext)
+    return plaintext
+
+
+# (chunk_fk_attr, entity_id) -> (expires_at, (total, completed)). Shared by
+# every TTS stream in this worker process so N listeners on one entity cost
+# one COUNT query per heartbeat interval, not N.
+_tts_count_cache = {}
+
+
+def _tts_chunk_counts(chunk_fk_attr, entity_id, ttl):
+    """Total and completed TTS chunk counts for a heartbeat, cached for *ttl*."""
+    key = (chunk_fk_attr, entity_id)
+    now = time.time()
+    cached = _tts_count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    counts = tuple(db.session.execute(
+        _TTS_COUNTS[chunk_fk_attr], {"entity_id": entity_id}).one())
+
+    for stale in [k for k, (expires, _) in _tts_count_cache.items() if expires <= now]:
+        _tts_count_cache.pop(stale, None)
+    _tts_count_cache[key] = (now + ttl, counts)
+    return counts
 
 
 def _tts_stream_generator(app, entity_cls, entity_id, chunk_fk_attr,
@@ -161,71 +439,70 @@ def _tts_stream_generator(app, entity_cls, entity_id, chunk_fk_attr,
     last_heartbeat = time.time()
     max_idle_time = 600  # 10 minutes max connection time
     start_time = time.time()
-    chunk_filter = {chunk_fk_attr: entity_id}
+    poll_interval = _next_poll_interval(app, None, False)
 
-    while True:
-        if time.time() - start_time > max_idle_time:
-            yield format_sse_message({"message": "Connection timeout"}, event="close")
-            break
+    yield format_sse_retry(app)
 
+    pubsub = sse_notify.subscribe(app.config, sse_notify.tts_channel(chunk_fk_attr, entity_id))
+    try:
+        # One app context for the whole stream instead of a push/pop per
+        # poll; the scoped session is removed explicitly after each poll.
         with app.app_context():
-            entity = entity_cls.query.get(entity_id)
-            if not entity:
-                yield format_sse_message(
-                    {"error": f"{entity_label} not found"}, event="error"
-                )
-                break
-
-            # Get any new completed TTS chunks
-            new_chunks = TTSChunk.query.filter(
-                getattr(TTSChunk, chunk_fk_attr) == entity_id,
-                TTSChunk.chunk_index > last_sent_chunk,
-                TTSChunk.status == 'completed'
-            ).order_by(TTSChunk.chunk_index).all()
-
-            for chunk in new_chunks:
-                chunk_data = {
-                    "chunk_index": chunk.chunk_index,
-                    "audio_url": chunk.audio_url,
-                    "status": "ready"
-                }
-                if chunk.duration is not None:
-                    chunk_data["duration"] = chunk.duration
-                # Chapter metadata (#145)
-                if chunk.section_index is not None:
-                    chunk_data["section_index"] = chunk.section_index
-                    chunk_data["section_title"] = chunk.section_title
-                yield format_sse_message(chunk_data, event="chunk_ready")
-                last_sent_chunk = chunk.chunk_index
-
-            if entity.tts_task_status == 'completed':
-                yield format_sse_message({
-                    "message": "TTS generation complete",
-                    "tts_url": entity.audio_tts_url
-                }, event="all_complete")
-                break
-
-            if entity.tts_task_status == 'failed':
-                yield format_sse_message({
-                    "message": "TTS generation failed"
-                }, event="error")
-                break
-
-            if time.time() - last_heartbeat > heartbeat_interval:
-                total_chunks = TTSChunk.query.filter_by(**chunk_filter).count()
-                completed_chunks = TTSChunk.query.filter_by(
-                    status='completed', **chunk_filter
-                ).count()
-
-                yield format_sse_message({
-                    "timestamp": time.time(),
-                    "completed_chunks": completed_chunks,
-                    "total_chunks": total_chunks,
-                    "progress": entity.tts_task_progress
-                }, event="heartbeat")
-                last_heartbeat = time.time()
-
-        time.sleep(1)
+            while True:
+                if time.time() - start_time > max_idle_time:
+                    yield format_sse_message({"message": "Connection timeout"}, event="close")
+                    break
+
+                # Entity status and any new completed TTS chunks in one LEFT JOIN
+                rows = db.session.execute(_TTS_POLL[chunk_fk_attr], {
+                    "entity_id": entity_id, "last_chunk": last_sent_chunk,
+                }).all()
+                if not rows:
+                    yield format_sse_message(
+                        {"error": f"{entity_label} not found"}, event="error"
+                    )
+                    break
+                entity = rows[0]
+                new_chunks = _joined_chunks(rows)
+
+                yield from _tts_chunk_events(new_chunks)
+                if new_chunks:
+                    last_sent_chunk = new_chunks[-1].chunk_index
+                poll_interval = _next_poll_interval(
+                    app, poll_interval, bool(new_chunks), pubsub is not None)
+
+                if entity.tts_task_status == 'completed':
+                    yield format_sse_message({
+                        "message": "TTS generation complete",
+                        "tts_url": entity.audio_tts_url
+                    }, event="all_complete")
+                    break
+
+                if entity.tts_task_status == 'failed':
+                    yield format_sse_message({
+                        "message": "TTS generation failed"
+                    }, event="error")
+                    break
+
+                if time.time() - last_heartbeat > heartbeat_interval:
+                    total_chunks, completed_chunks = _tts_chunk_counts(
+                        chunk_fk_attr, entity_id, heartbeat_interval)
+
+                    yield format_sse_message({
+                        "timestamp": time.time(),
+                        "completed_chunks": completed_chunks,
+                        "total_chunks": total_chunks,
+                        "progress": entity.tts_task_progress
+                    }, event="heartbeat")
+                    last_heartbeat = time.time()
+
+                # Release the session (and its pooled DB connection) before
+                # idling; the next poll checks out a fresh one. A push
+                # wake-up cuts the wait short as soon as a worker commits.
+                db.session.remove()
+                sse_notify.wait_for_update(pubsub, poll_interval)
+    finally:
+        sse_notify.close(pubsub)
 
 
 def _tts_stream_response(app, entity_cls, entity_id, chunk_fk_attr,
@@ -237,11 +514,7 @@ def _tts_stream_response(app, entity_cls, entity_id, chunk_fk_attr,
             entity_label, last_chunk
         ),
         mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'X-Accel-Buffering': 'no'
-        }
+        headers=SSE_HEADERS
     )
 
 
@@ -253,6 +526,7 @@ def tts_stream(node_id):
 
     Sends events as TTS audio chunks are generated:
     - event: chunk_ready - An audio chunk is ready to play
+    - event: chunks_batch - Several audio chunks became ready at once
     - event: all_complete - All chunks have been generated
     - event: error - An error occurred
     - event: heartbeat - Keep-alive ping
@@ -260,7 +534,7 @@ def tts_stream(node_id):
     Query params:
     - last_chunk: Index of the last chunk the client has received
     """
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
 
     # Check ownership or voice mode access
     if node.user_id != current_user.id and not getattr(current_user, "is_admin", False):
@@ -289,6 +563,7 @@ def profile_tts_stream(profile_id):
 
     Sends events as TTS audio chunks are generated:
     - event: chunk_ready - An audio chunk is ready to play
+    - event: chunks_batch - Several audio chunks became ready at once
     - event: all_complete - All chunks have been generated
     - event: error - An error occurred
     - event: heartbeat - Keep-alive ping
@@ -296,7 +571,7 @@ def profile_tts_stream(profile_id):
     Query params:
     - last_chunk: Index of the last chunk the client has received
     """
-    profile = UserProfile.query.get_or_404(profile_id)
+    profile = db.get_or_404(UserProfile, profile_id)
 
     if profile.user_id != current_user.id and not getattr(current_user, "is_admin", False):
         return jsonify({"error": "Unauthorized"}), 403
@@ -327,6 +602,7 @@ def draft_transcription_stream(session_id):
 
     Sends events as transcript chunks complete:
     - event: chunk_complete - A chunk has been transcribed
+    - event: chunks_batch - Several chunks were transcribed at once
     - event: all_complete - All chunks have been transcribed
     - event: content_update - Draft content has been updated
     - event: error - An error occurred
@@ -352,106 +628,112 @@ def draft_transcription_stream(session_id):
 
     def generate():
         last_sent_chunk = last_chunk
-        last_content_version = ""
+        last_content_version = 0
+        last_content = ""
         heartbeat_interval = 15  # seconds
         last_heartbeat = time.time()
         # Safety net timeout - connection normally closes when streaming_status becomes
         # 'completed' or 'failed'. This just prevents orphaned connections.
         max_connection_time = 7200  # 2 hours
         start_time = time.time()
+        poll_interval = _next_poll_interval(app, None, False)
 
-        while True:
-            # Check for max connection time (safety net)
-            if time.time() - start_time > max_connection_time:
-                yield format_sse_message({"message": "Connection timeout"}, event="close")
-                break
+        yield format_sse_retry(app)
 
-            # Use app context for database operations (generator runs outside request context)
+        pubsub = sse_notify.subscribe(app.config, sse_notify.transcript_channel(session_id=session_id))
+        try:
+            # One app context for the whole stream instead of a push/pop per
+            # poll; the scoped session is removed explicitly after each poll.
             with app.app_context():
-                # Re-fetch draft to get fresh data
-                current_draft = Draft.query.filter_by(session_id=session_id).first()
-                if not current_draft:
-                    yield format_sse_message({"error": "Draft not found"}, event="error")
-                    break
-
-                # Get any new completed chunks
-                new_chunks = NodeTranscriptChunk.query.filter(
-                    NodeTranscriptChunk.session_id == session_id,
-                    NodeTranscriptChunk.chunk_index > last_sent_chunk,
-                    NodeTranscriptChunk.status.in_(['completed', 'failed'])
-                ).order_by(NodeTranscriptChunk.chunk_index).all()
-
-                for chunk in new_chunks:
-                    if chunk.status == 'completed':
-                        yield format_sse_message({
-                            "chunk_index": chunk.chunk_index,
-                            "text": chunk.get_text(),
-                            "status": "completed"
-                        }, event="chunk_complete")
-                    else:
+                while True:
+                    # Check for max connection time (safety net)
+                    if time.time() - start_time > max_connection_time:
+                        yield format_sse_message({"message": "Connection timeout"}, event="close")
+                        break
+
+                    # Re-fetch draft status and any new finished chunks in one
+                    # LEFT JOIN; the content blob is only read when its
+                    # version advances.
+                    rows = db.session.execute(_DRAFT_TRANSCRIPT_POLL, {
+                        "entity_id": session_id, "last_chunk": last_sent_chunk,
+                    }).all()
+                    if not rows:
+                        yield format_sse_message({"error": "Draft not found"}, event="error")
+                        break
+                    current_draft = rows[0]
+                    new_chunks = _joined_chunks(rows)
+
+                    yield from _transcript_chunk_events(new_chunks)
+                    if new_chunks:
+                        last_sent_chunk = new_chunks[-1].chunk_index
+
+                    # Check if content has been updated
+                    content_changed = False
+                    if current_draft.content_version > last_content_version:
+                        last_content_version = current_draft.content_version
+                        current_content = _draft_content(
+                            current_draft.id, current_draft.content_version)
+                        content_changed = current_content != last_content
+                        if content_changed:
+                            yield format_sse_message({
+                                "content": current_content,
+                                "completed_chunks": current_draft.streaming_completed_chunks or 0
+                            }, event="content_update")
+                            last_content = current_content
+                    poll_interval = _next_poll_interval(
+                        app, poll_interval, bool(new_chunks) or content_changed,
+                        pubsub is not None)
+
+                    # Check if streaming is complete
+                    if current_draft.streaming_status == 'completed':
+                        draft = db.session.get(Draft, current_draft.id)
+                        # Terminal: the row is loaded anyway, free the cache slot
+                        _draft_content_cache.pop(draft.id, None)
+                        complete_data = {
+                            "message": "Transcription complete",
+                            "content": draft.get_content(),
+                            "draft_id": draft.id,
+                        }
+                        if draft.streaming_warning:
+                            # Carry user-facing warning to the frontend so it
+                            # can render a toast even when no LLM follow-up
+                            # was dispatched (e.g. misconfigured placeholder).
+                            complete_data["warning"] = draft.streaming_warning
+                        if draft.llm_node_id:
+                            complete_data["llm_node_id"] = draft.llm_node_id
+                            # Node already exists — draft only lingered for this event.
+                            db.session.delete(draft)
+                            db.session.commit()
+                        yield format_sse_message(complete_data, event="all_complete")
+                        break
+
+                    # Check if streaming failed
+                    if current_draft.streaming_status == 'failed':
                         yield format_sse_message({
-                            "chunk_index": chunk.chunk_index,
-                            "error": chunk.error,
-                            "status": "failed"
-                        }, event="chunk_error")
+                            "message": "Transcription failed"
+                        }, event="error")
+                        break
 
-                    last_sent_chunk = chunk.chunk_index
-
-                # Check if content has been updated
-                current_content = current_draft.get_content()
-                if current_content != last_content_version:
-                    yield format_sse_message({
-                        "content": current_content,
-                        "completed_chunks": current_draft.streaming_completed_chunks or 0
-                    }, event="content_update")
-                    last_content_version = current_content
-
-                # Check if streaming is complete
-                if current_draft.streaming_status == 'completed':
-                    complete_data = {
-                        "message": "Transcription complete",
-                        "content": current_draft.get_content(),
-                        "draft_id": current_draft.id,
-                    }
-                    if current_draft.llm_node_id:
-                        complete_data["llm_node_id"] = current_draft.llm_node_id
-                        # Node already exists — draft only lingered for this event.
-                        db.session.delete(current_draft)
-                        db.session.commit()
-                    if current_draft.streaming_warning:
-                        # Carry user-facing warning to the frontend so it
-                        # can render a toast even when no LLM follow-up
-                        # was dispatched (e.g. misconfigured placeholder).
-                        complete_data["warning"] = current_draft.streaming_warning
-                    yield format_sse_message(complete_data, event="all_complete")
-                    break
-
-                # Check if streaming failed
-                if current_draft.streaming_status == 'failed':
-                    yield format_sse_message({
-                        "message": "Transcription failed"
-                    }, event="error")
-                    break
-
-                # Send heartbeat to keep connection alive
-                if time.time() - last_heartbeat > heartbeat_interval:
-                    yield format_sse_message({
-                        "timestamp": time.time(),
-                        "completed_chunks": current_draft.streaming_completed_chunks or 0,
-                        "total_chunks": current_draft.streaming_total_chunks,
-                        "status": current_draft.streaming_status
-                    }, event="heartbeat")
-                    last_heartbeat = time.time()
-
-            # Sleep briefly before checking again (outside app context)
-            time.sleep(1)
+                    # Send heartbeat to keep connection alive
+                    if time.time() - last_heartbeat > heartbeat_interval:
+                        yield format_sse_message({
+                            "timestamp": time.time(),
+                            "completed_chunks": current_draft.streaming_completed_chunks or 0,
+                            "total_chunks": current_draft.streaming_total_chunks,
+                            "status": current_draft.streaming_status
+                        }, event="heartbeat")
+                        last_heartbeat = time.time()
+
+                    # Release the session (and its pooled DB connection) before
+                    # idling; the next poll checks out a fresh one. A push
+                    # wake-up cuts the wait short as soon as a worker commits.
+                    db.session.remove()
+                    sse_notify.wait_for_update(pubsub, poll_interval)
+        finally:
+            sse_notify.close(pubsub)
 
     return Response(
         generate(),
         mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'X-Accel-Buffering': 'no'  # Disable nginx buffering
-        }
+        headers=SSE_HEADERS
     )
@@ -1,21 +1,11 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 from flask_login import login_required, current_user
-from backend.models import Node, User
+from backend.models import User
 from backend.extensions import db
-from sqlalchemy import func, text
+from backend.utils.stats_rollup import cached_daily_token_series
 
 stats_bp = Blueprint("stats_bp", __name__)
 
-def get_total_tokens(user):
-    tokens = db.session.query(func.sum(Node.distributed_tokens)).filter(
-        Node.user_id == user.id
-    ).scalar()
-    return tokens or 0
-
-def get_global_tokens():
-    tokens = db.session.query(func.sum(Node.distributed_tokens)).scalar()
-    return tokens or 0
-
 # Allow an optional username (if not provided, defaults to current_user)
 @stats_bp.route("/stats", defaults={"username": None}, methods=["GET"])
 @stats_bp.route("/stats/<string:username>", methods=["GET"])
@@ -27,58 +17,23 @@ def get_stats(username):
     else:
         user = current_user
 
-    # PERSONAL SERIES: get the first day the current user posted
-    personal_first_date = db.session.query(func.min(func.date(Node.created_at))).filter(
-        Node.user_id == user.id
-    ).scalar()
-
-    if personal_first_date is None:
-        personal_series = []
-    else:
-        stmt_personal = text("""
-            SELECT gs.day,
-                   COALESCE(s.tokens, 0) as tokens
-            FROM generate_series(CAST(:start_date AS date), CURRENT_DATE, '1 day') AS gs(day)
-            LEFT JOIN (
-                SELECT date(created_at) AS day, SUM(distributed_tokens) AS tokens
-                FROM node
-                WHERE user_id = :user_id
-                GROUP BY day
-            ) s ON gs.day = s.day
-            ORDER BY gs.day
-        """)
-        personal_result = db.session.execute(stmt_personal, {
-            "start_date": personal_first_date,
-            "user_id": user.id
-        }).fetchall()
-        personal_series = [{"date": row.day.strftime("%Y-%m-%d"), "tokens": int(row.tokens)} for row in personal_result]
-
-    # GLOBAL SERIES: get the very first post date among all users.
-    global_first_date = db.session.query(func.min(func.date(Node.created_at))).scalar()
-
-    if global_first_date is None:
-        global_series = []
-    else:
-        stmt_global = text("""
-            SELECT gs.day,
-                   COALESCE(s.tokens, 0) as tokens
-            FROM generate_series(CAST(:start_date AS date), CURRENT_DATE, '1 day') AS gs(day)
-            LEFT JOIN (
-                SELECT date(created_at) AS day, SUM(distributed_tokens) AS tokens
-                FROM node
-                GROUP BY day
-            ) s ON gs.day = s.day
-            ORDER BY gs.day
-        """)
-        global_result = db.session.execute(stmt_global, {
-            "start_date": global_first_date
-        }).fetchall()
-        global_series = [{"date": row.day.strftime("%Y-%m-%d"), "tokens": int(row.tokens)} for row in global_result]
+    # Completed days come from the DailyNodeTokens rollup; only today's
+    # nodes are summed live, and both series are briefly memoized in Redis
+    # (see backend/utils/stats_rollup.py).
+    config = current_app.config
+    personal_series = cached_daily_token_series(config, user.id)
+    global_series = cached_daily_token_series(config)
 
     result = {
        "personal": personal_series,
        "global": global_series,
-       "personal_total": get_total_tokens(user),
-       "global_total": get_global_tokens(),
+       # The series cover every day from the first post on, so their sums
+       # are the totals — no extra full-table SUMs.
+       "personal_total": sum(point["tokens"] for point in personal_series),
+       "global_total": sum(point["tokens"] for point in global_series),
     }
-    return jsonify(result), 200
+    response = jsonify(result)
+    max_age = config.get("STATS_CACHE_SECONDS", 0)
+    if max_age:
+        response.headers["Cache-Control"] = f"private, max-age={max_age}"
+    return response, 200
@@ -1,10 +1,11 @@
 import logging
 from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
+from sqlalchemy import update
 from backend.extensions import db
-from backend.utils.email import send_admin_signup_notification
+from backend.models import User
+from backend.utils.sql_time import sql_utcnow
 from backend.utils.timefmt import iso_utc
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -16,20 +17,30 @@ CURRENT_TERMS_VERSION = "2.0"
 @terms_bp.route("/accept", methods=["POST"])
 @login_required
 def accept_terms():
-    current_user.accepted_terms_at = datetime.utcnow()
-    current_user.accepted_terms_version = CURRENT_TERMS_VERSION
+    # Stamp with the DB clock and read the committed value straight back
+    accepted_at = db.session.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(accepted_terms_at=sql_utcnow(),
+                accepted_terms_version=CURRENT_TERMS_VERSION)
+        .returning(User.accepted_terms_at)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
     db.session.commit()
 
     if not current_user.approved:
+        # Sent by the worker (with retries) so SMTP latency never holds
+        # up the response; only a broker outage is logged here.
+        from backend.tasks.notifications import send_admin_signup_notification_task
         try:
-            send_admin_signup_notification(
+            send_admin_signup_notification_task.delay(
                 current_user.username, current_user.email
             )
         except Exception:
-            logger.exception("Failed to send admin signup notification")
+            logger.exception("Failed to enqueue admin signup notification")
 
     return jsonify({
         "message": "Terms accepted",
-        "accepted_terms_at": iso_utc(current_user.accepted_terms_at),
-        "accepted_terms_version": current_user.accepted_terms_version
+        "accepted_terms_at": iso_utc(accepted_at),
+        "accepted_terms_version": CURRENT_TERMS_VERSION
     }), 200
@@ -193,11 +193,11 @@ def add_message(conversation_id):
     if not parent_id:
         return jsonify({"error": "parent_id is required"}), 400
 
-    system_node = Node.query.get_or_404(conversation_id)
+    system_node = db.get_or_404(Node, conversation_id)
     if system_node.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
-    last_node = Node.query.get(parent_id)
+    last_node = db.session.get(Node, parent_id)
     if not last_node or last_node.human_owner_id != current_user.id:
         return jsonify({"error": "Invalid parent_id"}), 400
 
@@ -221,7 +221,7 @@ def add_message(conversation_id):
         if ancestor.id == system_node.id:
             is_descendant = True
             break
-        ancestor = Node.query.get(ancestor.parent_id) if ancestor.parent_id else None
+        ancestor = db.session.get(Node, ancestor.parent_id) if ancestor.parent_id else None
     if not is_descendant:
         return jsonify({"error": "parent_id does not belong to this conversation"}), 400
 
@@ -264,7 +264,7 @@ def get_conversation_from_node(node_id):
     """Walk UP from node_id to collect the ancestor chain, then return it
     in chronological order. The root (system node) is excluded from messages
     but returned as conversation_id so the frontend can append new messages."""
-    node = Node.query.get_or_404(node_id)
+    node = db.get_or_404(Node, node_id)
     if node.human_owner_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
@@ -281,7 +281,7 @@ def get_conversation_from_node(node_id):
         chain.append(current)
         if current.parent_id is None:
             break
-        current = Node.query.get(current.parent_id)
+        current = db.session.get(Node, current.parent_id)
 
     if not chain:
         return jsonify({"error": "Unable to resolve conversation chain"}), 404
@@ -1,40 +1,95 @@
+import functools
 import json
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, abort, jsonify, request, current_app
 from flask_login import login_required, current_user
 from backend.models import Node, Draft, UserTodo
 from backend.extensions import db
+from sqlalchemy import func, insert, literal, literal_column, select, update
+from sqlalchemy.orm import aliased
+from backend.utils.encryption import decrypt_content, encrypt_content
 from backend.utils.timefmt import iso_utc
 from backend.utils.tool_meta import update_tool_meta
 
 todo_bp = Blueprint("todo", __name__)
 
+# created_at never changes after insert, and the versions list re-serializes
+# the same timestamps on every open of the history view.
+_iso = functools.lru_cache(maxsize=4096)(iso_utc)
+
+
+# The todo endpoints serialize straight to JSON, so they read plain column
+# rows rather than hydrating UserTodo instances into the identity map.
+_TODO_COLUMNS = (
+    UserTodo.id,
+    UserTodo.user_id,
+    UserTodo.content,
+    UserTodo.generated_by,
+    UserTodo.tokens_used,
+    UserTodo.created_at,
+    UserTodo.privacy_level,
+    UserTodo.ai_usage,
+)
+
+
+def _todo_with_version_count(user_id, todo_id=None):
+    """Fetch a todo version (default: the latest) and the user's total
+    version count in one round-trip.
+
+    Returns a row of ``_TODO_COLUMNS`` plus ``version_count``, or None when
+    there is no such version. The count rides along as an uncorrelated
+    scalar subquery, so it stays the full per-user count even when
+    filtering to one id.
+    """
+    version_count = select(func.count(UserTodo.id)).where(
+        UserTodo.user_id == user_id
+    ).correlate(None).scalar_subquery()
+
+    stmt = select(*_TODO_COLUMNS, version_count.label("version_count")).where(
+        UserTodo.user_id == user_id
+    )
+    if todo_id is not None:
+        stmt = stmt.where(UserTodo.id == todo_id)
+    else:
+        stmt = stmt.order_by(UserTodo.created_at.desc())
+    return db.session.execute(stmt.limit(1)).first()
+
+
+def _returning_version_count(user_id):
+    """RETURNING expression for the version number of the row being inserted.
+
+    Counts the user's *other* versions and adds one. Excluding the new row
+    by id keeps the result the same whether the backend's RETURNING
+    subquery sees the new row (SQLite) or not (Postgres). The outer id is
+    spelled out qualified because SQLite's compiler would otherwise render
+    it bare, and a bare ``id`` binds to the inner alias.
+    """
+    other = aliased(UserTodo)
+    prior = select(func.count(other.id)).where(
+        other.user_id == user_id,
+        other.id != literal_column(f"{UserTodo.__tablename__}.id"),
+    ).scalar_subquery()
+    return (prior + 1).label("version_count")
+
 
 @todo_bp.route("/", methods=["GET"])
 @login_required
 def get_todo():
     """Get the latest todo version for the current user."""
-    todo = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).order_by(UserTodo.created_at.desc()).first()
+    todo = _todo_with_version_count(current_user.id)
 
     if not todo:
         return jsonify({"todo": None}), 200
 
-    # Count total versions for version number
-    version_count = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).count()
-
     return jsonify({
         "todo": {
             "id": todo.id,
-            "content": todo.get_content(),
+            "content": decrypt_content(todo.content),
             "generated_by": todo.generated_by,
             "tokens_used": todo.tokens_used,
-            "created_at": iso_utc(todo.created_at),
+            "created_at": _iso(todo.created_at),
             "privacy_level": todo.privacy_level,
             "ai_usage": todo.ai_usage,
-            "version_number": version_count,
+            "version_number": todo.version_count,
         }
     }), 200
 
@@ -51,28 +106,27 @@ def patch_todo():
     if not content.strip():
         return jsonify({"error": "Content cannot be empty"}), 400
 
-    todo = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).order_by(UserTodo.created_at.desc()).first()
+    todo = _todo_with_version_count(current_user.id)
 
     if not todo:
         return jsonify({"error": "No todo exists to update"}), 404
 
-    todo.set_content(content)
+    db.session.execute(
+        update(UserTodo)
+        .where(UserTodo.id == todo.id)
+        .values(content=encrypt_content(content))
+    )
     db.session.commit()
 
-    version_count = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).count()
-
+    # An in-place edit changes neither the metadata nor the version count
     return jsonify({
         "todo": {
             "id": todo.id,
-            "content": todo.get_content(),
+            "content": content,
             "generated_by": todo.generated_by,
             "tokens_used": todo.tokens_used,
-            "created_at": iso_utc(todo.created_at),
-            "version_number": version_count,
+            "created_at": _iso(todo.created_at),
+            "version_number": todo.version_count,
         }
     }), 200
 
@@ -90,30 +144,30 @@ def update_todo():
     if not content.strip():
         return jsonify({"error": "Content cannot be empty"}), 400
 
-    todo = UserTodo(
-        user_id=current_user.id,
-        generated_by=generated_by,
-        tokens_used=data.get("tokens_used", 0),
-        # ai_usage follows the user's global default, not a hardcoded
-        # 'chat' (#191); live-gated out of prompts if the user opts out.
-        ai_usage=current_user.default_ai_usage,
-    )
-    todo.set_content(content)
-    db.session.add(todo)
+    tokens_used = data.get("tokens_used", 0)
+    # One round-trip: the INSERT hands back the new id, its created_at
+    # and the version number, so nothing is re-read after commit.
+    todo = db.session.execute(
+        insert(UserTodo).values(
+            user_id=current_user.id,
+            content=encrypt_content(content),
+            generated_by=generated_by,
+            tokens_used=tokens_used,
+            # ai_usage follows the user's global default, not a hardcoded
+            # 'chat' (#191); live-gated out of prompts if the user opts out.
+            ai_usage=current_user.default_ai_usage,
+        ).returning(UserTodo.id, UserTodo.created_at, _returning_version_count(current_user.id))
+    ).one()
     db.session.commit()
 
-    version_count = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).count()
-
     return jsonify({
         "todo": {
             "id": todo.id,
-            "content": todo.get_content(),
-            "generated_by": todo.generated_by,
-            "tokens_used": todo.tokens_used,
-            "created_at": iso_utc(todo.created_at),
-            "version_number": version_count,
+            "content": content,
+            "generated_by": generated_by,
+            "tokens_used": tokens_used,
+            "created_at": _iso(todo.created_at),
+            "version_number": todo.version_count,
         }
     }), 200
 
@@ -122,9 +176,18 @@ def update_todo():
 @login_required
 def get_todo_versions():
     """List all todo versions for the current user."""
-    todos = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).order_by(UserTodo.created_at.desc()).all()
+    # Metadata columns only: the (encrypted) content of every historical
+    # version is never sent here, so it is never fetched either.
+    todos = db.session.execute(
+        select(
+            UserTodo.id,
+            UserTodo.generated_by,
+            UserTodo.tokens_used,
+            UserTodo.created_at,
+        ).where(
+            UserTodo.user_id == current_user.id
+        ).order_by(UserTodo.created_at.desc())
+    ).all()
 
     versions = []
     total = len(todos)
@@ -133,7 +196,7 @@ def get_todo_versions():
             "id": todo.id,
             "generated_by": todo.generated_by,
             "tokens_used": todo.tokens_used,
-            "created_at": iso_utc(todo.created_at),
+            "created_at": _iso(todo.created_at),
             "version_number": total - i,
         })
 
@@ -144,7 +207,11 @@ def get_todo_versions():
 @login_required
 def get_todo_version(version_id):
     """Get a specific todo version's content."""
-    todo = UserTodo.query.get_or_404(version_id)
+    todo = db.session.execute(
+        select(*_TODO_COLUMNS).where(UserTodo.id == version_id)
+    ).first()
+    if todo is None:
+        abort(404)
 
     if todo.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -152,10 +219,10 @@ def get_todo_version(version_id):
     return jsonify({
         "todo": {
             "id": todo.id,
-            "content": todo.get_content(),
+            "content": decrypt_content(todo.content),
             "generated_by": todo.generated_by,
             "tokens_used": todo.tokens_used,
-            "created_at": iso_utc(todo.created_at),
+            "created_at": _iso(todo.created_at),
         }
     }), 200
 
@@ -164,41 +231,51 @@ def get_todo_version(version_id):
 @login_required
 def revert_todo(version_id):
     """Create a new todo version from a historical one."""
-    old_todo = UserTodo.query.get_or_404(version_id)
-
-    if old_todo.user_id != current_user.id:
+    # Copy the version inside the database: the encrypted content is not
+    # round-tripped through the app, and the user_id guard means another
+    # user's version simply inserts nothing. A revert reproduces a prior
+    # version, so its ai_usage is copied too (#191).
+    copy = select(
+        UserTodo.user_id,
+        UserTodo.content,
+        literal("revert"),
+        literal(0),
+        UserTodo.ai_usage,
+    ).where(UserTodo.id == version_id, UserTodo.user_id == current_user.id)
+    new_todo = db.session.execute(
+        insert(UserTodo).from_select(
+            ["user_id", "content", "generated_by", "tokens_used", "ai_usage"],
+            copy,
+        ).returning(
+            UserTodo.id,
+            UserTodo.content,
+            UserTodo.generated_by,
+            UserTodo.created_at,
+            _returning_version_count(current_user.id),
+        )
+    ).first()
+
+    if new_todo is None:
+        # Nothing copied: tell a missing version apart from a foreign one
+        if db.session.get(UserTodo, version_id) is None:
+            abort(404)
         return jsonify({"error": "Unauthorized"}), 403
-
-    new_todo = UserTodo(
-        user_id=current_user.id,
-        generated_by="revert",
-        tokens_used=0,
-        # A revert reproduces a prior version, so copy its ai_usage (#191).
-        ai_usage=old_todo.ai_usage,
-    )
-    # Copy the encrypted content directly
-    new_todo.content = old_todo.content
-    db.session.add(new_todo)
     db.session.commit()
 
-    version_count = UserTodo.query.filter_by(
-        user_id=current_user.id
-    ).count()
-
     return jsonify({
         "todo": {
             "id": new_todo.id,
-            "content": new_todo.get_content(),
+            "content": decrypt_content(new_todo.content),
             "generated_by": new_todo.generated_by,
-            "created_at": iso_utc(new_todo.created_at),
-            "version_number": version_count,
+            "created_at": _iso(new_todo.created_at),
+            "version_number": new_todo.version_count,
         }
     }), 200
 
 
 def _find_pending_todo_draft(llm_node_id, user_id):
     """Find the todo_pending draft by walking ancestor chain from llm_node_id."""
-    llm_node = Node.query.get(llm_node_id)
+    llm_node = db.session.get(Node, llm_node_id)
     if not llm_node:
         return None, None
 
@@ -167,7 +167,7 @@ def mark_notification(notification_id, action):
 # ---------------------------------------------------------------------------
 
 def _get_active_poll(poll_id):
-    poll = Poll.query.get_or_404(poll_id)
+    poll = db.get_or_404(Poll, poll_id)
     if poll.closed_at is not None:
         return None
     return poll
@@ -187,7 +187,7 @@ def _get_or_create_response(poll):
 def get_poll(poll_id):
     """Poll + the user's own response state (polled while a draft is being
     generated)."""
-    poll = Poll.query.get_or_404(poll_id)
+    poll = db.get_or_404(Poll, poll_id)
     resp = PollResponse.query.filter_by(
         poll_id=poll.id, user_id=current_user.id).first()
     return jsonify({
@@ -283,7 +283,7 @@ def send_response(poll_id):
 @login_required
 def decline_poll(poll_id):
     """'No thanks' — permanently dismisses the poll for this user."""
-    poll = Poll.query.get_or_404(poll_id)
+    poll = db.get_or_404(Poll, poll_id)
     resp = _get_or_create_response(poll)
     if resp.status == "sent":
         return jsonify({"error": "Already sent."}), 409
@@ -26,7 +26,7 @@ AGENTIC_PROMPT_KEYS = ('voice', 'textmode')
 @login_required
 def create_voice_from_node(node_id):
     """Start or resume a voice session from an existing node's thread."""
-    node = Node.query.get(node_id)
+    node = db.session.get(Node, node_id)
     if not node:
         return jsonify({"error": "Node not found"}), 404
     if node.human_owner_id != current_user.id:
@@ -138,7 +138,7 @@ def create_voice_session():
 
     parent_node = None
     if parent_id:
-        parent_node = Node.query.get(parent_id)
+        parent_node = db.session.get(Node, parent_id)
         if not parent_node:
             return jsonify({"error": "Parent node not found"}), 404
         if parent_node.human_owner_id != current_user.id:
@@ -52,7 +52,7 @@ def _resolve_new_artifact_id(pin, legacy_to_new):
     new_id = legacy_to_new.get(pin.artifact_id)
     if new_id is not None:
         return new_id
-    legacy = UserAIPreferences.query.get(pin.artifact_id)
+    legacy = db.session.get(UserAIPreferences, pin.artifact_id)
     if legacy is None:
         return None
     art = UserArtifact.query.filter_by(
@@ -464,7 +464,7 @@ def collect_batches(app, batch_ids, model_override):
                       f"skipping")
                 continue
             uid = int(m.group(1))
-            user = User.query.get(uid)
+            user = db.session.get(User, uid)
             if not user:
                 print(f"  ! batch {batch_id}: user {uid} not found, skipping")
                 continue
@@ -528,7 +528,7 @@ def main():
               + (" [DRY RUN]" if args.dry_run else ""))
         users = []
         for uid in user_ids:
-            user = User.query.get(uid)
+            user = db.session.get(User, uid)
             if not user:
                 print(f"  ! user {uid} not found, skipping")
                 continue
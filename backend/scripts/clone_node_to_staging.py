@@ -142,7 +142,7 @@ with app.app_context():
     user_ids = []
     for raw in payload["users"]:
         row = deser_row(raw)
-        u = User.query.get(row["id"])
+        u = db.session.get(User, row["id"])
         if u is None:
             u = User(**row)
             db.session.add(u)
@@ -236,7 +236,7 @@ with app.app_context():
     # Mint a magic-link login URL for each cloned user
     login_urls = []
     for uid in user_ids:
-        u = User.query.get(uid)
+        u = db.session.get(User, uid)
         # Use email if set, else fabricate a placeholder so the token verifies
         email = u.email or f"clone-{u.id}@local"
         if not u.email:
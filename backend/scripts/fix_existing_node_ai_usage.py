@@ -22,53 +22,45 @@ from backend.models import Node
 from sqlalchemy import text
 
 
-def fix_existing_nodes():
-    """Update existing nodes to have ai_usage='train'."""
-    app = create_app()
+_STATE_SQL = (
+    "SELECT privacy_level, ai_usage, COUNT(*) AS count FROM node "
+    "GROUP BY privacy_level, ai_usage"
+)
 
-    with app.app_context():
-        # Check current state
-        result = db.session.execute(
-            text("SELECT privacy_level, ai_usage, COUNT(*) as count FROM node GROUP BY privacy_level, ai_usage")
-        )
 
-        print("Current node privacy settings:")
-        print("-" * 50)
-        for row in result:
-            print(f"  privacy_level={row.privacy_level}, ai_usage={row.ai_usage}: {row.count} nodes")
-        print()
+def _print_state(title):
+    """Print the privacy_level/ai_usage breakdown (a handful of plain tuples)."""
+    rows = db.session.connection().exec_driver_sql(_STATE_SQL).fetchall()
+    print(title)
+    print("-" * 50)
+    for privacy_level, ai_usage, count in rows:
+        print(f"  privacy_level={privacy_level}, ai_usage={ai_usage}: {count} nodes")
+    print()
 
-        # Count nodes that need updating
-        nodes_to_update = db.session.execute(
-            text("SELECT COUNT(*) FROM node WHERE ai_usage = 'none'")
-        ).scalar()
 
-        if nodes_to_update == 0:
-            print("✓ All nodes already have appropriate ai_usage settings!")
-            return
+def fix_existing_nodes():
+    """Update existing nodes to have ai_usage='train'."""
+    app = create_app()
 
-        print(f"Found {nodes_to_update} nodes with ai_usage='none'")
-        print("Updating to ai_usage='train' (maintains training data value proposition)...")
+    with app.app_context():
+        _print_state("Current node privacy settings:")
 
-        # Update all nodes with ai_usage='none' to 'train'
+        # The UPDATE's rowcount doubles as the "how many needed fixing"
+        # count, so no separate COUNT(*) round-trip is needed first.
+        print("Updating ai_usage='none' to 'train' (maintains training data value proposition)...")
         result = db.session.execute(
             text("UPDATE node SET ai_usage = 'train' WHERE ai_usage = 'none'")
         )
         db.session.commit()
 
+        if result.rowcount == 0:
+            print("✓ All nodes already have appropriate ai_usage settings!")
+            return
+
         print(f"✓ Successfully updated {result.rowcount} nodes")
         print()
 
-        # Show updated state
-        result = db.session.execute(
-            text("SELECT privacy_level, ai_usage, COUNT(*) as count FROM node GROUP BY privacy_level, ai_usage")
-        )
-
-        print("Updated node privacy settings:")
-        print("-" * 50)
-        for row in result:
-            print(f"  privacy_level={row.privacy_level}, ai_usage={row.ai_usage}: {row.count} nodes")
-        print()
+        _print_state("Updated node privacy settings:")
         print("✓ Migration complete!")
 
 
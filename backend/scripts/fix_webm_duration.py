@@ -11,20 +11,28 @@ metadata in their headers. This script:
 Usage:
     python fix_webm_duration.py /path/to/chunks/directory
     python fix_webm_duration.py /path/to/chunks/directory --all  # Fix all chunks, not just last
+    python fix_webm_duration.py /path/to/chunks/directory --all --jobs 1  # ...one at a time
     python fix_webm_duration.py /path/to/specific/chunk.webm     # Fix a single file
 
+Probe results persist across runs in ~/.cache/writeorperish/ (keyed by path,
+mtime and size, so a changed file is always re-probed); --no-disk-cache
+skips it.
+
 Requirements:
     - ffmpeg must be installed and available in PATH
 """
 
 import argparse
+import atexit
 import glob
 import os
-import shutil
+import shelve
 import struct
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # =============================================================================
@@ -36,54 +44,44 @@ SEGMENT_ID = b'\x18\x53\x80\x67'
 INFO_ID = b'\x15\x49\xa9\x66'
 DURATION_ID = b'\x44\x89'
 TIMECODE_SCALE_ID = b'\x2a\xd7\xb1'
+CLUSTER_ID = b'\x1f\x43\xb6\x75'
+CLUSTER_TIMECODE_ID = b'\xe7'
+SIMPLE_BLOCK_ID = b'\xa3'
+
+# Enough to cover _find_info_element's 100 KB search window
+HEADER_READ_BYTES = 128 * 1024
+# How far back from EOF to look for the last Cluster
+TAIL_READ_BYTES = 1024 * 1024
+# Allowed gap between the header Duration and the cluster timestamps; the
+# last block's own length (an Opus frame is 20-60 ms) is not timestamped.
+DURATION_TOLERANCE_SECONDS = 0.25
 
 
 def _read_vint(data, pos):
     if pos >= len(data):
         return None, pos
     first_byte = data[pos]
-    if first_byte & 0x80:
-        length, value = 1, first_byte & 0x7f
-    elif first_byte & 0x40:
-        length, value = 2, first_byte & 0x3f
-    elif first_byte & 0x20:
-        length, value = 3, first_byte & 0x1f
-    elif first_byte & 0x10:
-        length, value = 4, first_byte & 0x0f
-    elif first_byte & 0x08:
-        length, value = 5, first_byte & 0x07
-    elif first_byte & 0x04:
-        length, value = 6, first_byte & 0x03
-    elif first_byte & 0x02:
-        length, value = 7, first_byte & 0x01
-    elif first_byte & 0x01:
-        length, value = 8, 0
-    else:
+    # The count of leading zero bits gives the extra bytes; the marker bit
+    # is masked off and the rest is one big-endian integer.
+    length = 9 - first_byte.bit_length()
+    if length > 8:
         return None, pos
-    for i in range(1, length):
-        if pos + i >= len(data):
-            return None, pos
-        value = (value << 8) | data[pos + i]
+    if pos + length > len(data):
+        return None, pos
+    value = ((first_byte & (0xff >> length)) << ((length - 1) * 8)) | int.from_bytes(
+        data[pos + 1:pos + length], 'big')
     return value, pos + length
 
 
 def _read_element_id(data, pos):
     if pos >= len(data):
         return None, pos
-    first_byte = data[pos]
-    if first_byte & 0x80:
-        length = 1
-    elif first_byte & 0x40:
-        length = 2
-    elif first_byte & 0x20:
-        length = 3
-    elif first_byte & 0x10:
-        length = 4
-    else:
+    length = 9 - data[pos].bit_length()
+    if length > 4:
         return None, pos
     if pos + length > len(data):
         return None, pos
-    return data[pos:pos + length], pos + length
+    return bytes(data[pos:pos + length]), pos + length
 
 
 def _find_info_element(data):
@@ -120,6 +118,7 @@ def _find_duration_in_info(data, info_start, info_size):
     timecode_scale = 1000000
     duration_pos = None
     duration_size = None
+    timecode_scale_seen = False
     while pos < end:
         elem_id, pos = _read_element_id(data, pos)
         if elem_id is None:
@@ -128,12 +127,15 @@ def _find_duration_in_info(data, info_start, info_size):
         if elem_size is None:
             break
         if elem_id == TIMECODE_SCALE_ID:
-            timecode_scale = 0
-            for i in range(elem_size):
-                timecode_scale = (timecode_scale << 8) | data[pos + i]
+            timecode_scale = int.from_bytes(data[pos:pos + elem_size], 'big')
+            timecode_scale_seen = True
         if elem_id == DURATION_ID:
             duration_pos = pos
             duration_size = elem_size
+        # Both usually lead the Info element; the rest (MuxingApp,
+        # WritingApp, ...) is irrelevant here
+        if duration_pos is not None and timecode_scale_seen:
+            break
         pos += elem_size
     return duration_pos, duration_size, timecode_scale
 
@@ -141,8 +143,10 @@ def _find_duration_in_info(data, info_start, info_size):
 def set_ebml_duration(filepath, duration_seconds):
     """Directly set the Duration metadata in a WebM file's EBML structure."""
     try:
+        # The Info element sits in the first few KB; _find_info_element
+        # never scans past ~100 KB, so the rest of the file is never read.
         with open(filepath, 'rb') as f:
-            data = bytearray(f.read())
+            data = f.read(HEADER_READ_BYTES)
         info_start, info_size = _find_info_element(data)
         if info_start is None:
             print(f"  Warning: Could not find Info element in {filepath}")
@@ -162,9 +166,13 @@ def set_ebml_duration(filepath, duration_seconds):
         else:
             print(f"  Warning: Unexpected duration size: {duration_size}")
             return False
-        data[duration_pos:duration_pos + duration_size] = new_duration_bytes
-        with open(filepath, 'wb') as f:
-            f.write(data)
+        # Overwrite just the Duration slot in place
+        fd = os.open(filepath, os.O_WRONLY)
+        try:
+            os.pwrite(fd, new_duration_bytes, duration_pos)
+        finally:
+            os.close(fd)
+        _forget(filepath)
         # Ensure file is readable by web server (644 = rw-r--r--)
         os.chmod(filepath, 0o644)
         return True
@@ -173,52 +181,265 @@ def set_ebml_duration(filepath, duration_seconds):
         return False
 
 
+def _parse_cluster(data, pos):
+    """Return (cluster timecode, first and last SimpleBlock offsets) for the
+    Cluster at *pos*, or None if *pos* does not hold a well-formed one.
+
+    MediaRecorder writes each Cluster's Timecode first, so requiring it
+    right after the header rejects stray ID bytes inside audio payloads.
+    """
+    elem_id, pos = _read_element_id(data, pos)
+    if elem_id != CLUSTER_ID:
+        return None
+    size, pos = _read_vint(data, pos)
+    if size is None:
+        return None
+    end = min(pos + size, len(data))
+    elem_id, pos = _read_element_id(data, pos)
+    if elem_id != CLUSTER_TIMECODE_ID:
+        return None
+    size, pos = _read_vint(data, pos)
+    if size is None or not 1 <= size <= 8 or pos + size > len(data):
+        return None
+    cluster_timecode = int.from_bytes(data[pos:pos + size], 'big')
+    pos += size
+    first = last = None
+    while pos < end:
+        elem_id, child_pos = _read_element_id(data, pos)
+        if elem_id is None or elem_id == CLUSTER_ID:
+            break
+        size, child_pos = _read_vint(data, child_pos)
+        if size is None or child_pos + size > len(data):
+            break
+        if elem_id == SIMPLE_BLOCK_ID:
+            # Body: track number (vint), then a signed 16-bit offset
+            _, offset_pos = _read_vint(data, child_pos)
+            if offset_pos + 2 <= child_pos + size:
+                offset = struct.unpack_from('>h', data, offset_pos)[0]
+                first = offset if first is None else first
+                last = offset
+        pos = child_pos + size
+    if first is None:
+        return None
+    return cluster_timecode, first, last
+
+
+def _cluster_timestamp_span(filepath, head, timecode_scale):
+    """Seconds from the first to the last block timestamp, or None."""
+    start = head.find(CLUSTER_ID)
+    first_cluster = _parse_cluster(head, start) if start >= 0 else None
+    if first_cluster is None:
+        return None
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as f:
+        f.seek(max(0, size - TAIL_READ_BYTES))
+        tail = f.read()
+    pos = len(tail)
+    while True:
+        pos = tail.rfind(CLUSTER_ID, 0, pos)
+        if pos < 0:
+            return None
+        last_cluster = _parse_cluster(tail, pos)
+        if last_cluster is not None:
+            break
+    first_timecode = first_cluster[0] + first_cluster[1]
+    last_timecode = last_cluster[0] + last_cluster[2]
+    return (last_timecode - first_timecode) * timecode_scale / 1e9
+
+
+def ebml_duration_check(filepath):
+    """Compare the header Duration with the cluster timestamps.
+
+    Reads only the file's head and tail, so a fixed (or never broken) file
+    is recognised without running ffmpeg. Returns True if they agree,
+    False if they disagree or the header Duration is missing/unparseable,
+    and None if the Duration is present but the cluster span could not be
+    computed (so there is nothing to check it against).
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            head = f.read(HEADER_READ_BYTES)
+        info_start, info_size = _find_info_element(head)
+        if info_start is None:
+            return False
+        duration_pos, duration_size, timecode_scale = _find_duration_in_info(
+            head, info_start, info_size
+        )
+        if duration_pos is None or duration_pos + duration_size > len(head):
+            return False
+        if duration_size == 8:
+            duration = struct.unpack_from('>d', head, duration_pos)[0]
+        elif duration_size == 4:
+            duration = struct.unpack_from('>f', head, duration_pos)[0]
+        else:
+            return False
+        duration_seconds = duration * timecode_scale / 1e9
+        if not duration_seconds > 0:
+            return False
+        span = _cluster_timestamp_span(filepath, head, timecode_scale)
+    except (OSError, struct.error):
+        return False
+    if span is None:
+        return None
+    return abs(duration_seconds - span) <= DURATION_TOLERANCE_SECONDS
+
+
+def ebml_duration_is_valid(filepath):
+    """True if the header Duration already matches the cluster timestamps.
+
+    Anything unparseable counts as not valid, leaving the decision to the
+    full ffmpeg path.
+    """
+    return ebml_duration_check(filepath) is True
+
+
 # =============================================================================
 # FFprobe helpers
 # =============================================================================
 
-def get_webm_duration(filepath):
-    """Get the duration of a WebM file using ffprobe. Returns None if unavailable."""
+# Probe results keyed by (abspath, st_mtime_ns, st_size). A rewrite
+# changes mtime (and usually size), so a stale entry can never be hit;
+# _forget() additionally drops a path's entries right after this script
+# rewrites it, in case the filesystem's mtime granularity is coarse.
+_probe_cache = {}
+_probe_cache_lock = threading.Lock()
+
+# The same keys persist in a shelve so re-runs over an unchanged directory
+# skip ffprobe entirely. Opened on first use under _probe_cache_lock (the
+# dbm backends are not thread-safe); False once found unusable or disabled.
+DISK_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'writeorperish', 'webm_durations')
+_disk_cache = None
+
+# ffprobe/ffmpeg are separate processes, so threads overlap their latency
+# (the GIL is released while waiting on them); a process pool would add
+# nothing but pickling. Default for --jobs.
+MAX_WORKERS = 8
+
+
+def _run(argv, timeout):
+    """subprocess.run with captured text output, launched via posix_spawn.
+
+    close_fds=False lets CPython use posix_spawn instead of fork+exec plus
+    a sweep closing every inherited fd, which dominates the cost of the
+    many short ffprobe runs. Nothing leaks: Python creates its fds (the
+    capture pipes included) non-inheritable.
+    """
+    return subprocess.run(argv, capture_output=True, text=True,
+                          timeout=timeout, close_fds=False)
+
+
+def _file_key(filepath):
+    st = os.stat(filepath)
+    return (os.path.realpath(filepath), st.st_mtime_ns, st.st_size)
+
+
+def _disk():
+    """The on-disk probe cache, or None. Call with _probe_cache_lock held."""
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            os.makedirs(os.path.dirname(DISK_CACHE_PATH), exist_ok=True)
+            _disk_cache = shelve.open(DISK_CACHE_PATH)
+            atexit.register(_disk_cache.close)
+        except Exception:
+            _disk_cache = False
+    # (An empty Shelf is falsy, hence the identity checks)
+    return None if _disk_cache is False else _disk_cache
+
+
+def disable_disk_cache():
+    """Keep this run's probes in memory only (--no-disk-cache)."""
+    global _disk_cache
+    with _probe_cache_lock:
+        if _disk_cache not in (None, False):
+            _disk_cache.close()
+        _disk_cache = False
+
+
+def _store(key, metadata):
+    """Record *metadata* in both caches. Call with _probe_cache_lock held."""
+    _probe_cache[key] = metadata
+    disk = _disk()
+    if disk is not None:
+        try:
+            disk[repr(key)] = metadata
+        except Exception:
+            pass
+
+
+def _remember(filepath, metadata):
+    with _probe_cache_lock:
+        _store(_file_key(filepath), metadata)
+
+
+def _forget(filepath):
+    path = os.path.realpath(filepath)
+    with _probe_cache_lock:
+        for key in [k for k in _probe_cache if k[0] == path]:
+            del _probe_cache[key]
+
+
+def _parse_float(value_str):
+    if not value_str or value_str == 'N/A':
+        return None
+    return float(value_str)
+
+
+def get_webm_metadata(filepath):
+    """Return (duration, start_time) from one ffprobe call, memoized per file version.
+
+    Either value is None if unavailable.
+    """
     try:
-        result = subprocess.run(
+        key = _file_key(filepath)
+    except OSError:
+        return None, None
+    with _probe_cache_lock:
+        if key in _probe_cache:
+            return _probe_cache[key]
+        disk = _disk()
+        if disk is not None:
+            try:
+                metadata = disk.get(repr(key))
+            except Exception:
+                metadata = None
+            if metadata is not None:
+                _probe_cache[key] = metadata
+                return metadata
+
+    try:
+        result = _run(
             [
                 'ffprobe', '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'csv=p=0',
+                '-show_entries', 'format=duration,start_time',
+                '-of', 'default=nw=1:nk=0',
                 filepath
             ],
-            capture_output=True,
-            text=True,
             timeout=30
         )
-        duration_str = result.stdout.strip()
-        if duration_str and duration_str != 'N/A':
-            return float(duration_str)
-        return None
+        fields = dict(
+            line.split('=', 1) for line in result.stdout.splitlines() if '=' in line
+        )
+        metadata = (_parse_float(fields.get('duration')),
+                    _parse_float(fields.get('start_time')))
     except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        return None
+        return None, None
+
+    with _probe_cache_lock:
+        _store(key, metadata)
+    return metadata
+
+
+def get_webm_duration(filepath):
+    """Get the duration of a WebM file using ffprobe. Returns None if unavailable."""
+    return get_webm_metadata(filepath)[0]
 
 
 def get_webm_start_time(filepath):
     """Get the start_time of a WebM file using ffprobe."""
-    try:
-        result = subprocess.run(
-            [
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=start_time',
-                '-of', 'csv=p=0',
-                filepath
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        start_str = result.stdout.strip()
-        if start_str and start_str != 'N/A':
-            return float(start_str)
-        return None
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        return None
+    return get_webm_metadata(filepath)[1]
 
 
 # =============================================================================
@@ -242,7 +463,19 @@ def fix_webm_duration(filepath, dry_run=False):
     if not filepath.endswith('.webm'):
         return False, f"Not a WebM file: {filepath}", None, None
 
-    old_duration = get_webm_duration(filepath)
+    old_duration, old_start_time = get_webm_metadata(filepath)
+
+    # Re-runs are common (and the default mode only ever touches the last
+    # chunk); a header that already agrees with the clusters needs no remux.
+    duration_check = ebml_duration_check(filepath)
+    if duration_check:
+        return True, f"Already valid: {filepath}", old_duration, old_duration
+
+    # Without a cluster span to check against, a stream that starts at 0
+    # and already reports a duration is taken as correct. A Duration that
+    # was checked and found off (duration_check False) still gets the remux.
+    if duration_check is None and not old_start_time and old_duration:
+        return True, f"Already correct: {filepath}", old_duration, old_duration
 
     if dry_run:
         if old_duration is None:
@@ -250,12 +483,17 @@ def fix_webm_duration(filepath, dry_run=False):
         else:
             return True, f"Would fix: {filepath} (current duration: {old_duration:.2f}s)", old_duration, None
 
-    fd, temp_path = tempfile.mkstemp(suffix='.webm')
+    # Remux next to the source so the final move is a same-filesystem
+    # rename rather than a copy out of /tmp; the dot prefix keeps it out
+    # of chunk_*.webm globs while it exists.
+    fd, temp_path = tempfile.mkstemp(
+        suffix='.webm', prefix='.fixdur-',
+        dir=os.path.dirname(os.path.abspath(filepath)))
     os.close(fd)
 
     try:
         # Step 1: Remux with ffmpeg
-        result = subprocess.run(
+        result = _run(
             [
                 'ffmpeg', '-y',
                 '-copyts',
@@ -263,21 +501,16 @@ def fix_webm_duration(filepath, dry_run=False):
                 '-c', 'copy',
                 temp_path
             ],
-            capture_output=True,
-            text=True,
             timeout=120
         )
 
         if result.returncode != 0:
-            os.unlink(temp_path)
             return False, f"ffmpeg failed: {result.stderr}", old_duration, None
 
         # Step 2: Get (wrong) duration and start_time
-        ffmpeg_duration = get_webm_duration(temp_path)
-        start_time = get_webm_start_time(temp_path)
+        ffmpeg_duration, start_time = get_webm_metadata(temp_path)
 
         if ffmpeg_duration is None:
-            os.unlink(temp_path)
             return False, "Remuxed file still has no duration", old_duration, None
 
         # Step 3: Calculate actual duration
@@ -286,29 +519,37 @@ def fix_webm_duration(filepath, dry_run=False):
         else:
             actual_duration = ffmpeg_duration
 
-        # Step 4: Replace original with remuxed file
-        shutil.move(temp_path, filepath)
+        # Step 4: Replace original with remuxed file (atomic rename)
+        os.replace(temp_path, filepath)
+        _forget(temp_path)
+        _forget(filepath)
 
         # Ensure file is readable by web server (644 = rw-r--r--)
         os.chmod(filepath, 0o644)
 
         # Step 5: Set correct EBML duration if needed
         if start_time is not None and start_time > 0:
-            set_ebml_duration(filepath, actual_duration)
+            edited = set_ebml_duration(filepath, actual_duration)
+            final_duration = actual_duration if edited else ffmpeg_duration
+        else:
+            final_duration = ffmpeg_duration
 
-        # Verify final duration
-        final_duration = get_webm_duration(filepath)
+        # The header now holds final_duration; record it instead of
+        # spawning another ffprobe to read back what was just written.
+        _remember(filepath, (final_duration, start_time))
 
         return True, f"Fixed: {filepath}", old_duration, final_duration
 
     except subprocess.TimeoutExpired:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
         return False, "ffmpeg timed out", old_duration, None
     except Exception as e:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
         return False, f"Error: {str(e)}", old_duration, None
+    finally:
+        # Gone already once os.replace has moved it into place
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
 
 
 def find_chunk_files(directory):
@@ -318,7 +559,31 @@ def find_chunk_files(directory):
     return sorted(files)
 
 
-def fix_directory(directory, fix_all=False, dry_run=False):
+def _probe_durations(chunks, jobs=MAX_WORKERS):
+    """ffprobe durations for *chunks*, in order, probed concurrently."""
+    if jobs <= 1:
+        return [get_webm_duration(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        return list(pool.map(get_webm_duration, chunks))
+
+
+def _fix_files(files, jobs=MAX_WORKERS):
+    """Yield (filepath, fix_webm_duration result) as each fix completes.
+
+    A single file (the default last-chunk mode) or ``jobs=1`` fixes files
+    inline, in order; otherwise the ffmpeg remuxes run concurrently.
+    """
+    if len(files) == 1 or jobs <= 1:
+        for filepath in files:
+            yield filepath, fix_webm_duration(filepath)
+        return
+    with ThreadPoolExecutor(max_workers=min(jobs, len(files))) as pool:
+        futures = {pool.submit(fix_webm_duration, f): f for f in files}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def fix_directory(directory, fix_all=False, dry_run=False, jobs=MAX_WORKERS):
     """
     Fix WebM duration for chunks in a directory.
 
@@ -326,6 +591,7 @@ def fix_directory(directory, fix_all=False, dry_run=False):
         directory: Path to directory containing chunk files
         fix_all: If True, fix all chunks. If False, only fix the last chunk.
         dry_run: If True, only report what would be done
+        jobs: Concurrent ffprobe/ffmpeg runs (1 = sequential, for debugging)
     """
     if not os.path.isdir(directory):
         print(f"Error: Not a directory: {directory}")
@@ -348,8 +614,8 @@ def fix_directory(directory, fix_all=False, dry_run=False):
 
     # Check current status
     print("\nCurrent duration status:")
-    for chunk in chunks:
-        duration = get_webm_duration(chunk)
+    durations = dict(zip(chunks, _probe_durations(chunks, jobs)))
+    for chunk, duration in durations.items():
         status = f"{duration:.2f}s" if duration else "N/A"
         marker = " <- will fix" if chunk in files_to_fix else ""
         print(f"  {os.path.basename(chunk)}: {status}{marker}")
@@ -361,23 +627,22 @@ def fix_directory(directory, fix_all=False, dry_run=False):
     # Fix the files
     print("\nFixing files...")
     success_count = 0
-    for filepath in files_to_fix:
-        success, message, old_dur, new_dur = fix_webm_duration(filepath)
-
+    for filepath, (success, message, old_dur, new_dur) in _fix_files(files_to_fix, jobs):
         if success:
             old_str = f"{old_dur:.2f}s" if old_dur else "N/A"
             new_str = f"{new_dur:.2f}s" if new_dur else "N/A"
             print(f"  {os.path.basename(filepath)}: {old_str} -> {new_str}")
+            durations[filepath] = new_dur
             success_count += 1
         else:
             print(f"  {os.path.basename(filepath)}: FAILED - {message}")
 
     print(f"\nFixed {success_count}/{len(files_to_fix)} file(s)")
 
-    # Show final status
+    # Show final status: a failed fix leaves its file untouched, so only
+    # the fixed chunks changed and their new durations are already known
     print("\nFinal duration status:")
-    for chunk in chunks:
-        duration = get_webm_duration(chunk)
+    for chunk, duration in durations.items():
         status = f"{duration:.2f}s" if duration else "N/A"
         print(f"  {os.path.basename(chunk)}: {status}")
 
@@ -402,12 +667,25 @@ def main():
         action='store_true',
         help='Show what would be done without making changes'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=MAX_WORKERS,
+        help=f'Concurrent ffprobe/ffmpeg runs (default: {MAX_WORKERS}; 1 = sequential)'
+    )
+    parser.add_argument(
+        '--no-disk-cache',
+        action='store_true',
+        help='Probe every file afresh instead of reusing results from earlier runs'
+    )
 
     args = parser.parse_args()
+    if args.no_disk_cache:
+        disable_disk_cache()
 
     # Check if ffmpeg is available
     try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, timeout=5)
+        _run(['ffmpeg', '-version'], timeout=5)
     except FileNotFoundError:
         print("Error: ffmpeg not found. Please install ffmpeg.")
         sys.exit(1)
@@ -432,7 +710,8 @@ def main():
             sys.exit(1)
     elif os.path.isdir(path):
         # Directory mode
-        success = fix_directory(path, fix_all=args.all, dry_run=args.dry_run)
+        success = fix_directory(path, fix_all=args.all, dry_run=args.dry_run,
+                                jobs=args.jobs)
         if not success:
             sys.exit(1)
     else:
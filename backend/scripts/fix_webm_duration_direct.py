@@ -25,6 +25,29 @@ INFO_ID = b'\x15\x49\xa9\x66'
 DURATION_ID = b'\x44\x89'
 TIMECODE_SCALE_ID = b'\x2a\xd7\xb1'
 
+# read_element_id returns IDs as ints (marker bit kept), so element
+# matching is an integer compare rather than a bytes-slice compare
+EBML_ID_INT = int.from_bytes(EBML_ID, 'big')
+SEGMENT_ID_INT = int.from_bytes(SEGMENT_ID, 'big')
+INFO_ID_INT = int.from_bytes(INFO_ID, 'big')
+DURATION_ID_INT = int.from_bytes(DURATION_ID, 'big')
+TIMECODE_SCALE_ID_INT = int.from_bytes(TIMECODE_SCALE_ID, 'big')
+
+# Duration is an EBML float: 8-byte double or 4-byte single
+_F64 = struct.Struct('>d')
+_F32 = struct.Struct('>f')
+# SeekID element header (ID + 1-byte size 4): a SeekHead entry pointing at
+# Info carries the Info ID bytes as its payload.
+SEEK_ID_HEADER = b'\x53\xab\x84'
+
+# Covers find_info_element's 100KB search window plus the Info element
+HEADER_READ_BYTES = 200_000
+
+
+# (length, marker mask) for each possible first byte of a VINT: the count
+# of leading zero bits gives the extra bytes. 0x00 (a 9+ byte VINT) is invalid.
+_VINT_TABLE = [None] + [(9 - b.bit_length(), 0xff >> (9 - b.bit_length())) for b in range(1, 256)]
+
 
 def read_vint(data, pos):
     """Read a variable-length integer (VINT) from EBML data."""
@@ -32,65 +55,34 @@ def read_vint(data, pos):
         return None, pos
 
     first_byte = data[pos]
-
-    # Determine length from leading zeros
-    if first_byte & 0x80:  # 1 byte
-        length = 1
-        value = first_byte & 0x7f
-    elif first_byte & 0x40:  # 2 bytes
-        length = 2
-        value = first_byte & 0x3f
-    elif first_byte & 0x20:  # 3 bytes
-        length = 3
-        value = first_byte & 0x1f
-    elif first_byte & 0x10:  # 4 bytes
-        length = 4
-        value = first_byte & 0x0f
-    elif first_byte & 0x08:  # 5 bytes
-        length = 5
-        value = first_byte & 0x07
-    elif first_byte & 0x04:  # 6 bytes
-        length = 6
-        value = first_byte & 0x03
-    elif first_byte & 0x02:  # 7 bytes
-        length = 7
-        value = first_byte & 0x01
-    elif first_byte & 0x01:  # 8 bytes
-        length = 8
-        value = 0
-    else:
+    entry = _VINT_TABLE[first_byte]
+    if entry is None:
+        return None, pos
+    length, mask = entry
+    if pos + length > len(data):
         return None, pos
 
-    for i in range(1, length):
-        if pos + i >= len(data):
-            return None, pos
-        value = (value << 8) | data[pos + i]
-
+    # Strip the length marker, then take the remaining bytes in one go
+    value = ((first_byte & mask) << ((length - 1) * 8)) | int.from_bytes(
+        data[pos + 1:pos + length], 'big')
     return value, pos + length
 
 
 def read_element_id(data, pos):
-    """Read an EBML element ID."""
+    """Read an EBML element ID, returned as an int with its marker bit."""
     if pos >= len(data):
         return None, pos
 
-    first_byte = data[pos]
-
-    if first_byte & 0x80:  # 1 byte ID
-        length = 1
-    elif first_byte & 0x40:  # 2 byte ID
-        length = 2
-    elif first_byte & 0x20:  # 3 byte ID
-        length = 3
-    elif first_byte & 0x10:  # 4 byte ID
-        length = 4
-    else:
+    entry = _VINT_TABLE[data[pos]]
+    # IDs are at most 4 bytes and keep their marker bit
+    if entry is None or entry[0] > 4:
         return None, pos
+    length = entry[0]
 
     if pos + length > len(data):
         return None, pos
 
-    return data[pos:pos + length], pos + length
+    return int.from_bytes(data[pos:pos + length], 'big'), pos + length
 
 
 def find_duration_in_info(data, info_start, info_size):
@@ -100,6 +92,7 @@ def find_duration_in_info(data, info_start, info_size):
     timecode_scale = 1000000  # Default: 1ms
     duration_pos = None
     duration_size = None
+    timecode_scale_seen = False
 
     while pos < end:
         elem_id, pos = read_element_id(data, pos)
@@ -110,28 +103,49 @@ def find_duration_in_info(data, info_start, info_size):
         if elem_size is None:
             break
 
-        if elem_id == TIMECODE_SCALE_ID:
+        if elem_id == TIMECODE_SCALE_ID_INT:
             # Read timecode scale value
-            timecode_scale = 0
-            for i in range(elem_size):
-                timecode_scale = (timecode_scale << 8) | data[pos + i]
+            timecode_scale = int.from_bytes(data[pos:pos + elem_size], 'big')
+            timecode_scale_seen = True
 
-        if elem_id == DURATION_ID:
+        if elem_id == DURATION_ID_INT:
             duration_pos = pos
             duration_size = elem_size
 
+        # Both usually lead the Info element; the rest (MuxingApp,
+        # WritingApp, ...) is irrelevant here
+        if duration_pos is not None and timecode_scale_seen:
+            break
+
         pos += elem_size
 
     return duration_pos, duration_size, timecode_scale
 
 
+def _children_fill(data, start, size):
+    """True if [start, start + size) parses as whole child elements."""
+    end = start + size
+    if end > len(data):
+        return False
+    pos = start
+    while pos < end:
+        elem_id, pos = read_element_id(data, pos)
+        if elem_id is None:
+            return False
+        elem_size, pos = read_vint(data, pos)
+        if elem_size is None:
+            return False
+        pos += elem_size
+    return pos == end
+
+
 def find_info_element(data):
     """Find the Info element in the WebM file."""
     pos = 0
 
     # Skip EBML header
     elem_id, pos = read_element_id(data, pos)
-    if elem_id != EBML_ID:
+    if elem_id != EBML_ID_INT:
         return None, None
 
     elem_size, pos = read_vint(data, pos)
@@ -139,7 +153,7 @@ def find_info_element(data):
 
     # Find Segment
     elem_id, pos = read_element_id(data, pos)
-    if elem_id != SEGMENT_ID:
+    if elem_id != SEGMENT_ID_INT:
         return None, None
 
     segment_size, pos = read_vint(data, pos)
@@ -149,6 +163,17 @@ def find_info_element(data):
     # (Segment can have unknown size, so we search until we find Info)
     search_limit = min(pos + 100000, len(data))  # Search first 100KB
 
+    # Fast path: jump straight to the Info ID with a C-level find and
+    # accept the hit only if it looks like a real element.
+    idx = data.find(INFO_ID, segment_start, search_limit)
+    while idx >= 0:
+        if data[max(0, idx - len(SEEK_ID_HEADER)):idx] != SEEK_ID_HEADER:
+            info_size, info_start = read_vint(data, idx + len(INFO_ID))
+            if info_size is not None and _children_fill(data, info_start, info_size):
+                return info_start, info_size
+        idx = data.find(INFO_ID, idx + 1, search_limit)
+
+    # Fallback: walk the Segment's children one element at a time
     while pos < search_limit:
         elem_id, new_pos = read_element_id(data, pos)
         if elem_id is None:
@@ -158,7 +183,7 @@ def find_info_element(data):
         if elem_size is None:
             break
 
-        if elem_id == INFO_ID:
+        if elem_id == INFO_ID_INT:
             return new_pos, elem_size
 
         # Skip this element and continue searching
@@ -174,7 +199,7 @@ def find_info_element(data):
 
 def encode_float64(value):
     """Encode a float as 8-byte big-endian IEEE 754."""
-    return struct.pack('>d', value)
+    return _F64.pack(value)
 
 
 def fix_webm_duration(input_path, new_duration_seconds, output_path=None):
@@ -189,9 +214,10 @@ def fix_webm_duration(input_path, new_duration_seconds, output_path=None):
     if output_path is None:
         output_path = input_path
 
-    # Read the file
+    # Read just the header region: find_info_element never searches past
+    # ~100KB, so the media data after it is never loaded.
     with open(input_path, 'rb') as f:
-        data = bytearray(f.read())
+        data = f.read(HEADER_READ_BYTES)
 
     # Find Info element
     info_start, info_size = find_info_element(data)
@@ -206,7 +232,7 @@ def fix_webm_duration(input_path, new_duration_seconds, output_path=None):
         data, info_start, info_size
     )
 
-    if duration_pos is None:
+    if duration_pos is None or duration_pos + duration_size > len(data):
         print("Error: Could not find Duration element in Info")
         return False
 
@@ -215,9 +241,9 @@ def fix_webm_duration(input_path, new_duration_seconds, output_path=None):
 
     # Read current duration
     if duration_size == 8:
-        current_duration = struct.unpack('>d', bytes(data[duration_pos:duration_pos + 8]))[0]
+        current_duration = _F64.unpack_from(data, duration_pos)[0]
     elif duration_size == 4:
-        current_duration = struct.unpack('>f', bytes(data[duration_pos:duration_pos + 4]))[0]
+        current_duration = _F32.unpack_from(data, duration_pos)[0]
     else:
         print(f"Error: Unexpected duration size: {duration_size}")
         return False
@@ -236,26 +262,25 @@ def fix_webm_duration(input_path, new_duration_seconds, output_path=None):
 
     # Encode new duration
     if duration_size == 8:
-        new_duration_bytes = struct.pack('>d', new_duration_value)
+        new_duration_bytes = _F64.pack(new_duration_value)
     else:
-        new_duration_bytes = struct.pack('>f', new_duration_value)
-
-    # Replace duration in data
-    data[duration_pos:duration_pos + duration_size] = new_duration_bytes
+        new_duration_bytes = _F32.pack(new_duration_value)
 
-    # Write output
     if output_path != input_path:
-        # Write to new file
-        with open(output_path, 'wb') as f:
-            f.write(data)
+        # Patch a copy
+        shutil.copyfile(input_path, output_path)
     else:
-        # Backup and overwrite
+        # Backup, then patch in place. The backup has to be a real copy:
+        # a hardlink would share the inode and receive the patch too.
         backup_path = input_path + '.bak'
         shutil.copy(input_path, backup_path)
-        with open(input_path, 'wb') as f:
-            f.write(data)
         print(f"Backup saved to: {backup_path}")
 
+    # Overwrite just the Duration bytes; the rest of the file is untouched
+    with open(output_path, 'r+b') as f:
+        f.seek(duration_pos)
+        f.write(new_duration_bytes)
+
     print(f"Duration updated successfully in: {output_path}")
     return True
 
@@ -19,13 +19,15 @@ SPIKE_INDICES = [3, 4, 5, 6]
 MAIN_W_BASE = 3.0 * S * 2.5
 SPIKE_W_BASE = 4.5 * S * 2.5
 
-def draw_round_line(draw, p1, p2, width, color):
-    draw.line([p1, p2], fill=color, width=int(width))
+def draw_round_polyline(draw, points, width, color):
+    # One C-level polyline with rounded joints; only the two open ends
+    # still need round caps drawn by hand.
+    draw.line(points, fill=color, width=int(width), joint='curve')
     r = width / 2
-    draw.ellipse([p1[0]-r, p1[1]-r, p1[0]+r, p1[1]+r], fill=color)
-    draw.ellipse([p2[0]-r, p2[1]-r, p2[0]+r, p2[1]+r], fill=color)
+    for x, y in (points[0], points[-1]):
+        draw.ellipse([x-r, y-r, x+r, y+r], fill=color)
 
-def generate_logo(size, output_path):
+def generate_logo(size):
     ss = 4
     ss_size = size * ss
     f = ss_size / 512.0
@@ -36,23 +38,17 @@ def generate_logo(size, output_path):
 
     img = Image.new('RGBA', (ss_size, ss_size), BG_COLOR + (255,))
     draw = ImageDraw.Draw(img)
-    for i in range(len(points) - 1):
-        draw_round_line(draw, points[i], points[i+1], main_w, ACCENT)
+    draw_round_polyline(draw, points, main_w, ACCENT)
 
     overlay = Image.new('RGBA', (ss_size, ss_size), (0, 0, 0, 0))
     od = ImageDraw.Draw(overlay)
-    for i in range(len(SPIKE_INDICES) - 1):
-        p1 = points[SPIKE_INDICES[i]]
-        p2 = points[SPIKE_INDICES[i+1]]
-        draw_round_line(od, p1, p2, spike_w, ACCENT_DIM)
+    draw_round_polyline(od, [points[i] for i in SPIKE_INDICES], spike_w, ACCENT_DIM)
 
     img = Image.alpha_composite(img, overlay)
     img = img.resize((size, size), Image.LANCZOS)
 
     final = Image.new('RGB', (size, size), BG_COLOR)
     final.paste(img, mask=img.split()[3])
-    final.save(output_path, 'PNG')
-    print(f"  ok {output_path} ({size}x{size})")
     return final
 
 output_dir = '/home/claude/icons'
@@ -66,29 +62,39 @@ sizes = {
     512: 'android-chrome-512x512.png',
 }
 
+# Draw (4x supersampled) once at the largest size; every smaller icon is a
+# single LANCZOS downscale of that master.
+master_size = max(sizes)
+master = generate_logo(master_size)
+
 images = {}
 for size, name in sizes.items():
-    images[size] = generate_logo(size, os.path.join(output_dir, name))
+    img = master if size == master_size else master.resize((size, size), Image.LANCZOS)
+    output_path = os.path.join(output_dir, name)
+    img.save(output_path, 'PNG')
+    print(f"  ok {output_path} ({size}x{size})")
+    images[size] = img
 
 images[32].save(os.path.join(output_dir, 'favicon.ico'), format='ICO', sizes=[(16,16),(32,32)])
 print("  ok favicon.ico")
 
-svg_pts = " ".join(f"{'M' if i==0 else 'L'} {x:.1f},{y:.1f}" for i,(x,y) in enumerate(ECG_POINTS))
-spike_pts = " ".join(f"{'M' if i==0 else 'L'} {ECG_POINTS[SPIKE_INDICES[i]][0]:.1f},{ECG_POINTS[SPIKE_INDICES[i]][1]:.1f}" for i in range(len(SPIKE_INDICES)))
-
-with open(os.path.join(output_dir, 'loore-logo.svg'), 'w') as f:
-    f.write(f'''<svg width="512" height="512" viewBox="0 0 512 512" fill="none" xmlns="http://www.w3.org/2000/svg">
-  <rect width="512" height="512" fill="#211f1b"/>
-  <path d="{svg_pts}" stroke="#c4956a" stroke-width="27" stroke-linecap="round" stroke-linejoin="round"/>
-  <path d="{spike_pts}" stroke="#c4956a" stroke-width="41" stroke-linecap="round" stroke-linejoin="round" opacity="0.55"/>
-</svg>''')
-print("  ok loore-logo.svg")
-
-with open(os.path.join(output_dir, 'loore-logo-transparent.svg'), 'w') as f:
-    f.write(f'''<svg width="512" height="512" viewBox="0 0 512 512" fill="none" xmlns="http://www.w3.org/2000/svg">
-  <path d="{svg_pts}" stroke="#c4956a" stroke-width="27" stroke-linecap="round" stroke-linejoin="round"/>
-  <path d="{spike_pts}" stroke="#c4956a" stroke-width="41" stroke-linecap="round" stroke-linejoin="round" opacity="0.55"/>
-</svg>''')
-print("  ok loore-logo-transparent.svg")
+svg_pts = "M " + " L ".join(f"{x:.1f},{y:.1f}" for x, y in ECG_POINTS)
+spike_pts = "M " + " L ".join(
+    f"{ECG_POINTS[i][0]:.1f},{ECG_POINTS[i][1]:.1f}" for i in SPIKE_INDICES)
+
+# Both SVG variants share the geometry; only the background rect differs
+SVG_TEMPLATE = '''<svg width="512" height="512" viewBox="0 0 512 512" fill="none" xmlns="http://www.w3.org/2000/svg">
+{bg}  <path d="{main}" stroke="#c4956a" stroke-width="27" stroke-linecap="round" stroke-linejoin="round"/>
+  <path d="{spike}" stroke="#c4956a" stroke-width="41" stroke-linecap="round" stroke-linejoin="round" opacity="0.55"/>
+</svg>'''
+
+svg_variants = {
+    'loore-logo.svg': '  <rect width="512" height="512" fill="#211f1b"/>\n',
+    'loore-logo-transparent.svg': '',
+}
+for name, bg in svg_variants.items():
+    with open(os.path.join(output_dir, name), 'w') as f:
+        f.write(SVG_TEMPLATE.format(bg=bg, main=svg_pts, spike=spike_pts))
+    print(f"  ok {name}")
 
 print("\nDone!")
@@ -20,6 +20,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from backend.app import create_app
 from backend.extensions import db
 from backend.models import Node
+from sqlalchemy import update
 from backend.utils.privacy import PrivacyLevel, AIUsage
 
 
@@ -28,32 +29,23 @@ def migrate_existing_nodes():
     app = create_app()
 
     with app.app_context():
-        # Find nodes that don't have privacy settings yet
-        # (In practice, this will be all existing nodes after adding the columns)
-        nodes_to_update = Node.query.all()
+        # Every node becomes private (only the owner can see it), with
+        # ai_usage='train' to maintain the original value proposition where
+        # users contribute training data. One UPDATE runs server-side
+        # instead of loading and flushing each row through the ORM.
+        result = db.session.execute(
+            update(Node).values(
+                privacy_level=PrivacyLevel.PRIVATE.value,
+                ai_usage=AIUsage.TRAIN.value,
+            )
+        )
+        db.session.commit()
 
-        if not nodes_to_update:
+        if result.rowcount == 0:
             print("No nodes found to migrate.")
             return
 
-        print(f"Found {len(nodes_to_update)} nodes to migrate")
-
-        updated_count = 0
-        for node in nodes_to_update:
-            # Set privacy level to private (only owner can see)
-            # Set AI usage to 'train' for existing nodes to maintain the
-            # original value proposition where users contribute training data
-            node.privacy_level = PrivacyLevel.PRIVATE
-            node.ai_usage = AIUsage.TRAIN
-            updated_count += 1
-
-            if updated_count % 100 == 0:
-                print(f"Updated {updated_count} nodes...")
-                db.session.commit()
-
-        # Final commit
-        db.session.commit()
-        print(f"Successfully migrated {updated_count} nodes")
+        print(f"Successfully migrated {result.rowcount} nodes")
         print(f"  privacy_level: {PrivacyLevel.PRIVATE}")
         print(f"  ai_usage: {AIUsage.TRAIN}")
 
@@ -20,6 +20,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from backend.app import create_app
 from backend.extensions import db
 from backend.models import UserProfile
+from sqlalchemy import update
 from backend.utils.privacy import PrivacyLevel, AIUsage
 
 
@@ -28,31 +29,23 @@ def migrate_existing_profiles():
     app = create_app()
 
     with app.app_context():
-        # Find profiles that don't have privacy settings yet
-        profiles_to_update = UserProfile.query.all()
+        # Every profile becomes private (only the owner can see it), with
+        # ai_usage='chat' so AI can use it to understand the user when
+        # generating responses. One UPDATE runs server-side instead of
+        # loading and flushing each row through the ORM.
+        result = db.session.execute(
+            update(UserProfile).values(
+                privacy_level=PrivacyLevel.PRIVATE.value,
+                ai_usage=AIUsage.CHAT.value,
+            )
+        )
+        db.session.commit()
 
-        if not profiles_to_update:
+        if result.rowcount == 0:
             print("No profiles found to migrate.")
             return
 
-        print(f"Found {len(profiles_to_update)} profiles to migrate")
-
-        updated_count = 0
-        for profile in profiles_to_update:
-            # Set privacy level to private (only owner can see)
-            # Set AI usage to 'chat' for existing profiles so AI can use them
-            # to understand the user when generating responses
-            profile.privacy_level = PrivacyLevel.PRIVATE
-            profile.ai_usage = AIUsage.CHAT
-            updated_count += 1
-
-            if updated_count % 100 == 0:
-                print(f"Updated {updated_count} profiles...")
-                db.session.commit()
-
-        # Final commit
-        db.session.commit()
-        print(f"Successfully migrated {updated_count} profiles")
+        print(f"Successfully migrated {result.rowcount} profiles")
         print(f"  privacy_level: {PrivacyLevel.PRIVATE}")
         print(f"  ai_usage: {AIUsage.CHAT}")
 
@@ -31,22 +31,19 @@ def migrate_users_to_alpha():
             print(f"  {row.plan}: {row.count} users")
         print()
 
-        # Count users to update
-        free_count = db.session.execute(
-            text("SELECT COUNT(*) FROM \"user\" WHERE plan = 'free'")
-        ).scalar()
-
-        if free_count == 0:
-            print("No free-plan users to migrate.")
-            return
-
-        print(f"Migrating {free_count} users from 'free' to 'alpha'...")
+        # The UPDATE's rowcount says whether there was anything to migrate,
+        # so no separate COUNT(*) over "user" is needed first.
+        print("Migrating users from 'free' to 'alpha'...")
 
         result = db.session.execute(
             text("UPDATE \"user\" SET plan = 'alpha' WHERE plan = 'free'")
         )
         db.session.commit()
 
+        if result.rowcount == 0:
+            print("No free-plan users to migrate.")
+            return
+
         print(f"Updated {result.rowcount} users.")
         print()
 
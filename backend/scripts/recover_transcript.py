@@ -36,12 +36,18 @@ else:
     # Check filesystem for audio chunks
     audio_dir = AUDIO_STORAGE_ROOT / "drafts" / str(draft.user_id) / str(draft.session_id)
     print(f"=== Filesystem: {audio_dir} ===")
+    # One directory pass yields names, sizes (DirEntry caches the stat)
+    # and, below, the on-disk chunk indices
+    audio_files = []
     if audio_dir.exists():
-        files = sorted(audio_dir.glob("chunk_*.webm"))
-        print(f"Found {len(files)} audio file(s):")
-        for f in files:
-            size_kb = f.stat().st_size / 1024
-            print(f"  {f.name}: {size_kb:.1f} KB")
+        with os.scandir(audio_dir) as it:
+            audio_files = sorted(
+                (e.name, e.stat().st_size) for e in it
+                if e.name.startswith("chunk_") and e.name.endswith(".webm")
+            )
+        print(f"Found {len(audio_files)} audio file(s):")
+        for name, size in audio_files:
+            print(f"  {name}: {size / 1024:.1f} KB")
     else:
         print(f"Directory does not exist!")
         # Check if there are any recent files in the drafts audio folder
@@ -70,10 +76,7 @@ else:
     # Check for orphaned chunks (in DB but missing audio file)
     # and missing chunks (audio file exists but no DB record)
     if audio_dir.exists():
-        fs_indices = set()
-        for f in audio_dir.glob("chunk_*.webm"):
-            idx = int(f.name.replace("chunk_", "").replace(".webm", ""))
-            fs_indices.add(idx)
+        fs_indices = {int(name[len("chunk_"):-len(".webm")]) for name, _ in audio_files}
         db_indices = set(c.chunk_index for c in chunks)
 
         missing_in_db = fs_indices - db_indices
@@ -95,9 +98,10 @@ else:
     print()
 
     # Assemble full transcript from completed chunks
-    completed_chunks = [c for c in chunks if c.status == "completed" and c.text]
-    completed_chunks.sort(key=lambda c: c.chunk_index)
-    full_transcript = "\n\n".join(c.text for c in completed_chunks)
+    # (chunks is already ordered by chunk_index)
+    full_transcript = "\n\n".join(
+        c.text for c in chunks if c.status == "completed" and c.text
+    )
 
     print(f"=== RECOVERED TRANSCRIPT FROM DB ({len(full_transcript)} chars) ===")
     print(full_transcript)
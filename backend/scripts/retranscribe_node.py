@@ -1,35 +1,107 @@
 #!/usr/bin/env python3
 """
-One-time script to manually trigger transcription for a stuck voice note.
+One-time script to manually trigger transcription for stuck voice notes.
 
 Usage (from project root, with write-or-perish conda env active):
-    python backend/scripts/retranscribe_node.py <node_id>
+    python backend/scripts/retranscribe_node.py <node_id> [<node_id> ...]
+
+Node IDs may also be given as inclusive ranges, e.g. ``59-64``.
 
 Example:
-    python backend/scripts/retranscribe_node.py 59
+    python backend/scripts/retranscribe_node.py 59 61 70-72
 
 The script will:
-1. Look up the node in the database
-2. Find the audio file (webm, mp3, etc.)
-3. Convert webm to mp3 if needed (browser webm lacks duration metadata)
-4. Reset the transcription status
-5. Queue a new transcription task via Celery
+1. Look up the nodes in the database (one query)
+2. Find each audio file (webm, mp3, etc.)
+3. For webm without duration metadata, remux Opus to ogg or convert
+   other codecs to mp3, several files at a time
+4. Reset the transcription statuses (one commit)
+5. Queue a new transcription task per node via Celery, publishing all of
+   them over a single broker connection
 """
+import json
 import sys
 import os
 import pathlib
 import subprocess
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from sqlalchemy.orm import load_only
 
 # Add project root to path
 project_root = pathlib.Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.app import create_app
+from backend.celery_app import celery
+from backend.extensions import db
 from backend.models import Node
 from backend.tasks.transcription import transcribe_audio
 
 AUDIO_STORAGE_ROOT = pathlib.Path(os.environ.get("AUDIO_STORAGE_PATH", "data/audio")).resolve()
+# str form for building per-node paths without pathlib overhead
+AUDIO_STORAGE_DIR = os.fspath(AUDIO_STORAGE_ROOT)
+CONVERT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def probe_audio(path: pathlib.Path) -> Tuple[Optional[str], Optional[float]]:
+    """Return (codec of the first audio stream, container duration) in one
+    ffprobe call; either is None if unknown."""
+    try:
+        result = subprocess.run([
+            'ffprobe', '-v', 'error', '-select_streams', 'a:0',
+            '-show_entries', 'stream=codec_name:format=duration',
+            '-of', 'json', str(path)
+        ], capture_output=True, text=True)
+        info = json.loads(result.stdout) if result.returncode == 0 else {}
+    except (OSError, ValueError):
+        return None, None
+    streams = info.get('streams') or [{}]
+    try:
+        duration = float(info.get('format', {}).get('duration'))
+    except (TypeError, ValueError):
+        duration = None
+    return streams[0].get('codec_name'), duration
+
+
+def remux_webm_to_ogg(webm_path: pathlib.Path, codec: Optional[str]) -> Optional[pathlib.Path]:
+    """Copy Opus audio from webm into an Ogg container without re-encoding.
+
+    Browser recordings are almost always Opus, which the transcription API
+    accepts as Ogg; a stream copy takes well under a second and avoids the
+    lossy Opus->MP3 transcode. Returns None for other codecs.
+    """
+    ogg_path = webm_path.with_suffix('.ogg')
+
+    if ogg_path.exists():
+        print(f"  OGG already exists: {ogg_path}")
+        return ogg_path
+
+    if codec != 'opus':
+        return None
+
+    print(f"  Remuxing {webm_path} to ogg (no re-encode)...")
+    tmp_path = ogg_path.with_name(f".{ogg_path.name}.part")
+    try:
+        result = subprocess.run([
+            'ffmpeg', '-nostdin', '-y', '-v', 'error', '-i', str(webm_path),
+            '-vn', '-c:a', 'copy', '-f', 'ogg', str(tmp_path)
+        ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, text=True)
+
+        if result.returncode != 0:
+            print(f"  FFmpeg error: {result.stderr[:500]}")
+            return None
+
+        os.replace(tmp_path, ogg_path)
+        print(f"  Remuxed {ogg_path}: {ogg_path.stat().st_size / 1024 / 1024:.2f} MB")
+        return ogg_path
+    except Exception as e:
+        print(f"  Remux failed: {e}")
+        return None
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def convert_webm_to_mp3(webm_path: pathlib.Path) -> Optional[pathlib.Path]:
@@ -40,107 +112,190 @@ def convert_webm_to_mp3(webm_path: pathlib.Path) -> Optional[pathlib.Path]:
         print(f"  MP3 already exists: {mp3_path}")
         return mp3_path
 
-    print(f"  Converting webm to mp3 (browser webm lacks duration metadata)...")
+    print(f"  Converting {webm_path} to mp3...")
+    # Encode next to the target and rename on success, so an interrupted run
+    # never leaves a truncated mp3 for the "already exists" check to reuse.
+    tmp_path = mp3_path.with_name(f".{mp3_path.name}.part")
     try:
         result = subprocess.run([
-            'ffmpeg', '-i', str(webm_path),
+            'ffmpeg', '-nostdin', '-y', '-v', 'error', '-i', str(webm_path),
             '-vn', '-acodec', 'libmp3lame', '-b:a', '128k',
-            str(mp3_path)
-        ], capture_output=True, text=True)
+            '-f', 'mp3', str(tmp_path)
+        ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, text=True)
 
         if result.returncode != 0:
             print(f"  FFmpeg error: {result.stderr[:500]}")
             return None
 
-        print(f"  Converted: {mp3_path.stat().st_size / 1024 / 1024:.2f} MB")
+        os.replace(tmp_path, mp3_path)
+        print(f"  Converted {mp3_path}: {mp3_path.stat().st_size / 1024 / 1024:.2f} MB")
         return mp3_path
     except Exception as e:
         print(f"  Conversion failed: {e}")
         return None
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def find_audio_file(user_id: int, node_id: int) -> Optional[pathlib.Path]:
     """Find the audio file for a node, checking common extensions."""
-    node_dir = AUDIO_STORAGE_ROOT / f"user/{user_id}/node/{node_id}"
+    node_dir = f"{AUDIO_STORAGE_DIR}/user/{user_id}/node/{node_id}"
 
-    if not node_dir.exists():
+    # One directory read instead of a stat() per candidate extension
+    entries = {}
+    try:
+        with os.scandir(node_dir) as it:
+            for entry in it:
+                if entry.name.startswith("original"):
+                    entries.setdefault(pathlib.Path(entry.name).suffix.lower(), entry)
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
-    # Check for original.* files with common audio extensions
+    # Prefer original.* files with common audio extensions
     extensions = ['.webm', '.mp3', '.m4a', '.wav', '.ogg', '.flac', '.aac']
     for ext in extensions:
-        file_path = node_dir / f"original{ext}"
-        if file_path.exists():
-            return file_path
+        if ext in entries:
+            return pathlib.Path(entries[ext].path)
 
-    # Fallback: find any file starting with "original"
-    for file in node_dir.iterdir():
-        if file.name.startswith("original"):
-            return file
+    # Fallback: any file starting with "original"
+    for entry in entries.values():
+        return pathlib.Path(entry.path)
 
     return None
 
 
+def parse_node_ids(args):
+    """Parse node IDs and inclusive ``start-end`` ranges, keeping order."""
+    node_ids = []
+    for arg in args:
+        start, sep, end = arg.partition('-')
+        try:
+            if sep:
+                node_ids.extend(range(int(start), int(end) + 1))
+            else:
+                node_ids.append(int(arg))
+        except ValueError:
+            raise ValueError(f"'{arg}' is not a valid node ID or range")
+    return list(dict.fromkeys(node_ids))
+
+
+def prepare_node(node) -> Optional[pathlib.Path]:
+    """Print the node's state and return the audio file to transcribe."""
+    print(f"Found node {node.id}:")
+    print(f"  User ID: {node.user_id}")
+    print(f"  Current status: {node.transcription_status}")
+    print(f"  Progress: {node.transcription_progress}%")
+    print(f"  Audio URL: {node.audio_original_url}")
+
+    audio_file = find_audio_file(node.user_id, node.id)
+
+    if not audio_file:
+        print(f"  Error: Could not find audio file in {AUDIO_STORAGE_ROOT}/user/{node.user_id}/node/{node.id}/")
+        return None
+
+    print(f"  Found audio file: {audio_file}")
+    print(f"  Size: {audio_file.stat().st_size / 1024 / 1024:.2f} MB")
+    return audio_file
+
+
+def rewrap_webm(audio_file: pathlib.Path) -> pathlib.Path:
+    """Return the file to transcribe, converting webm first.
+
+    Browser webm often lacks duration metadata: remux Opus to ogg,
+    transcode anything else to mp3. Webm that already carries a duration,
+    and other formats, are returned unchanged.
+    """
+    if audio_file.suffix.lower() != '.webm':
+        return audio_file
+    codec, duration = probe_audio(audio_file)
+    if duration and duration > 0:
+        print(f"  {audio_file} already has a duration ({duration:.1f}s), using as is")
+        return audio_file
+    converted = remux_webm_to_ogg(audio_file, codec) or convert_webm_to_mp3(audio_file)
+    if converted:
+        return converted
+    print(f"  Warning: Could not convert {audio_file}, trying with original")
+    return audio_file
+
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python backend/scripts/retranscribe_node.py <node_id>")
+    if len(sys.argv) < 2:
+        print("Usage: python backend/scripts/retranscribe_node.py <node_id> [<node_id> ...]")
         sys.exit(1)
 
     try:
-        node_id = int(sys.argv[1])
-    except ValueError:
-        print(f"Error: '{sys.argv[1]}' is not a valid node ID")
+        node_ids = parse_node_ids(sys.argv[1:])
+    except ValueError as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
     app = create_app()
 
     with app.app_context():
-        # Look up the node
-        node = Node.query.get(node_id)
-        if not node:
-            print(f"Error: Node {node_id} not found")
-            sys.exit(1)
-
-        print(f"Found node {node_id}:")
-        print(f"  User ID: {node.user_id}")
-        print(f"  Current status: {node.transcription_status}")
-        print(f"  Progress: {node.transcription_progress}%")
-        print(f"  Audio URL: {node.audio_original_url}")
-
-        # Find the audio file
-        audio_file = find_audio_file(node.user_id, node_id)
-
-        if not audio_file:
-            print(f"\nError: Could not find audio file in {AUDIO_STORAGE_ROOT}/user/{node.user_id}/node/{node_id}/")
+        # Only the columns printed and reset; never hydrate node content
+        nodes = {
+            node.id: node
+            for node in Node.query.options(load_only(
+                Node.id, Node.user_id, Node.audio_original_url,
+                Node.transcription_status, Node.transcription_progress,
+                Node.transcription_error,
+            )).filter(Node.id.in_(node_ids))
+        }
+
+        failed = False
+        queue = []
+        for node_id in node_ids:
+            node = nodes.get(node_id)
+            if not node:
+                print(f"Error: Node {node_id} not found\n")
+                failed = True
+                continue
+
+            audio_file = prepare_node(node)
+            print()
+            if not audio_file:
+                failed = True
+                continue
+
+            # Reset transcription status; flushed together below. Attribute
+            # writes (not bulk mappings) keep the SSE notify hooks firing.
+            node.transcription_status = 'pending'
+            node.transcription_progress = 0
+            node.transcription_error = None
+            queue.append((node_id, audio_file))
+
+        if not queue:
+            print("Nothing to queue")
             sys.exit(1)
 
-        print(f"\nFound audio file: {audio_file}")
-        print(f"  Size: {audio_file.stat().st_size / 1024 / 1024:.2f} MB")
+        # Each conversion is its own ffmpeg process; run several at once
+        # rather than one node after another
+        with ThreadPoolExecutor(max_workers=CONVERT_WORKERS) as pool:
+            converted = list(pool.map(rewrap_webm, [f for _, f in queue]))
+        queue = [(node_id, f) for (node_id, _), f in zip(queue, converted)]
+        print()
 
-        # Convert webm to mp3 if needed (browser webm lacks duration metadata)
-        if audio_file.suffix.lower() == '.webm':
-            mp3_file = convert_webm_to_mp3(audio_file)
-            if mp3_file:
-                audio_file = mp3_file
-            else:
-                print("\nWarning: Could not convert webm to mp3, trying with original")
-
-        # Reset transcription status
-        node.transcription_status = 'pending'
-        node.transcription_progress = 0
-        node.transcription_error = None
-        from backend.extensions import db
         db.session.commit()
-        print("\nReset transcription status to 'pending'")
-
-        # Queue the transcription task
-        filename = audio_file.name  # e.g., "original.webm"
-        task = transcribe_audio.delay(node_id, str(audio_file), filename)
-
-        print(f"\nTranscription task queued!")
-        print(f"  Task ID: {task.id}")
-        print(f"\nMonitor progress with:")
-        print(f"  curl http://localhost:5010/api/nodes/{node_id}/transcription-status")
+        print(f"Reset transcription status to 'pending' for {len(queue)} node(s)")
+
+        # Queue the transcription tasks over one broker connection
+        with celery.producer_or_acquire() as producer:
+            for node_id, audio_file in queue:
+                filename = audio_file.name  # e.g., "original.webm"
+                task = transcribe_audio.apply_async(
+                    args=(node_id, str(audio_file), filename),
+                    producer=producer,
+                )
+                print(f"  Node {node_id}: task {task.id}")
+
+        print("\nTranscription tasks queued!")
+        print("\nMonitor progress with:")
+        for node_id, _ in queue:
+            print(f"  curl http://localhost:5010/api/nodes/{node_id}/transcription-status")
+
+        if failed:
+            sys.exit(1)
 
 
 if __name__ == "__main__":
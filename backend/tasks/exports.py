@@ -5,6 +5,8 @@ from datetime import datetime
 from celery import Task
 from celery.utils.log import get_task_logger
 import os
+import re
+import uuid
 
 from backend.celery_app import celery, flask_app
 from backend.models import User, UserProfile, APICostLog
@@ -88,11 +90,11 @@ def _has_more_source_after(user, ts):
     """
     from sqlalchemy import or_
     from backend.models import Node
-    return Node.query.filter(
+    return db.session.query(Node.query.filter(
         or_(Node.user_id == user.id, Node.human_owner_id == user.id),
         Node.created_at > ts,
         Node.ai_usage.in_(['chat', 'train']),
-    ).first() is not None
+    ).exists()).scalar()
 
 
 class ProfileGenerationTask(Task):
@@ -118,7 +120,7 @@ def generate_user_profile(self, user_id: int, model_id: str):
 
     with flask_app.app_context():
         # Get user from database
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             raise ValueError(f"User {user_id} not found")
 
@@ -140,7 +142,7 @@ def generate_user_profile(self, user_id: int, model_id: str):
                 "profile_generation.txt", user_id=user_id
             )
 
-            prompt_tokens = approximate_token_count(prompt_template)
+            template_parts = prompt_template.split("{user_export}")
             max_export_tokens = None  # Send entire archive; let retry loop converge
 
             api_keys = get_api_keys_for_usage(flask_app.config, 'chat')
@@ -156,29 +158,27 @@ def generate_user_profile(self, user_id: int, model_id: str):
                 export_tokens = approximate_token_count(user_export)
                 logger.info(f"User export built for user {user_id}, length: {len(user_export)} characters, ~{export_tokens} tokens (attempt {attempt + 1})")
 
-                # Step 2: Build final prompt (45% progress)
-                self.update_state(state='PROGRESS', meta={'progress': 45, 'status': 'Preparing prompt'})
-
-                # Replace placeholder with user export
-                final_prompt = prompt_template.replace("{user_export}", user_export)
-
-                # Step 3: Build messages (50% progress)
-                self.update_state(state='PROGRESS', meta={'progress': 50, 'status': 'Building context'})
-
+                # Step 2: Build messages. No progress write of its own: it
+                # takes microseconds and step 3's update follows at once.
+                # Put the export in its own text block(s) around the template
+                # text instead of splicing it into one more copy of the prompt
                 messages = [
                     {
                         "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": final_prompt
-                            }
-                        ]
+                        "content": _text_blocks_around(
+                            template_parts, user_export),
                     }
                 ]
 
-                # Step 4: Call LLM API (60% -> 90% progress)
-                self.update_state(state='PROGRESS', meta={'progress': 60, 'status': 'Generating profile'})
+                # Step 3: Call LLM API (60% -> 90% progress); a retry
+                # reports the same state, so only the first attempt writes it
+                if attempt == 0:
+                    self.update_state(state='PROGRESS', meta={'progress': 60, 'status': 'Generating profile'})
+
+                # End the read-only transaction so the pooled connection isn't
+                # held idle-in-transaction for the minutes the LLM call takes;
+                # the cost log and profile below are written in one commit.
+                db.session.commit()
 
                 try:
                     response = LLMProvider.get_completion(model_id, messages, api_keys)
@@ -215,7 +215,7 @@ def generate_user_profile(self, user_id: int, model_id: str):
             )
             db.session.add(cost_log)
 
-            # Step 5: Save to database (95% progress)
+            # Step 4: Save to database (95% progress)
             self.update_state(state='PROGRESS', meta={'progress': 95, 'status': 'Saving profile'})
 
             # AI-generated profiles are private; ai_usage follows the user's
@@ -256,6 +256,24 @@ def generate_user_profile(self, user_id: int, model_id: str):
             raise
 
 
+def _text_blocks_around(parts, text):
+    """Content blocks for *parts* joined by *text*, i.e. the blocks form of
+    ``text.join(parts)``. Empty blocks are dropped (Anthropic rejects them).
+    """
+    blocks = []
+    for i, part in enumerate(parts):
+        if i:
+            blocks.append(text)
+        blocks.append(part)
+    return [{"type": "text", "text": b} for b in blocks if b]
+
+
+_PROMPTS_DIR = os.path.join(flask_app.root_path, "prompts")
+# path -> (mtime_ns, text); the stat keeps edited prompts live without a
+# worker restart
+_PROMPT_CACHE = {}
+
+
 def _load_prompt(name, user_id=None):
     """Load a prompt template by name, checking user overrides first."""
     if user_id:
@@ -265,9 +283,15 @@ def _load_prompt(name, user_id=None):
         content = get_user_prompt(user_id, prompt_key)
         if content:
             return content
-    path = os.path.join(flask_app.root_path, "prompts", name)
+    path = os.path.join(_PROMPTS_DIR, name)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _PROMPT_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
     with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+        content = f.read()
+    _PROMPT_CACHE[path] = (mtime, content)
+    return content
 
 
 def _call_llm_with_retries(self, model_id, prompt_text, user_id,
@@ -285,10 +309,11 @@ def _call_llm_with_retries(self, model_id, prompt_text, user_id,
             {"type": "text", "text": prompt_text}
         ]}]
 
-        self.update_state(state='PROGRESS', meta={
-            'progress': progress_base + 10,
-            'status': status_label
-        })
+        if attempt == 0:  # retries would rewrite the identical state
+            self.update_state(state='PROGRESS', meta={
+                'progress': progress_base + 10,
+                'status': status_label
+            })
 
         try:
             response = LLMProvider.get_completion(model_id, messages,
@@ -372,7 +397,7 @@ def revert_profile_for_import(user_id, earliest_imported_created_at):
 
     if not profiles:
         # No profiles at all — nothing to revert to
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if user:
             user.profile_needs_full_regen = True
         return
@@ -387,7 +412,7 @@ def revert_profile_for_import(user_id, earliest_imported_created_at):
 
     if valid_profile is None:
         # All profiles are invalidated
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if user:
             user.profile_needs_full_regen = True
         return
@@ -435,7 +460,7 @@ def update_user_profile(self, user_id: int, model_id: str,
     )
 
     with flask_app.app_context():
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             raise ValueError(f"User {user_id} not found")
 
@@ -486,14 +511,17 @@ def update_user_profile(self, user_id: int, model_id: str,
             )
             raise
         finally:
-            # Clear concurrency guard; only clear full-regen flag on success
-            user = User.query.get(user_id)
-            if user:
-                user.profile_generation_task_id = None
-                user.profile_generation_task_dispatched_at = None
-                if success:
-                    user.profile_needs_full_regen = False
-                db.session.commit()
+            # Clear concurrency guard; only clear full-regen flag on success.
+            # A bulk UPDATE, so the User expired by earlier commits isn't
+            # SELECTed again just to write these columns.
+            from sqlalchemy import update
+            values = dict(profile_generation_task_id=None,
+                          profile_generation_task_dispatched_at=None)
+            if success:
+                values['profile_needs_full_regen'] = False
+            db.session.execute(
+                update(User).where(User.id == user_id).values(**values))
+            db.session.commit()
 
 
 def _do_incremental_update(self, user, model_id, previous_profile_id,
@@ -503,7 +531,7 @@ def _do_incremental_update(self, user, model_id, previous_profile_id,
         'progress': 10, 'status': 'Loading previous profile'
     })
 
-    prev_profile = UserProfile.query.get(previous_profile_id)
+    prev_profile = db.session.get(UserProfile, previous_profile_id)
     if not prev_profile or prev_profile.user_id != user.id:
         raise ValueError(f"Previous profile {previous_profile_id} not found")
 
@@ -708,7 +736,7 @@ def _collect_iterative_chain(last_profile_id):
 
     while current_id and current_id not in seen:
         seen.add(current_id)
-        profile = UserProfile.query.get(current_id)
+        profile = db.session.get(UserProfile, current_id)
         if not profile:
             break
         if profile.generation_type not in (
@@ -748,6 +776,18 @@ def build_update_template(user_id):
     )
 
 
+def _fill_placeholders(template, values):
+    """Substitute ``{name}`` placeholders from *values* in one pass.
+
+    Unlike chained str.replace, the (large) substituted text is copied once
+    and never rescanned, so a placeholder-like string inside user writing
+    stays literal. Unknown ``{...}`` and other braces are left untouched.
+    """
+    pattern = re.compile(
+        "{(" + "|".join(re.escape(k) for k in values) + ")}")
+    return pattern.sub(lambda m: values[m.group(1)], template)
+
+
 def build_chunk_prompt(update_template, current_profile_content,
                        cumulative_source_tokens, chunk):
     """Build the per-chunk incremental-update prompt (the non-first-chunk
@@ -758,16 +798,13 @@ def build_chunk_prompt(update_template, current_profile_content,
             cumulative_source_tokens + chunk_tokens_est, 1
         ) * 100, 1
     )
-    prompt = update_template.replace(
-        "{existing_profile}", current_profile_content
-    )
-    prompt = prompt.replace("{new_data}", chunk["content"])
-    prompt = prompt.replace(
-        "{source_tokens_past}", str(cumulative_source_tokens)
-    )
-    prompt = prompt.replace("{source_tokens_new}", str(chunk_tokens_est))
-    prompt = prompt.replace("{ratio_percent}", str(ratio_pct))
-    return prompt
+    return _fill_placeholders(update_template, {
+        "existing_profile": current_profile_content,
+        "new_data": chunk["content"],
+        "source_tokens_past": str(cumulative_source_tokens),
+        "source_tokens_new": str(chunk_tokens_est),
+        "ratio_percent": str(ratio_pct),
+    })
 
 
 def build_integration_messages(user_id, last_iterative_profile_id):
@@ -1064,26 +1101,24 @@ def maybe_trigger_profile_update(user_id, model_id=None,
     Check concurrency guard and dispatch update_user_profile if safe.
     Returns the task_id or None if skipped.
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         return None
 
     # Check concurrency guard
-    if user.profile_generation_task_id:
+    observed_task_id = user.profile_generation_task_id
+    if observed_task_id:
         if not _is_task_stale(user):
             logger.info(
                 f"Skipping profile update for user {user_id}: "
-                f"task {user.profile_generation_task_id} in progress"
+                f"task {observed_task_id} in progress"
             )
             return None
-        # Clear stale guard
+        # Stale guard is replaced by the claim below
         logger.info(
             f"Clearing stale profile task guard for user {user_id}: "
-            f"task {user.profile_generation_task_id}"
+            f"task {observed_task_id}"
         )
-        user.profile_generation_task_id = None
-        user.profile_generation_task_dispatched_at = None
-        db.session.commit()
 
     if model_id is None:
         model_id = (
@@ -1101,10 +1136,43 @@ def maybe_trigger_profile_update(user_id, model_id=None,
         latest_profile.id if latest_profile else None
     )
 
-    task = update_user_profile.delay(user_id, model_id, prev_id)
-    user.profile_generation_task_id = task.id
-    user.profile_generation_task_dispatched_at = datetime.utcnow()
+    # Claim the guard atomically: the UPDATE only matches if the guard still
+    # holds the value checked above, so of two concurrent callers exactly
+    # one dispatches. A claim orphaned by a crash looks like a lost PENDING
+    # task and goes stale after 15 minutes.
+    from sqlalchemy import update
+    claim = f"claim-{uuid.uuid4()}"
+    guard = User.profile_generation_task_id
+    claimed = db.session.execute(
+        update(User)
+        .where(User.id == user_id,
+               guard.is_(None) if observed_task_id is None
+               else guard == observed_task_id)
+        .values(profile_generation_task_id=claim,
+                profile_generation_task_dispatched_at=datetime.utcnow())
+    ).rowcount
     db.session.commit()
+    if not claimed:
+        logger.info(
+            f"Skipping profile update for user {user_id}: "
+            f"guard claimed concurrently"
+        )
+        return None
+
+    def _replace_claim(task_id):
+        db.session.execute(
+            update(User)
+            .where(User.id == user_id, guard == claim)
+            .values(profile_generation_task_id=task_id)
+        )
+        db.session.commit()
+
+    try:
+        task = update_user_profile.delay(user_id, model_id, prev_id)
+    except Exception:
+        _replace_claim(None)  # release so the next heartbeat can retry
+        raise
+    _replace_claim(task.id)
 
     logger.info(
         f"Dispatched profile update task {task.id} for user {user_id}"
@@ -1123,7 +1191,7 @@ def integrate_user_profile(self, user_id: int, model_id: str,
     )
 
     with flask_app.app_context():
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             raise ValueError(f"User {user_id} not found")
 
@@ -1157,17 +1225,27 @@ def integrate_user_profile(self, user_id: int, model_id: str,
             )
             raise
         finally:
-            user = User.query.get(user_id)
-            if user:
-                user.profile_generation_task_id = None
-                user.profile_generation_task_dispatched_at = None
-                db.session.commit()
+            from sqlalchemy import update
+            db.session.execute(
+                update(User).where(User.id == user_id).values(
+                    profile_generation_task_id=None,
+                    profile_generation_task_dispatched_at=None))
+            db.session.commit()
+
+
+_UNSET = object()
 
 
-def maybe_trigger_incremental_profile_update(user):
+def maybe_trigger_incremental_profile_update(user, *, last_node_at=_UNSET,
+                                             latest_profile=_UNSET):
     """
     Check if enough new writing has accumulated to trigger an
     incremental profile update. Called periodically by Celery beat.
+
+    check_pending_profile_updates passes ``last_node_at`` (the user's
+    latest node created_at, or None) and ``latest_profile`` (latest
+    non-integration UserProfile, or None) fetched for all users at once;
+    when omitted they are queried here.
     """
     from datetime import datetime, timedelta
     from backend.models import Node
@@ -1187,17 +1265,20 @@ def maybe_trigger_incremental_profile_update(user):
         return None
 
     # User must have been inactive for at least 30 minutes
-    last_node = Node.query.filter_by(user_id=user.id) \
-        .order_by(Node.created_at.desc()).first()
+    if last_node_at is _UNSET:
+        last_node = Node.query.filter_by(user_id=user.id) \
+            .order_by(Node.created_at.desc()).first()
+        last_node_at = last_node.created_at if last_node else None
     MIN_INACTIVITY = timedelta(minutes=30)
-    if last_node and (datetime.utcnow() - last_node.created_at) < MIN_INACTIVITY:
+    if last_node_at and (datetime.utcnow() - last_node_at) < MIN_INACTIVITY:
         return None
 
     # Find latest non-integration profile
-    latest_profile = UserProfile.query.filter(
-        UserProfile.user_id == user.id,
-        UserProfile.generation_type != 'integration'
-    ).order_by(UserProfile.created_at.desc()).first()
+    if latest_profile is _UNSET:
+        latest_profile = UserProfile.query.filter(
+            UserProfile.user_id == user.id,
+            UserProfile.generation_type != 'integration'
+        ).order_by(UserProfile.created_at.desc()).first()
 
     THRESHOLD_TOKENS = 80000
     MIN_INTERVAL = timedelta(hours=1)
@@ -1253,6 +1334,39 @@ def maybe_trigger_incremental_profile_update(user):
     return None
 
 
+def _profile_update_inputs(user_ids):
+    """Bulk lookups for maybe_trigger_incremental_profile_update: returns
+    ({user_id: latest node created_at}, {user_id: latest non-integration
+    UserProfile}) in two queries instead of two per user."""
+    from sqlalchemy import func
+    from backend.models import Node
+
+    if not user_ids:
+        return {}, {}
+    last_node_at = dict(
+        db.session.query(Node.user_id, func.max(Node.created_at))
+        .filter(Node.user_id.in_(user_ids))
+        .group_by(Node.user_id)
+        .all()
+    )
+    ranked = db.session.query(
+        UserProfile.id,
+        func.row_number().over(
+            partition_by=UserProfile.user_id,
+            order_by=UserProfile.created_at.desc(),
+        ).label("rn"),
+    ).filter(
+        UserProfile.user_id.in_(user_ids),
+        UserProfile.generation_type != 'integration',
+    ).subquery()
+    latest_profiles = {
+        p.user_id: p
+        for p in UserProfile.query.join(ranked, UserProfile.id == ranked.c.id)
+        .filter(ranked.c.rn == 1)
+    }
+    return last_node_at, latest_profiles
+
+
 @celery.task
 def check_pending_profile_updates():
     """Periodic task: check all eligible users for pending profile updates."""
@@ -1266,9 +1380,15 @@ def check_pending_profile_updates():
         # a bare NOT LIKE drops them (NULL NOT LIKE = NULL). See
         # User.profile_eligible_query.
         users = User.profile_eligible_query().all()
+        last_node_at, latest_profiles = _profile_update_inputs(
+            [u.id for u in users])
         for user in users:
             try:
-                maybe_trigger_incremental_profile_update(user)
+                maybe_trigger_incremental_profile_update(
+                    user,
+                    last_node_at=last_node_at.get(user.id),
+                    latest_profile=latest_profiles.get(user.id),
+                )
             except Exception as e:
                 logger.warning(
                     f"Profile update check failed for user {user.id}: {e}"
@@ -1289,7 +1409,7 @@ def export_user_threads(self, user_id: int):
     logger.info(f"Starting thread export task for user {user_id}")
 
     with flask_app.app_context():
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             raise ValueError(f"User {user_id} not found")
 
@@ -70,7 +70,7 @@ The corpus:
              bind=True, max_retries=2, default_retry_delay=60)
 def rebuild_external_digest(self, user_id):
     with flask_app.app_context():
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if user is None:
             return {"status": "no_user"}
 
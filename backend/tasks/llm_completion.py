@@ -797,13 +797,13 @@ def _retrieval_injection_text(tr, with_labels=False):
     """
     name = tr.get("name")
     if name == "read_artifact":
-        artifact = UserArtifact.query.get(tr.get("artifact_id"))
+        artifact = db.session.get(UserArtifact, tr.get("artifact_id"))
         if artifact is None or artifact.ai_usage not in AI_ALLOWED:
             return None
         return (f"[Contents of artifact '{tr.get('kind', '?')}' you "
                 f"requested:\n{artifact.get_content()}]")
     if name == "read_todo":
-        todo = UserTodo.query.get(tr.get("todo_id"))
+        todo = db.session.get(UserTodo, tr.get("todo_id"))
         if todo is None or todo.ai_usage not in AI_ALLOWED:
             return None
         return f"[Your current todo list:\n{todo.get_content()}]"
@@ -837,7 +837,7 @@ def _retrieval_injection_text(tr, with_labels=False):
         matches = tr.get("matches") or []
         lines = []
         for m in matches:
-            node = Node.query.get(m.get("node_id"))
+            node = db.session.get(Node, m.get("node_id"))
             if (node is None or node.deleted_at is not None
                     or node.ai_usage not in AI_ALLOWED):
                 continue
@@ -858,7 +858,7 @@ def _retrieval_injection_text(tr, with_labels=False):
         # surfacing history as visible metadata — the model weighs
         # repetition itself; there is no hardcoded cooldown.
         for m in (tr.get("ext_matches") or []):
-            item = ExternalItem.query.get(m.get("item_id"))
+            item = db.session.get(ExternalItem, m.get("item_id"))
             if item is None:
                 continue
             text = (item.get_content() or "").strip()
@@ -984,7 +984,7 @@ def _artifact_update_echo(tr):
     non-update or failed entries and for no-op writes."""
     if tr.get("name") != "update_artifact" or tr.get("status") != "success":
         return None
-    artifact = UserArtifact.query.get(tr.get("artifact_id"))
+    artifact = db.session.get(UserArtifact, tr.get("artifact_id"))
     if artifact is None:
         return None
     new_text = artifact.get_content() or ""
@@ -992,7 +992,7 @@ def _artifact_update_echo(tr):
     prev_id = tr.get("previous_artifact_id")
     if prev_id is None:
         return f"[You created '{kind}' with this content:\n{new_text}]"
-    previous = UserArtifact.query.get(prev_id)
+    previous = db.session.get(UserArtifact, prev_id)
     old_text = (previous.get_content() or "") if previous else ""
     # Drop the ---/+++ file headers; keep the @@ hunks.
     diff_lines = list(difflib.unified_diff(
@@ -1377,7 +1377,7 @@ def _execute_tool_calls(tool_calls, llm_node, node_chain, user_id,
                     from backend.routes.todo import (
                         _start_todo_merge,
                     )
-                    proposal_node = Node.query.get(draft.parent_id)
+                    proposal_node = db.session.get(Node, draft.parent_id)
                     task_id = _start_todo_merge(
                         draft, proposal_node or llm_node, user_id,
                         confirm_node_id=llm_node.id,
@@ -1394,7 +1394,7 @@ def _execute_tool_calls(tool_calls, llm_node, node_chain, user_id,
                     result["error"] = "No pending GitHub issue found"
                 else:
                     # Find the LLM node that proposed the issue
-                    origin_node = Node.query.get(draft.parent_id)
+                    origin_node = db.session.get(Node, draft.parent_id)
                     if not origin_node:
                         result["status"] = "error"
                         result["error"] = "Origin node not found"
@@ -1411,7 +1411,7 @@ def _execute_tool_calls(tool_calls, llm_node, node_chain, user_id,
                             from backend.utils.github import (
                                 create_github_issue,
                             )
-                            user = User.query.get(user_id)
+                            user = db.session.get(User, user_id)
                             username = (
                                 user.username if user else str(user_id)
                             )
@@ -1619,7 +1619,7 @@ def _execute_tool_calls(tool_calls, llm_node, node_chain, user_id,
                     # never sees search labels, so the chip links to the
                     # actual content instead (external URL / entry node).
                     if target[0] == "external":
-                        item = ExternalItem.query.get(target[1])
+                        item = db.session.get(ExternalItem, target[1])
                         if item is not None:
                             result["url"] = item.url
                             result["author_handle"] = item.author_handle
@@ -1634,7 +1634,7 @@ def _execute_tool_calls(tool_calls, llm_node, node_chain, user_id,
                     result["status"] = "error"
                     result["error"] = "No pending feedback found"
                 else:
-                    origin_node = Node.query.get(draft.parent_id)
+                    origin_node = db.session.get(Node, draft.parent_id)
                     if not origin_node:
                         result["status"] = "error"
                         result["error"] = "Origin node not found"
@@ -1673,7 +1673,7 @@ def _execute_tool_calls(tool_calls, llm_node, node_chain, user_id,
                     result["status"] = "error"
                     result["error"] = "No pending share found"
                 else:
-                    origin_node = Node.query.get(draft.parent_id)
+                    origin_node = db.session.get(Node, draft.parent_id)
                     if not origin_node:
                         result["status"] = "error"
                         result["error"] = "Origin node not found"
@@ -1820,7 +1820,7 @@ def get_user_recent_raw_content(user_id, created_before=None):
     from backend.routes.export_data import (
         build_user_export_content as _build_export,
     )
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         return None
 
@@ -1852,7 +1852,7 @@ class LLMCompletionTask(Task):
         llm_node_id = args[1] if len(args) > 1 else None
         if llm_node_id:
             with flask_app.app_context():
-                node = Node.query.get(llm_node_id)
+                node = db.session.get(Node, llm_node_id)
                 # Skip nodes already finalized: when a CONTINUATION call
                 # fails mid-loop, args[1] is the turn's FIRST node — a
                 # completed interim step whose status must survive (the
@@ -1877,7 +1877,7 @@ def render_system_message(system_node, user_id):
     Only valid for prompts without volatile placeholders ({user_export},
     {quote:..}) — callers must check first.
     """
-    owner = User.query.get(user_id)
+    owner = db.session.get(User, user_id)
     user_tz = owner.timezone if owner and owner.timezone else "UTC"
     author = system_node.user.username if system_node.user else "Unknown"
     time_prefix = local_stamp(
@@ -1962,7 +1962,7 @@ def prewarm_anthropic_cache(system_node_id, user_id, model_id,
     """
     with flask_app.app_context():
         try:
-            system_node = Node.query.get(system_node_id)
+            system_node = db.session.get(Node, system_node_id)
             if system_node is None:
                 return {"status": "skipped", "reason": "no_system_node"}
             sys_content = system_node.get_content() or ""
@@ -1996,7 +1996,7 @@ def prewarm_anthropic_cache(system_node_id, user_id, model_id,
                 ]},
             ]
             if transcript_so_far and recording_stamp_iso:
-                owner = User.query.get(user_id)
+                owner = db.session.get(User, user_id)
                 user_tz = (owner.timezone if owner and owner.timezone
                            else "UTC")
                 author = owner.username if owner else "Unknown"
@@ -2066,8 +2066,8 @@ def generate_llm_response(self, parent_node_id: int, llm_node_id: int, model_id:
     logger.info(f"Starting LLM completion task for parent {parent_node_id}, updating node {llm_node_id}, model={model_id}")
 
     with flask_app.app_context():
-        parent_node = Node.query.get(parent_node_id)
-        llm_node = Node.query.get(llm_node_id)
+        parent_node = db.session.get(Node, parent_node_id)
+        llm_node = db.session.get(Node, llm_node_id)
 
         if not parent_node:
             raise ValueError(f"Parent node {parent_node_id} not found")
@@ -2357,7 +2357,7 @@ def generate_llm_response(self, parent_node_id: int, llm_node_id: int, model_id:
             MAX_RETRIES = 3
             for attempt in range(MAX_RETRIES + 1):
                 if needs_export:
-                    user = User.query.get(user_id)
+                    user = db.session.get(User, user_id)
                     if user and max_export_tokens != 0:
                         # Use the timestamp of the node containing {user_export} as cutoff
                         # to only include archive data created before that node
@@ -2399,7 +2399,7 @@ def generate_llm_response(self, parent_node_id: int, llm_node_id: int, model_id:
                 # owner's timezone. The model infers "now" from the most recent
                 # message's stamp — no separate "Today is X" anchor, no
                 # relative phrasing.
-                _owner = User.query.get(user_id)
+                _owner = db.session.get(User, user_id)
                 user_tz = (_owner.timezone if _owner and _owner.timezone
                            else "UTC")
 
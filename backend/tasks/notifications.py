@@ -0,0 +1,24 @@
+"""Outbound notification emails sent off the request path.
+
+SMTP round-trips take hundreds of ms and can hang on a slow relay, so
+routes enqueue these instead of sending inline; the worker retries a
+failed send a few times before giving up.
+"""
+from celery.utils.log import get_task_logger
+
+from backend.celery_app import celery, flask_app
+from backend.utils.email import send_admin_signup_notification
+
+logger = get_task_logger(__name__)
+
+
+@celery.task(name='backend.tasks.notifications.send_admin_signup_notification',
+             bind=True, max_retries=3, default_retry_delay=60)
+def send_admin_signup_notification_task(self, username, user_email):
+    with flask_app.app_context():
+        try:
+            send_admin_signup_notification(username, user_email)
+        except Exception as exc:
+            logger.warning("Admin signup notification for %s failed: %s",
+                           username, exc)
+            raise self.retry(exc=exc)
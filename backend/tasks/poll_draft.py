@@ -133,7 +133,7 @@ def _fail_response(resp):
 def _submit_poll_draft(response_id, task_id=None):
     """Core of submit (plain function so tests can call it without the
     Celery machinery)."""
-    resp = PollResponse.query.get(response_id)
+    resp = db.session.get(PollResponse, response_id)
     if resp is None or resp.status != "drafting":
         logger.info("Poll draft %s skipped (gone or not drafting)",
                     response_id)
@@ -167,7 +167,7 @@ def _submit_poll_draft(response_id, task_id=None):
         db.session.commit()
     except Exception:
         db.session.rollback()
-        _fail_response(PollResponse.query.get(response_id))
+        _fail_response(db.session.get(PollResponse, response_id))
         logger.exception(
             "Poll draft submit failed for response %s", response_id)
 
@@ -185,7 +185,7 @@ def _save_draft_result(item, result):
     cost to the polls system account."""
     from backend.utils.system_accounts import get_poll_system_user
 
-    resp = PollResponse.query.get(item["response_id"])
+    resp = db.session.get(PollResponse, item["response_id"])
     if resp is None or resp.status != "drafting":
         logger.info("Draft result for response %s dropped (status %s)",
                     item["response_id"],
@@ -242,7 +242,7 @@ def _collect_poll_draft_batches():
                     "Poll draft item %s missing from batch %s",
                     item["custom_id"], job.batch_id)
                 _fail_response(
-                    PollResponse.query.get(item["response_id"]))
+                    db.session.get(PollResponse, item["response_id"]))
         job.status = "collected"
         job.collected_at = datetime.utcnow()
         db.session.commit()
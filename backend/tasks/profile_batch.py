@@ -327,7 +327,7 @@ def _submit_requests(built, keys):
                 f"Batch submit failed for {provider_key}; "
                 f"{len(items)} item(s) not in flight")
             for item in items:
-                u = User.query.get(item["user_id"])
+                u = db.session.get(User, item["user_id"])
                 if u:
                     u.profile_batch_pending = False
                     u.profile_batch_attempts = (u.profile_batch_attempts or 0) + 1
@@ -337,7 +337,7 @@ def _submit_requests(built, keys):
             provider_key=provider_key, batch_id=batch_id, status="pending",
             items=items, submitted_at=now))
         for item in items:
-            u = User.query.get(item["user_id"])
+            u = db.session.get(User, item["user_id"])
             if u:
                 u.profile_batch_pending = True
         db.session.commit()
@@ -349,7 +349,7 @@ def _fail_job(job, reason):
     job.status = "failed"
     job.collected_at = datetime.utcnow()
     for item in job.items:
-        u = User.query.get(item["user_id"])
+        u = db.session.get(User, item["user_id"])
         if u:
             u.profile_batch_pending = False
             u.profile_batch_attempts = (u.profile_batch_attempts or 0) + 1
@@ -424,7 +424,7 @@ def _poll_profile_batches():
             continue  # not ended yet
 
         for item in job.items:
-            user = User.query.get(item["user_id"])
+            user = db.session.get(User, item["user_id"])
             if not user:
                 continue
             result = results.get(item["custom_id"])
@@ -204,7 +204,7 @@ def generate_recent_context(user_id, profile_id=None, data_cutoff_iso=None):
     progressively more comprehensive.
     """
     with flask_app.app_context():
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             logger.warning(f"User {user_id} not found")
             return
@@ -221,7 +221,7 @@ def generate_recent_context(user_id, profile_id=None, data_cutoff_iso=None):
         )
 
         # Re-check concurrency: no recent context created in last 5 min
-        profile = UserProfile.query.get(profile_id) if profile_id else None
+        profile = db.session.get(UserProfile, profile_id) if profile_id else None
         pid = profile.id if profile else None
         latest_rc = _get_latest_recent_context(user_id, pid)
         if latest_rc and (datetime.utcnow() - latest_rc.created_at) < MIN_GENERATION_INTERVAL:
@@ -0,0 +1,18 @@
+"""Beat task that rebuilds the /stats daily token rollup.
+
+Thin wrapper — the testable logic lives in backend/utils/stats_rollup.py.
+"""
+from celery.utils.log import get_task_logger
+
+from backend.celery_app import celery, flask_app
+from backend.utils.stats_rollup import refresh_daily_node_tokens
+
+logger = get_task_logger(__name__)
+
+
+@celery.task(name='backend.tasks.stats_rollup.refresh_daily_node_tokens')
+def refresh_daily_node_tokens_task():
+    with flask_app.app_context():
+        rows = refresh_daily_node_tokens()
+        logger.info("Daily node token rollup rebuilt: %d rows", rows)
+        return rows
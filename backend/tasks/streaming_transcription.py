@@ -37,7 +37,7 @@ def _find_thread_system_node(parent_id):
     carrying the 'prompt' artifact (created at thread start). Returns the
     Node or None. Mirrors the node-chain walk + system-node lookup in
     generate_llm_response."""
-    current = Node.query.get(parent_id)
+    current = db.session.get(Node, parent_id)
     while current is not None:
         if current.deleted_at is None and current.has_artifact("prompt"):
             return current
@@ -85,7 +85,7 @@ def transcribe_chunk(self, node_id: int, chunk_index: int, chunk_path: str):
 
     with flask_app.app_context():
         from backend.utils.spend import user_is_capped
-        _node = Node.query.get(node_id)
+        _node = db.session.get(Node, node_id)
         if _node and user_is_capped(_node.user_id):
             logger.warning(
                 "User %s is spend-capped; skipping chunk transcription",
@@ -170,7 +170,7 @@ def transcribe_chunk(self, node_id: int, chunk_index: int, chunk_path: str):
             chunk_record.completed_at = datetime.utcnow()
 
             # Log transcription cost
-            node = Node.query.get(node_id)
+            node = db.session.get(Node, node_id)
             if node and chunk_duration_sec > 0:
                 transcription_cost = calculate_audio_cost_microdollars(
                     "gpt-4o-transcribe", chunk_duration_sec
@@ -224,7 +224,7 @@ class FinalizationTask(Task):
 
         if node_id:
             with flask_app.app_context():
-                node = Node.query.get(node_id)
+                node = db.session.get(Node, node_id)
                 if node:
                     node.transcription_status = 'failed'
                     node.transcription_error = str(exc)[:500]
@@ -249,7 +249,7 @@ def finalize_streaming(self, node_id: int, session_id: str, total_chunks: int):
     logger.info(f"Finalizing streaming transcription for node {node_id}, {total_chunks} chunks")
 
     with flask_app.app_context():
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node:
             raise ValueError(f"Node {node_id} not found")
 
@@ -1269,7 +1269,7 @@ def _start_server_side_llm_chain(draft, session_id, transcript,
 
     if parent_id:
         # Inherit ai_usage from parent node in the thread
-        parent_node = Node.query.get(parent_id)
+        parent_node = db.session.get(Node, parent_id)
         ai_usage = (parent_node.ai_usage if parent_node
                     else draft.ai_usage) or "none"
         user_parent_id = parent_id
@@ -33,7 +33,7 @@ class TranscriptionTask(Task):
         node_id = args[0] if args else None
         if node_id:
             with flask_app.app_context():
-                node = Node.query.get(node_id)
+                node = db.session.get(Node, node_id)
                 if node:
                     node.transcription_status = 'failed'
                     node.transcription_error = str(exc)[:500]
@@ -56,7 +56,7 @@ def transcribe_audio(self, node_id: int, audio_file_path: str, filename: str = N
 
     with flask_app.app_context():
         # Get node from database
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node:
             raise ValueError(f"Node {node_id} not found")
 
@@ -93,7 +93,7 @@ class TTSTask(Task):
         node_id = args[0] if args else None
         if node_id:
             with flask_app.app_context():
-                node = Node.query.get(node_id)
+                node = db.session.get(Node, node_id)
                 if node:
                     node.tts_task_status = 'failed'
                     db.session.commit()
@@ -108,7 +108,7 @@ class ProfileTTSTask(Task):
         profile_id = args[0] if args else None
         if profile_id:
             with flask_app.app_context():
-                profile = UserProfile.query.get(profile_id)
+                profile = db.session.get(UserProfile, profile_id)
                 if profile:
                     profile.tts_task_status = 'failed'
                     db.session.commit()
@@ -338,7 +338,7 @@ def generate_tts_audio(self, node_id: int, audio_storage_root: str,
     logger.info(f"Starting TTS generation task for node {node_id}")
 
     with flask_app.app_context():
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node:
             raise ValueError(f"Node {node_id} not found")
 
@@ -458,7 +458,7 @@ def generate_tts_audio_for_profile(self, profile_id: int,
     logger.info(f"Starting TTS generation task for profile {profile_id}")
 
     with flask_app.app_context():
-        profile = UserProfile.query.get(profile_id)
+        profile = db.session.get(UserProfile, profile_id)
         if not profile:
             raise ValueError(f"UserProfile {profile_id} not found")
 
@@ -43,7 +43,7 @@ def apply_voice_todo(self, llm_node_id: int, model_id: str, user_id: int,
     5. Update tool_calls_meta on the originating LLM node
     """
     with flask_app.app_context():
-        llm_node = Node.query.get(llm_node_id)
+        llm_node = db.session.get(Node, llm_node_id)
         if not llm_node:
             logger.error(f"LLM node {llm_node_id} not found")
             return
@@ -173,7 +173,7 @@ def _run_merge(llm_node, update_summary, user_id, model_id,
     ))
 
     # Save new UserTodo
-    merge_user = User.query.get(user_id)
+    merge_user = db.session.get(User, user_id)
     new_todo = UserTodo(
         user_id=user_id,
         generated_by="voice_session",
@@ -223,7 +223,7 @@ def _update_apply_status(llm_node, status, error=None, todo_id=None,
 
     # Mirror status onto the confirmation node's apply_todo_changes entry
     if confirm_node_id:
-        confirm_node = Node.query.get(confirm_node_id)
+        confirm_node = db.session.get(Node, confirm_node_id)
         if confirm_node and confirm_node.tool_calls_meta:
             try:
                 cmeta = json.loads(confirm_node.tool_calls_meta)
@@ -301,3 +301,93 @@ def test_null_cutoff_high_data_still_triggers(app, monkeypatch):
     exports.maybe_trigger_incremental_profile_update(user)
     assert "yes" in called              # crossed threshold -> triggered
     assert called["yes"][0][0] == user.id
+
+
+def test_bulk_profile_update_inputs_match_per_user_lookups(app):
+    """check_pending_profile_updates' bulk lookups return the same latest
+    node time and latest non-integration profile as the per-user queries."""
+    import backend.tasks.exports as exports
+
+    user = _seed_null_cutoff_user("bulkin", node_tokens=10)
+    newer = UserProfile(
+        user_id=user.id, generated_by="gpt-5", tokens_used=0,
+        generation_type="update", created_at=datetime(2025, 2, 1),
+    )
+    newer.set_content("NEWER")
+    integration = UserProfile(
+        user_id=user.id, generated_by="gpt-5", tokens_used=0,
+        generation_type="integration", created_at=datetime(2025, 3, 1),
+    )
+    integration.set_content("INTEGRATION")
+    _db.session.add_all([newer, integration])
+    _db.session.commit()
+
+    last_node_at, latest = exports._profile_update_inputs([user.id])
+    assert last_node_at == {user.id: datetime(2025, 1, 2)}
+    assert latest[user.id].id == newer.id
+    assert exports._profile_update_inputs([]) == ({}, {})
+
+
+def test_incremental_update_accepts_bulk_inputs(app, monkeypatch):
+    """Fed the bulk lookups, the heartbeat reaches the same decision."""
+    import backend.tasks.exports as exports
+    import backend.tasks.profile_batch as pb
+    monkeypatch.setattr(pb, "use_batch_for_user", lambda *a, **k: False)
+
+    user = _seed_null_cutoff_user("bulkhigh", node_tokens=90000)
+    last_node_at, latest = exports._profile_update_inputs([user.id])
+
+    called = {}
+    monkeypatch.setattr(exports, "maybe_trigger_profile_update",
+                        lambda *a, **k: called.setdefault("yes", (a, k)))
+
+    exports.maybe_trigger_incremental_profile_update(
+        user, last_node_at=last_node_at.get(user.id),
+        latest_profile=latest.get(user.id))
+    assert called["yes"][0][0] == user.id
+
+
+def test_trigger_claims_guard_and_records_task_id(app, monkeypatch):
+    import backend.tasks.exports as exports
+    user = _seed_null_cutoff_user("claimok", node_tokens=10)
+    monkeypatch.setattr(exports.update_user_profile, "delay",
+                        lambda *a, **k: MagicMock(id="task-1"))
+
+    assert exports.maybe_trigger_profile_update(user.id) == "task-1"
+    assert _db.session.get(User, user.id).profile_generation_task_id == "task-1"
+
+
+def test_trigger_skips_when_guard_claimed_concurrently(app, monkeypatch):
+    """A stale guard replaced by another caller between the check and the
+    claim must not lead to a second dispatch."""
+    import backend.tasks.exports as exports
+    user = _seed_null_cutoff_user("claimrace", node_tokens=10)
+    user.profile_generation_task_id = "stale"
+    _db.session.commit()
+
+    def stale_but_raced(u):
+        _db.session.execute(
+            User.__table__.update().where(User.id == u.id)
+            .values(profile_generation_task_id="other-task"))
+        return True
+
+    monkeypatch.setattr(exports, "_is_task_stale", stale_but_raced)
+    dispatched = MagicMock()
+    monkeypatch.setattr(exports.update_user_profile, "delay", dispatched)
+
+    assert exports.maybe_trigger_profile_update(user.id) is None
+    dispatched.assert_not_called()
+    assert _db.session.get(User, user.id).profile_generation_task_id == "other-task"
+
+
+def test_trigger_releases_claim_when_dispatch_fails(app, monkeypatch):
+    import backend.tasks.exports as exports
+    user = _seed_null_cutoff_user("claimfail", node_tokens=10)
+
+    def broker_down(*a, **k):
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(exports.update_user_profile, "delay", broker_down)
+    with pytest.raises(ConnectionError):
+        exports.maybe_trigger_profile_update(user.id)
+    assert _db.session.get(User, user.id).profile_generation_task_id is None
@@ -14,10 +14,12 @@ sys.modules['celery'] = mock_celery
 sys.modules['celery.utils'] = MagicMock()
 sys.modules['celery.utils.log'] = MagicMock()
 
-# Mock backend.models so the import of quotes.py doesn't pull in
-# SQLAlchemy models, but keep it as a module-level variable only —
-# do NOT insert it into sys.modules (that breaks other test files).
+# Mock backend.models (and backend.extensions, for db.session.get) so the
+# import of quotes.py doesn't pull in SQLAlchemy models, but keep them as
+# module-level variables only — do NOT insert them into sys.modules at
+# import time (that breaks other test files).
 mock_models = MagicMock()
+mock_extensions = MagicMock()
 
 from backend.utils.quotes import (  # noqa: E402
     find_quote_ids,
@@ -426,13 +428,14 @@ class TestResolveQuotesForExport:
         # Patch backend.models in sys.modules so that lazy imports
         # inside resolve_quotes_for_export pick up the mock.
         self._patcher = patch.dict(
-            sys.modules, {'backend.models': mock_models}
+            sys.modules, {'backend.models': mock_models,
+                          'backend.extensions': mock_extensions}
         )
         self._patcher.start()
         # Configure the mock Node in backend.models
         self.mock_node = MagicMock()
         self.mock_node.user.username = "alice"
-        mock_models.Node.query.get.return_value = self.mock_node
+        mock_extensions.db.session.get.return_value = self.mock_node
 
     def teardown_method(self):
         self._patcher.stop()
@@ -702,14 +705,15 @@ class TestAiUsageFiltering:
         """Test resolve_quotes_for_export works normally without blocked IDs."""
         mock_node = MagicMock()
         mock_node.user.username = "alice"
-        mock_models.Node.query.get.return_value = mock_node
+        mock_extensions.db.session.get.return_value = mock_node
 
         embedded_quotes = {
             1: {10: "Embedded content"}
         }
 
         content = "See {quote:10}"
-        with patch.dict(sys.modules, {'backend.models': mock_models}):
+        with patch.dict(sys.modules, {'backend.models': mock_models,
+                                      'backend.extensions': mock_extensions}):
             result = resolve_quotes_for_export(
                 content, node_id=1, embedded_quotes=embedded_quotes,
                 user_id=1, ai_blocked_ids=None
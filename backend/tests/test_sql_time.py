@@ -0,0 +1,22 @@
+"""Tests for backend.utils.sql_time: the DB-side "now" renders as naive
+UTC per dialect."""
+
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+
+from backend.utils.sql_time import sql_utcnow
+
+
+def test_sql_utcnow_pins_postgres_to_utc():
+    compiled = str(sql_utcnow().compile(dialect=postgresql.dialect()))
+    assert compiled == "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+def test_sql_utcnow_sqlite_reads_back_naive_utc():
+    with create_engine("sqlite://").connect() as conn:
+        value = conn.execute(select(sql_utcnow())).scalar_one()
+
+    assert value.tzinfo is None
+    assert abs((datetime.utcnow() - value).total_seconds()) < 5
@@ -0,0 +1,457 @@
+"""Tests for the SSE streaming endpoints in backend.routes.sse.
+
+Streams are driven to a terminal state before the request is made so the
+generator finishes on its first poll — no sleeping, no threads.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+
+# ── Environment ──────────────────────────────────────────────────────────
+os.environ["ENCRYPTION_DISABLED"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("TWITTER_API_KEY", "fake")
+os.environ.setdefault("TWITTER_API_SECRET", "fake")
+
+sys.modules.setdefault("celery", MagicMock())
+sys.modules.setdefault("celery.utils", MagicMock())
+sys.modules.setdefault("celery.utils.log", MagicMock())
+sys.modules.setdefault("celery.result", MagicMock())
+
+import pytest  # noqa: E402
+from flask import Flask  # noqa: E402
+
+for _mod in ["flask_login", "backend.models", "backend.extensions"]:
+    if _mod in sys.modules and isinstance(sys.modules[_mod], MagicMock):
+        del sys.modules[_mod]
+
+import flask_login as _real_flask_login  # noqa: E402
+from backend.extensions import db as _db  # noqa: E402
+from backend.models import (  # noqa: E402
+    User, Node, Draft, NodeTranscriptChunk, TTSChunk,
+)
+import backend.models as _real_backend_models  # noqa: E402
+
+
+def _make_app():
+    from flask_login import LoginManager
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SECRET_KEY"] = "test-secret"
+    app.config["TESTING"] = True
+
+    _db.init_app(app)
+
+    login_manager = LoginManager(app)
+
+    @login_manager.user_loader
+    def load_user(user_id):
+        return _db.session.get(User, int(user_id))
+
+    from backend.routes.sse import sse_bp
+    app.register_blueprint(sse_bp, url_prefix="/api/sse")
+
+    return app
+
+
+@pytest.fixture
+def app():
+    _affected = lambda k: (  # noqa: E731
+        k == "flask_login"
+        or k.startswith("backend.routes")
+        or k == "backend.models"
+    )
+    saved = {k: sys.modules[k] for k in list(sys.modules) if _affected(k)}
+
+    sys.modules["flask_login"] = _real_flask_login
+    sys.modules["backend.models"] = _real_backend_models
+    for _k in [k for k in list(sys.modules) if k.startswith("backend.routes")]:
+        del sys.modules[_k]
+
+    app = _make_app()
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+
+    for k in [k for k in list(sys.modules) if _affected(k)]:
+        if k not in saved:
+            del sys.modules[k]
+    for k, mod in saved.items():
+        sys.modules[k] = mod
+
+
+@pytest.fixture
+def user(app):
+    u = User(username="alice", approved=True, plan="alpha")
+    _db.session.add(u)
+    _db.session.commit()
+    return u
+
+
+def _login(client, user_id):
+    with client.session_transaction() as sess:
+        sess["_user_id"] = str(user_id)
+        sess["_fresh"] = True
+
+
+def _add_transcript_chunks(statuses, **owner):
+    for index, status in enumerate(statuses):
+        chunk = NodeTranscriptChunk(chunk_index=index, status=status, **owner)
+        if status == "completed":
+            chunk.set_text(f"chunk {index}")
+        else:
+            chunk.error = f"boom {index}"
+        _db.session.add(chunk)
+    _db.session.commit()
+
+
+def _parse_events(body):
+    """Split a raw SSE body into ``(event, data)`` tuples."""
+    events = []
+    frames = body.strip().split("\n\n")
+    assert frames[0] == "retry: 15000"
+    for frame in frames[1:]:
+        event, data = None, None
+        for line in frame.split("\n"):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        if data is not None:
+            events.append((event, data))
+    return events
+
+
+def _stream(client, url):
+    resp = client.get(url)
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    assert resp.headers["Content-Encoding"] == "identity"
+    return _parse_events(resp.get_data(as_text=True))
+
+
+# ── Node transcription stream ────────────────────────────────────────────
+
+class TestNodeTranscriptionStream:
+    @pytest.fixture
+    def node(self, user):
+        node = Node(
+            user_id=user.id, content="final text", node_type="user",
+            streaming_transcription=True, transcription_status="completed",
+        )
+        _db.session.add(node)
+        _db.session.commit()
+        return node
+
+    def test_single_chunk_sent_as_chunk_complete(self, app, user, node):
+        _add_transcript_chunks(["completed"], node_id=node.id)
+        client = app.test_client()
+        _login(client, user.id)
+
+        events = _stream(client, f"/api/sse/nodes/{node.id}/transcription-stream")
+
+        assert [e for e, _ in events] == ["chunk_complete", "all_complete"]
+        assert events[0][1] == {"chunk_index": 0, "text": "chunk 0", "status": "completed"}
+        assert events[1][1]["content"] == "final text"
+
+    def test_burst_folded_into_chunks_batch(self, app, user, node):
+        _add_transcript_chunks(["completed", "completed", "completed"], node_id=node.id)
+        client = app.test_client()
+        _login(client, user.id)
+
+        events = _stream(client, f"/api/sse/nodes/{node.id}/transcription-stream")
+
+        assert [e for e, _ in events] == ["chunks_batch", "all_complete"]
+        batch = events[0][1]["chunks"]
+        assert [c["chunk_index"] for c in batch] == [0, 1, 2]
+        assert [c["text"] for c in batch] == ["chunk 0", "chunk 1", "chunk 2"]
+
+    def test_failed_chunk_keeps_chunk_order(self, app, user, node):
+        _add_transcript_chunks(["completed", "completed", "failed", "completed"],
+                               node_id=node.id)
+        client = app.test_client()
+        _login(client, user.id)
+
+        events = _stream(client, f"/api/sse/nodes/{node.id}/transcription-stream")
+
+        assert [e for e, _ in events] == [
+            "chunks_batch", "chunk_error", "chunk_complete", "all_complete",
+        ]
+        assert [c["chunk_index"] for c in events[0][1]["chunks"]] == [0, 1]
+        assert events[1][1]["chunk_index"] == 2
+        assert events[2][1]["chunk_index"] == 3
+
+    def test_last_chunk_skips_already_delivered(self, app, user, node):
+        _add_transcript_chunks(["completed", "completed", "completed"], node_id=node.id)
+        client = app.test_client()
+        _login(client, user.id)
+
+        events = _stream(
+            client, f"/api/sse/nodes/{node.id}/transcription-stream?last_chunk=1"
+        )
+
+        assert [e for e, _ in events] == ["chunk_complete", "all_complete"]
+        assert events[0][1]["chunk_index"] == 2
+
+    def test_other_user_forbidden(self, app, node):
+        other = User(username="mallory", approved=True)
+        _db.session.add(other)
+        _db.session.commit()
+        client = app.test_client()
+        _login(client, other.id)
+
+        resp = client.get(f"/api/sse/nodes/{node.id}/transcription-stream")
+        assert resp.status_code == 403
+
+
+# ── Draft transcription stream ───────────────────────────────────────────
+
+class TestDraftTranscriptionStream:
+    def test_burst_then_all_complete(self, app, user):
+        draft = Draft(user_id=user.id, session_id="sess-1",
+                      streaming_status="completed", streaming_completed_chunks=2)
+        draft.set_content("chunk 0\n\nchunk 1")
+        _db.session.add(draft)
+        _db.session.commit()
+        _add_transcript_chunks(["completed", "completed"], session_id="sess-1")
+        client = app.test_client()
+        _login(client, user.id)
+
+        events = _stream(client, "/api/sse/drafts/sess-1/transcription-stream")
+
+        assert [e for e, _ in events] == ["chunks_batch", "content_update", "all_complete"]
+        assert len(events[0][1]["chunks"]) == 2
+        assert events[2][1]["content"] == "chunk 0\n\nchunk 1"
+
+    def test_set_content_bumps_content_version(self, app, user):
+        draft = Draft(user_id=user.id, session_id="sess-2")
+        draft.set_content("")
+        _db.session.add(draft)
+        _db.session.commit()
+        assert draft.content_version == 1
+
+        draft.set_content("more")
+        _db.session.commit()
+        assert draft.content_version == 2
+
+    def test_content_read_once_per_version(self, app, user):
+        from backend.routes import sse
+
+        draft = Draft(user_id=user.id, session_id="sess-4")
+        draft.set_content("v1")
+        _db.session.add(draft)
+        _db.session.commit()
+        sse._draft_content_cache.clear()
+
+        assert sse._draft_content(draft.id, 1) == "v1"
+        # Same version -> served from the cache, no re-read
+        _db.session.execute(Draft.__table__.update().values(content="raw"))
+        _db.session.commit()
+        assert sse._draft_content(draft.id, 1) == "v1"
+
+        draft.set_content("v2")
+        _db.session.commit()
+        assert sse._draft_content(draft.id, 2) == "v2"
+        assert sse._draft_content_cache[draft.id] == (2, "v2")
+
+    def test_warning_survives_draft_cleanup(self, app, user):
+        llm_node = Node(user_id=user.id, content="reply", node_type="llm")
+        _db.session.add(llm_node)
+        _db.session.commit()
+        draft = Draft(user_id=user.id, session_id="sess-3",
+                      streaming_status="completed", llm_node_id=llm_node.id,
+                      streaming_warning="heads up")
+        draft.set_content("spoken")
+        _db.session.add(draft)
+        _db.session.commit()
+        client = app.test_client()
+        _login(client, user.id)
+
+        events = _stream(client, "/api/sse/drafts/sess-3/transcription-stream")
+
+        assert [e for e, _ in events] == ["content_update", "all_complete"]
+        assert events[1][1]["warning"] == "heads up"
+        assert events[1][1]["llm_node_id"] == llm_node.id
+        assert _db.session.query(Draft).filter_by(session_id="sess-3").count() == 0
+
+
+# ── TTS stream ───────────────────────────────────────────────────────────
+
+class TestTTSStream:
+    def test_completed_tts_returns_json_not_stream(self, app, user):
+        node = Node(user_id=user.id, content="x", node_type="user",
+                    tts_task_status="completed", audio_tts_url="/media/tts.mp3")
+        _db.session.add(node)
+        _db.session.commit()
+        client = app.test_client()
+        _login(client, user.id)
+
+        resp = client.get(f"/api/sse/nodes/{node.id}/tts-stream")
+        assert resp.status_code == 200
+        assert resp.json == {"status": "completed", "tts_url": "/media/tts.mp3"}
+
+
+    def test_generator_streams_chunks_until_complete(self, app, user):
+        from backend.routes.sse import _tts_stream_generator
+
+        node = Node(user_id=user.id, content="x", node_type="user",
+                    tts_task_status="completed", audio_tts_url="/a/full.mp3")
+        _db.session.add(node)
+        _db.session.commit()
+        _db.session.add_all([
+            TTSChunk(node_id=node.id, chunk_index=0, status="completed",
+                     audio_url="/a/0.mp3", duration=1.5),
+            TTSChunk(node_id=node.id, chunk_index=1, status="pending"),
+        ])
+        _db.session.commit()
+
+        body = b"".join(_tts_stream_generator(app, Node, node.id, "node_id", "Node", -1))
+        events = _parse_events(body.decode())
+
+        assert [e for e, _ in events] == ["chunk_ready", "all_complete"]
+        assert events[0][1]["audio_url"] == "/a/0.mp3"
+        assert events[0][1]["duration"] == 1.5
+        assert events[1][1]["tts_url"] == "/a/full.mp3"
+
+    def test_generator_batches_chunks_found_in_one_poll(self, app, user):
+        from backend.routes.sse import _tts_stream_generator
+
+        node = Node(user_id=user.id, content="x", node_type="user",
+                    tts_task_status="completed", audio_tts_url="/a/full.mp3")
+        _db.session.add(node)
+        _db.session.commit()
+        _db.session.add_all([
+            TTSChunk(node_id=node.id, chunk_index=i, status="completed",
+                     audio_url=f"/a/{i}.mp3", section_index=0, section_title="Intro")
+            for i in range(3)
+        ])
+        _db.session.commit()
+
+        body = b"".join(_tts_stream_generator(app, Node, node.id, "node_id", "Node", 0))
+        events = _parse_events(body.decode())
+
+        assert [e for e, _ in events] == ["chunks_batch", "all_complete"]
+        batch = events[0][1]["chunks"]
+        assert [c["audio_url"] for c in batch] == ["/a/1.mp3", "/a/2.mp3"]
+        assert batch[0]["section_title"] == "Intro"
+        assert "duration" not in batch[0]
+
+    def test_session_released_before_each_wait(self, app, user, monkeypatch):
+        from sqlalchemy import update
+        from backend.routes import sse
+
+        node = Node(user_id=user.id, content="x", node_type="user",
+                    tts_task_status="processing", audio_tts_url="/a/full.mp3")
+        _db.session.add(node)
+        _db.session.commit()
+        node_id = node.id
+
+        removals = []
+        real_remove = _db.session.remove
+
+        def counting_remove():
+            removals.append(1)
+            real_remove()
+
+        waits = []
+
+        def fake_wait(pubsub, timeout):
+            waits.append(len(removals))
+            assert len(waits) < 5
+            with app.app_context():
+                _db.session.execute(update(Node).where(Node.id == node_id)
+                                    .values(tts_task_status="completed"))
+                _db.session.commit()
+
+        monkeypatch.setattr(_db.session, "remove", counting_remove)
+        monkeypatch.setattr(sse.sse_notify, "wait_for_update", fake_wait)
+
+        body = b"".join(sse._tts_stream_generator(app, Node, node_id, "node_id", "Node", -1))
+
+        # The poll's session was torn down before the generator went idle
+        assert waits == [1]
+        assert [e for e, _ in _parse_events(body.decode())] == ["all_complete"]
+
+    def test_generator_reports_missing_entity(self, app):
+        from backend.routes.sse import _tts_stream_generator
+
+        body = b"".join(_tts_stream_generator(app, Node, 999, "node_id", "Node", -1))
+
+        assert _parse_events(body.decode()) == [("error", {"error": "Node not found"})]
+
+
+# ── Message formatting ───────────────────────────────────────────────────
+
+class TestFormatSseMessage:
+    def test_known_event_uses_cached_prefix(self):
+        from backend.routes.sse import format_sse_message
+
+        assert format_sse_message({"a": 1}, event="heartbeat") == \
+            b'event: heartbeat\ndata: {"a":1}\n\n'
+
+    def test_unknown_event_and_no_event(self):
+        from backend.routes.sse import format_sse_message
+
+        assert format_sse_message([1], event="custom") == b"event: custom\ndata: [1]\n\n"
+        assert format_sse_message("x") == b'data: "x"\n\n'
+
+
+# ── Poll backoff ─────────────────────────────────────────────────────────
+
+class TestNextPollInterval:
+    def test_starts_fast_and_backs_off_to_cap(self, app):
+        from backend.routes.sse import _next_poll_interval
+
+        interval = _next_poll_interval(app, None, False)
+        assert interval == 0.1
+        seen = [interval]
+        for _ in range(20):
+            interval = _next_poll_interval(app, interval, False)
+            seen.append(interval)
+        assert seen[1] == pytest.approx(0.15)
+        assert seen == sorted(seen)
+        assert seen[-1] == 2.0
+
+    def test_activity_resets_to_fastest(self, app):
+        from backend.routes.sse import _next_poll_interval
+
+        assert _next_poll_interval(app, 2.0, True) == 0.1
+
+    def test_reads_config(self, app):
+        from backend.routes.sse import _next_poll_interval
+
+        app.config.update(SSE_POLL_MIN_INTERVAL=0.5, SSE_POLL_BACKOFF=2,
+                          SSE_POLL_MAX_INTERVAL=1.5)
+        assert _next_poll_interval(app, None, False) == 0.5
+        assert _next_poll_interval(app, 0.5, False) == 1.0
+        assert _next_poll_interval(app, 1.0, False) == 1.5
+
+
+# ── TTS heartbeat counts ─────────────────────────────────────────────────
+
+class TestTTSChunkCounts:
+    def test_counts_shared_until_ttl_expires(self, app, user):
+        from backend.routes import sse
+
+        node = Node(user_id=user.id, content="x", node_type="user")
+        _db.session.add(node)
+        _db.session.commit()
+        _db.session.add(TTSChunk(node_id=node.id, chunk_index=0, status="completed"))
+        _db.session.commit()
+
+        sse._tts_count_cache.clear()
+        assert sse._tts_chunk_counts("node_id", node.id, 60) == (1, 1)
+
+        _db.session.add(TTSChunk(node_id=node.id, chunk_index=1, status="pending"))
+        _db.session.commit()
+        # Served from the shared cache within the heartbeat interval
+        assert sse._tts_chunk_counts("node_id", node.id, 60) == (1, 1)
+        # An expired entry is recomputed
+        sse._tts_count_cache[("node_id", node.id)] = (0, (1, 1))
+        assert sse._tts_chunk_counts("node_id", node.id, 60) == (2, 1)
@@ -0,0 +1,167 @@
+"""Tests for backend.utils.sse_notify (Redis Pub/Sub wake-ups for SSE).
+
+Redis itself is replaced by a recording fake; what's under test is which
+channels a commit nudges and the fallback behaviour when push is off.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+os.environ["ENCRYPTION_DISABLED"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+sys.modules.setdefault("celery", MagicMock())
+sys.modules.setdefault("celery.utils", MagicMock())
+sys.modules.setdefault("celery.utils.log", MagicMock())
+sys.modules.setdefault("celery.result", MagicMock())
+
+import pytest  # noqa: E402
+from flask import Flask  # noqa: E402
+
+for _mod in ["backend.models", "backend.extensions"]:
+    if _mod in sys.modules and isinstance(sys.modules[_mod], MagicMock):
+        del sys.modules[_mod]
+
+from backend.extensions import db as _db  # noqa: E402
+from backend.models import (  # noqa: E402
+    User, Node, Draft, NodeTranscriptChunk, TTSChunk,
+)
+from backend.utils import sse_notify  # noqa: E402
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def publish(self, channel, message):
+        self.published.append(channel)
+
+    def execute(self):
+        pass
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(sse_notify, "get_client", lambda config: fake)
+    return fake
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SSE_PUSH_NOTIFY"] = True
+    _db.init_app(app)
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+
+
+@pytest.fixture
+def node(app):
+    user = User(username="alice", approved=True)
+    _db.session.add(user)
+    _db.session.commit()
+    node = Node(user_id=user.id, content="x", node_type="user")
+    _db.session.add(node)
+    _db.session.commit()
+    return node
+
+
+def test_chunk_commit_nudges_node_transcript_channel(app, node, redis):
+    _db.session.add(NodeTranscriptChunk(node_id=node.id, chunk_index=0))
+    _db.session.commit()
+
+    assert redis.published == [sse_notify.transcript_channel(node_id=node.id)]
+
+
+def test_session_chunk_and_draft_nudge_session_channel(app, node, redis):
+    _db.session.add(Draft(user_id=node.user_id, session_id="s1"))
+    _db.session.add(NodeTranscriptChunk(session_id="s1", chunk_index=0))
+    _db.session.commit()
+
+    assert redis.published == [sse_notify.transcript_channel(session_id="s1")]
+
+
+def test_tts_chunk_nudges_tts_channel(app, node, redis):
+    _db.session.add(TTSChunk(node_id=node.id, chunk_index=0))
+    _db.session.commit()
+
+    assert redis.published == [sse_notify.tts_channel("node_id", node.id)]
+
+
+def test_unrelated_node_update_is_silent(app, node, redis):
+    node.content = "edited"
+    _db.session.commit()
+
+    assert redis.published == []
+
+
+def test_node_status_update_nudges_matching_stream(app, node, redis):
+    node.tts_task_status = "processing"
+    _db.session.commit()
+
+    assert redis.published == [sse_notify.tts_channel("node_id", node.id)]
+
+
+def test_rollback_publishes_nothing(app, node, redis):
+    _db.session.add(NodeTranscriptChunk(node_id=node.id, chunk_index=0))
+    _db.session.flush()
+    _db.session.rollback()
+    _db.session.commit()
+
+    assert redis.published == []
+
+
+def test_disabled_push_is_silent_and_subscribe_returns_none(app, node, redis):
+    app.config["SSE_PUSH_NOTIFY"] = False
+    _db.session.add(NodeTranscriptChunk(node_id=node.id, chunk_index=0))
+    _db.session.commit()
+
+    assert redis.published == []
+    assert sse_notify.subscribe(app.config, "any") is None
+
+
+def test_wait_without_pubsub_sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(sse_notify.time, "sleep", slept.append)
+
+    assert sse_notify.wait_for_update(None, 0.5) is False
+    assert slept == [0.5]
+
+
+def test_wait_drains_burst_of_nudges():
+    pubsub = MagicMock()
+    pubsub.get_message.side_effect = [{"data": b"1"}, {"data": b"1"}, None]
+
+    assert sse_notify.wait_for_update(pubsub, 5) is True
+    assert pubsub.get_message.call_count == 3
+
+
+def test_plain_node_insert_is_silent(app, node, redis):
+    _db.session.add(Node(user_id=node.user_id, content="y", node_type="user"))
+    _db.session.commit()
+
+    assert redis.published == []
+
+
+def test_redis_client_is_shared_per_broker_url(monkeypatch):
+    from backend.utils import redis_client
+    monkeypatch.setattr(redis_client, "_clients", {})
+
+    a = redis_client.get_client({"CELERY_BROKER_URL": "redis://h1:6379/0"})
+    b = redis_client.get_client({"CELERY_BROKER_URL": "redis://h1:6379/0"})
+    c = redis_client.get_client({"CELERY_BROKER_URL": "redis://h2:6379/0"})
+
+    assert a is b
+    assert a is not c
+    for client in redis_client._clients.values():
+        client.close()
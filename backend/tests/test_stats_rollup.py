@@ -0,0 +1,179 @@
+"""Tests for the /stats daily token rollup (backend/utils/stats_rollup.py).
+
+Patterned after test_spend_monitor.py: sqlite in-memory, minimal Flask
+app, no celery import (the beat task is a thin wrapper).
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+# ── Environment ──────────────────────────────────────────────────────────
+os.environ["ENCRYPTION_DISABLED"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("TWITTER_API_KEY", "fake")
+os.environ.setdefault("TWITTER_API_SECRET", "fake")
+
+sys.modules.setdefault("celery", MagicMock())
+sys.modules.setdefault("celery.utils", MagicMock())
+sys.modules.setdefault("celery.utils.log", MagicMock())
+sys.modules.setdefault("celery.result", MagicMock())
+
+import pytest  # noqa: E402
+from flask import Flask  # noqa: E402
+
+for _mod in ["backend.models", "backend.extensions"]:
+    if _mod in sys.modules and isinstance(sys.modules[_mod], MagicMock):
+        del sys.modules[_mod]
+
+from backend.extensions import db as _db  # noqa: E402
+from backend.models import User, Node, DailyNodeTokens  # noqa: E402
+from backend.utils import stats_rollup  # noqa: E402
+from backend.utils.stats_rollup import (  # noqa: E402
+    cached_daily_token_series, daily_token_series, refresh_daily_node_tokens,
+)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+        self.ttls[key] = ttl
+
+
+class _BrokenRedis:
+    def get(self, key):
+        raise ConnectionError("down")
+
+    setex = get
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["TESTING"] = True
+    _db.init_app(app)
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.rollback()
+        _db.drop_all()
+
+
+@pytest.fixture
+def users(app):
+    alice, bob = User(username="alice"), User(username="bob")
+    _db.session.add_all([alice, bob])
+    _db.session.commit()
+    return alice, bob
+
+
+def _days_ago(n):
+    return datetime.utcnow().replace(hour=12) - timedelta(days=n)
+
+
+def _add_node(user, tokens, created_at):
+    node = Node(user_id=user.id, content="x", node_type="user",
+                distributed_tokens=tokens)
+    node.created_at = created_at
+    _db.session.add(node)
+    _db.session.commit()
+    return node
+
+
+def _tokens(series):
+    return [point["tokens"] for point in series]
+
+
+def test_empty_series(users):
+    assert daily_token_series(users[0].id) == []
+    assert daily_token_series() == []
+
+
+def test_live_scan_before_first_refresh(users):
+    alice, bob = users
+    _add_node(alice, 5, _days_ago(2))
+    _add_node(bob, 7, _days_ago(0))
+
+    assert _tokens(daily_token_series(alice.id)) == [5, 0, 0]
+    assert _tokens(daily_token_series()) == [5, 0, 7]
+    assert daily_token_series(bob.id)[0]["date"] == \
+        datetime.utcnow().strftime("%Y-%m-%d")
+
+
+def test_refresh_rolls_up_completed_days_only(users):
+    alice, bob = users
+    _add_node(alice, 5, _days_ago(2))
+    _add_node(alice, 3, _days_ago(2))
+    _add_node(bob, 4, _days_ago(1))
+    _add_node(alice, 9, _days_ago(0))
+
+    assert refresh_daily_node_tokens() == 2
+    rows = {(r.user_id, r.tokens) for r in DailyNodeTokens.query.all()}
+    assert rows == {(alice.id, 8), (bob.id, 4)}
+
+    # Today is still summed live on top of the rollup
+    assert _tokens(daily_token_series(alice.id)) == [8, 0, 9]
+    assert _tokens(daily_token_series()) == [8, 4, 9]
+
+
+def test_days_after_rollup_are_read_live(users):
+    alice, _ = users
+    _add_node(alice, 5, _days_ago(3))
+    refresh_daily_node_tokens()
+    # Written after the refresh, e.g. yesterday before the post-midnight run
+    _add_node(alice, 2, _days_ago(1))
+
+    assert _tokens(daily_token_series(alice.id)) == [5, 0, 2, 0]
+
+
+def test_refresh_replaces_stale_rows(users):
+    alice, _ = users
+    node = _add_node(alice, 5, _days_ago(1))
+    refresh_daily_node_tokens()
+    node.distributed_tokens = 11
+    _db.session.commit()
+
+    refresh_daily_node_tokens()
+
+    assert [r.tokens for r in DailyNodeTokens.query.all()] == [11]
+
+
+# ── Redis memoization ────────────────────────────────────────────────────
+
+def test_cache_disabled_without_config(users, monkeypatch):
+    monkeypatch.setattr(stats_rollup, "get_client", lambda config: pytest.fail("no redis"))
+    _add_node(users[0], 5, _days_ago(0))
+
+    assert _tokens(cached_daily_token_series({}, users[0].id)) == [5]
+
+
+def test_cached_series_served_until_ttl(users, monkeypatch):
+    alice, _ = users
+    fake = _FakeRedis()
+    monkeypatch.setattr(stats_rollup, "get_client", lambda config: fake)
+    config = {"STATS_CACHE_SECONDS": 60}
+    _add_node(alice, 5, _days_ago(0))
+
+    assert _tokens(cached_daily_token_series(config, alice.id)) == [5]
+    _add_node(alice, 2, _days_ago(0))
+    assert _tokens(cached_daily_token_series(config, alice.id)) == [5]
+    # The global series has its own entry
+    assert _tokens(cached_daily_token_series(config)) == [7]
+    assert sorted(fake.ttls.values()) == [60, 60]
+
+
+def test_redis_failure_computes_directly(users, monkeypatch):
+    monkeypatch.setattr(stats_rollup, "get_client", lambda config: _BrokenRedis())
+    _add_node(users[0], 5, _days_ago(1))
+
+    assert _tokens(cached_daily_token_series(
+        {"STATS_CACHE_SECONDS": 60}, users[0].id)) == [5, 0]
@@ -0,0 +1,135 @@
+"""Tests for POST /api/terms/accept (backend.routes.terms).
+
+The admin signup email goes out through a Celery task; the task module is
+replaced with a MagicMock so no broker or SMTP is touched.
+"""
+import os
+import sys
+from unittest.mock import MagicMock
+
+# ── Environment ──────────────────────────────────────────────────────────
+os.environ["ENCRYPTION_DISABLED"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("TWITTER_API_KEY", "fake")
+os.environ.setdefault("TWITTER_API_SECRET", "fake")
+
+sys.modules.setdefault("celery", MagicMock())
+sys.modules.setdefault("celery.utils", MagicMock())
+sys.modules.setdefault("celery.utils.log", MagicMock())
+sys.modules.setdefault("celery.result", MagicMock())
+
+import pytest  # noqa: E402
+from flask import Flask  # noqa: E402
+
+for _mod in ["flask_login", "backend.models", "backend.extensions"]:
+    if _mod in sys.modules and isinstance(sys.modules[_mod], MagicMock):
+        del sys.modules[_mod]
+
+import flask_login as _real_flask_login  # noqa: E402
+from backend.extensions import db as _db  # noqa: E402
+from backend.models import User  # noqa: E402
+import backend.models as _real_backend_models  # noqa: E402
+
+
+def _make_app():
+    from flask_login import LoginManager
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SECRET_KEY"] = "test-secret"
+    app.config["TESTING"] = True
+
+    _db.init_app(app)
+
+    login_manager = LoginManager(app)
+
+    @login_manager.user_loader
+    def load_user(user_id):
+        return _db.session.get(User, int(user_id))
+
+    from backend.routes.terms import terms_bp
+    app.register_blueprint(terms_bp, url_prefix="/api/terms")
+
+    return app
+
+
+@pytest.fixture
+def notify_task(monkeypatch):
+    module = MagicMock()
+    monkeypatch.setitem(sys.modules, "backend.tasks.notifications", module)
+    return module.send_admin_signup_notification_task
+
+
+@pytest.fixture
+def app(notify_task):
+    _affected = lambda k: (  # noqa: E731
+        k == "flask_login"
+        or k.startswith("backend.routes")
+        or k == "backend.models"
+    )
+    saved = {k: sys.modules[k] for k in list(sys.modules) if _affected(k)}
+
+    sys.modules["flask_login"] = _real_flask_login
+    sys.modules["backend.models"] = _real_backend_models
+    for _k in [k for k in list(sys.modules) if k.startswith("backend.routes")]:
+        del sys.modules[_k]
+
+    app = _make_app()
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+
+    for k in [k for k in list(sys.modules) if _affected(k)]:
+        if k not in saved:
+            del sys.modules[k]
+    for k, mod in saved.items():
+        sys.modules[k] = mod
+
+
+def _login(client, user_id):
+    with client.session_transaction() as sess:
+        sess["_user_id"] = str(user_id)
+        sess["_fresh"] = True
+
+
+def _accept(app, user):
+    client = app.test_client()
+    _login(client, user.id)
+    return client.post("/api/terms/accept")
+
+
+def test_unapproved_user_enqueues_admin_email(app, notify_task):
+    user = User(username="newbie", email="new@example.com", approved=False)
+    _db.session.add(user)
+    _db.session.commit()
+
+    resp = _accept(app, user)
+
+    assert resp.status_code == 200
+    assert resp.json["accepted_terms_version"] == "2.0"
+    assert resp.json["accepted_terms_at"].endswith("Z")
+    notify_task.delay.assert_called_once_with("newbie", "new@example.com")
+    stored = _db.session.get(User, user.id).accepted_terms_at
+    assert resp.json["accepted_terms_at"] == stored.isoformat() + "Z"
+
+
+def test_approved_user_sends_nothing(app, notify_task):
+    user = User(username="regular", approved=True)
+    _db.session.add(user)
+    _db.session.commit()
+
+    assert _accept(app, user).status_code == 200
+    notify_task.delay.assert_not_called()
+
+
+def test_broker_outage_does_not_fail_acceptance(app, notify_task):
+    notify_task.delay.side_effect = ConnectionError("broker down")
+    user = User(username="unlucky", approved=False)
+    _db.session.add(user)
+    _db.session.commit()
+
+    assert _accept(app, user).status_code == 200
+    assert _db.session.get(User, user.id).accepted_terms_version == "2.0"
@@ -0,0 +1,232 @@
+"""Tests for the todo version endpoints (backend.routes.todo).
+
+Covers version numbering across GET/PATCH/PUT/revert and the one-query
+latest-version-plus-count lookup.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+# ── Environment ──────────────────────────────────────────────────────────
+os.environ["ENCRYPTION_DISABLED"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("TWITTER_API_KEY", "fake")
+os.environ.setdefault("TWITTER_API_SECRET", "fake")
+
+sys.modules.setdefault("celery", MagicMock())
+sys.modules.setdefault("celery.utils", MagicMock())
+sys.modules.setdefault("celery.utils.log", MagicMock())
+sys.modules.setdefault("celery.result", MagicMock())
+
+import pytest  # noqa: E402
+from flask import Flask  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+for _mod in ["flask_login", "backend.models", "backend.extensions"]:
+    if _mod in sys.modules and isinstance(sys.modules[_mod], MagicMock):
+        del sys.modules[_mod]
+
+import flask_login as _real_flask_login  # noqa: E402
+from backend.extensions import db as _db  # noqa: E402
+from backend.models import User, UserTodo  # noqa: E402
+import backend.models as _real_backend_models  # noqa: E402
+
+
+def _make_app():
+    from flask_login import LoginManager
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SECRET_KEY"] = "test-secret"
+    app.config["TESTING"] = True
+
+    _db.init_app(app)
+
+    login_manager = LoginManager(app)
+
+    @login_manager.user_loader
+    def load_user(user_id):
+        return _db.session.get(User, int(user_id))
+
+    from backend.routes.todo import todo_bp
+    app.register_blueprint(todo_bp, url_prefix="/api/todo")
+
+    return app
+
+
+@pytest.fixture
+def app():
+    _affected = lambda k: (  # noqa: E731
+        k == "flask_login"
+        or k.startswith("backend.routes")
+        or k == "backend.models"
+    )
+    saved = {k: sys.modules[k] for k in list(sys.modules) if _affected(k)}
+
+    sys.modules["flask_login"] = _real_flask_login
+    sys.modules["backend.models"] = _real_backend_models
+    for _k in [k for k in list(sys.modules) if k.startswith("backend.routes")]:
+        del sys.modules[_k]
+
+    app = _make_app()
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+
+    for k in [k for k in list(sys.modules) if _affected(k)]:
+        if k not in saved:
+            del sys.modules[k]
+    for k, mod in saved.items():
+        sys.modules[k] = mod
+
+
+@pytest.fixture
+def user(app):
+    u = User(username="alice", approved=True)
+    _db.session.add(u)
+    _db.session.commit()
+    return u
+
+
+@pytest.fixture
+def client(app, user):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["_user_id"] = str(user.id)
+        sess["_fresh"] = True
+    return client
+
+
+def _add_versions(user, *contents):
+    start = datetime.utcnow() - timedelta(hours=len(contents))
+    todos = []
+    for i, content in enumerate(contents):
+        todo = UserTodo(user_id=user.id, generated_by="user",
+                        created_at=start + timedelta(hours=i))
+        todo.set_content(content)
+        _db.session.add(todo)
+        todos.append(todo)
+    _db.session.commit()
+    return todos
+
+
+def test_get_without_versions(client):
+    assert client.get("/api/todo/").json == {"todo": None}
+
+
+def test_get_latest_with_version_number_in_one_select(app, client, user):
+    _add_versions(user, "- a", "- b", "- c")
+    # Another user's versions never count
+    other = User(username="bob")
+    _db.session.add(other)
+    _db.session.commit()
+    _add_versions(other, "- x")
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        todo = client.get("/api/todo/").json["todo"]
+    finally:
+        event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert todo["content"] == "- c"
+    assert todo["version_number"] == 3
+    # One for the login user, one for the todo + count
+    assert len(statements) == 2
+
+
+def test_patch_keeps_version_number(client, user):
+    _add_versions(user, "- a", "- b")
+
+    todo = client.patch("/api/todo/", json={"content": "- b done"}).json["todo"]
+
+    assert todo["content"] == "- b done"
+    assert todo["version_number"] == 2
+    assert client.get("/api/todo/").json["todo"]["content"] == "- b done"
+
+
+def test_put_and_revert_bump_version_number(client, user):
+    first, _ = _add_versions(user, "- a", "- b")
+
+    put = client.put("/api/todo/", json={"content": "- c"}).json["todo"]
+    assert put["content"] == "- c"
+    assert put["version_number"] == 3
+
+    reverted = client.post(f"/api/todo/revert/{first.id}").json["todo"]
+    assert reverted["content"] == "- a"
+    assert reverted["generated_by"] == "revert"
+    assert reverted["version_number"] == 4
+
+
+def test_put_returns_version_without_rereading(app, client, user):
+    _add_versions(user, "- a", "- b")
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        todo = client.put("/api/todo/", json={"content": "- c"}).json["todo"]
+    finally:
+        event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert todo["version_number"] == 3
+    assert todo["created_at"]
+    # The login user's SELECT, then only the INSERT ... RETURNING
+    assert statements == ["SELECT", "INSERT"]
+
+
+def test_versions_list_skips_content(client, user):
+    _add_versions(user, "- a", "- b")
+
+    versions = client.get("/api/todo/versions").json["versions"]
+
+    assert [v["version_number"] for v in versions] == [2, 1]
+    assert all("content" not in v for v in versions)
+    assert versions[0]["generated_by"] == "user"
+
+
+def test_get_version_checks_owner(client, user):
+    first, _ = _add_versions(user, "- a", "- b")
+    other = User(username="bob")
+    _db.session.add(other)
+    _db.session.commit()
+    (foreign,) = _add_versions(other, "- x")
+
+    todo = client.get(f"/api/todo/versions/{first.id}").json["todo"]
+    assert todo["content"] == "- a"
+    assert todo["id"] == first.id
+
+    assert client.get(f"/api/todo/versions/{foreign.id}").status_code == 403
+    assert client.get("/api/todo/versions/9999").status_code == 404
+
+
+def test_revert_copies_in_sql_and_guards_owner(client, user):
+    first, _ = _add_versions(user, "- a", "- b")
+    first.ai_usage = "none"
+    _db.session.commit()
+    other = User(username="bob")
+    _db.session.add(other)
+    _db.session.commit()
+    (foreign,) = _add_versions(other, "- x")
+
+    reverted = client.post(f"/api/todo/revert/{first.id}").json["todo"]
+    assert reverted["content"] == "- a"
+    assert reverted["version_number"] == 3
+    copy = _db.session.get(UserTodo, reverted["id"])
+    assert (copy.ai_usage, copy.tokens_used, copy.privacy_level) == ("none", 0, "private")
+
+    assert client.post(f"/api/todo/revert/{foreign.id}").status_code == 403
+    assert client.post("/api/todo/revert/9999").status_code == 404
+    assert UserTodo.query.filter_by(user_id=user.id).count() == 3
@@ -49,7 +49,7 @@ def attach_context_artifacts(node_id, user_id, prompt_record=None):
         ))
         content = prompt_record.get_content() or ""
     else:
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         content = (node.get_content() or "") if node else ""
 
     sync_context_artifacts(node_id, user_id, content)
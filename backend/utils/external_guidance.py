@@ -58,8 +58,9 @@ def external_content_enabled_for_user(config, user_id):
     """Env killswitch AND the user's own opt-in (#208 easter-egg ship).
     Constant per user per environment, so both prompt-render paths stay
     byte-identical between the pre-warm and generation."""
+    from backend.extensions import db
     from backend.models import User
     if not config.get("SEMANTIC_SEARCH_AGENTIC", True):
         return False
-    owner = User.query.get(user_id)
+    owner = db.session.get(User, user_id)
     return bool(owner and owner.external_content_enabled)
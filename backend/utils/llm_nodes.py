@@ -56,7 +56,7 @@ def pick_model_for_generation(parent_node, user):
                         or current.llm_model == "gpt-4.5-preview"):
                     break
             current = (
-                Node.query.get(current.parent_id)
+                db.session.get(Node, current.parent_id)
                 if current.parent_id else None
             )
 
@@ -95,7 +95,7 @@ def create_llm_placeholder(parent_node_id, model_id, human_owner_id,
     # COMMITTED — a plain SELECT-then-INSERT can't see the concurrent
     # deleted_at UPDATE in time. See backend/utils/node_deletion.py.
     from backend.utils.node_deletion import ParentDeletedError
-    parent = Node.query.with_for_update().get(parent_node_id)
+    parent = db.session.get(Node, parent_node_id, with_for_update=True)
     if parent is None:
         raise ParentDeletedError("Parent node not found")
     if parent.deleted_at is not None:
@@ -56,7 +56,7 @@ def assert_parent_alive(parent_id) -> Optional[Tuple[object, int]]:
     except (TypeError, ValueError):
         return jsonify({"error": "Invalid parent_id"}), 400
 
-    parent = Node.query.with_for_update().get(pid)
+    parent = db.session.get(Node, pid, with_for_update=True)
     if parent is None:
         return jsonify({"error": "Parent node not found"}), 404
     if parent.deleted_at is not None:
@@ -76,7 +76,7 @@ def soft_delete_node(node_id: int, user_id: int, *,
     """
     now = datetime.utcnow()
 
-    root = Node.query.with_for_update().get(node_id)
+    root = db.session.get(Node, node_id, with_for_update=True)
     if root is None:
         return None
     if not can_user_edit_node(root, user_id):
@@ -114,7 +114,7 @@ def soft_delete_node(node_id: int, user_id: int, *,
             continue
         visited.add(nid)
 
-        locked = Node.query.with_for_update().get(nid)
+        locked = db.session.get(Node, nid, with_for_update=True)
         if locked is None:
             # Already purged by cleanup, or never existed (e.g. race).
             continue
@@ -39,14 +39,25 @@ PROMPTS_DIR = os.path.join(
 )
 
 
+# path -> (mtime_ns, content); the stat keeps edited defaults live
+# without a worker restart
+_DEFAULT_CACHE = {}
+
+
 def load_default_prompt(prompt_key):
     """Load prompt content from the file system."""
     meta = PROMPT_DEFAULTS.get(prompt_key)
     if not meta:
         return None
     path = os.path.join(PROMPTS_DIR, meta['file'])
+    mtime = os.stat(path).st_mtime_ns
+    cached = _DEFAULT_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
     with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+        content = f.read()
+    _DEFAULT_CACHE[path] = (mtime, content)
+    return content
 
 
 def default_prompt_hash(prompt_key):
@@ -63,12 +63,13 @@ def get_ext_quote_data(item_ids: List[int], user_id: int) -> Dict[int, Optional[
     External items belong to the user who imported them; unlike nodes
     there is no cross-user sharing, so access == ownership.
     """
+    from backend.extensions import db
     from backend.models import ExternalItem
     from backend.utils.timefmt import iso_utc
 
     result = {}
     for item_id in item_ids:
-        item = ExternalItem.query.get(item_id)
+        item = db.session.get(ExternalItem, item_id)
         if item is None or item.user_id != user_id:
             result[item_id] = None
             continue
@@ -140,6 +141,7 @@ def get_quote_data(node_ids: List[int], user_id: int) -> Dict[int, Optional[dict
         renders these as `[Quoted node deleted]` rather than the privacy
         "not accessible" string.
     """
+    from backend.extensions import db
     from backend.models import Node
     from backend.utils.privacy import (
         can_user_access_node, can_user_view_tombstone,
@@ -148,7 +150,7 @@ def get_quote_data(node_ids: List[int], user_id: int) -> Dict[int, Optional[dict
     result = {}
 
     for node_id in node_ids:
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if node is None:
             result[node_id] = None
             continue
@@ -474,17 +476,18 @@ class ExportQuoteResolver:
     @staticmethod
     def _load_artifact_content(artifact_type, artifact_id):
         """Load content for an artifact by type and id."""
+        from backend.extensions import db
         if artifact_type == "prompt":
             from backend.models import UserPrompt
-            obj = UserPrompt.query.get(artifact_id)
+            obj = db.session.get(UserPrompt, artifact_id)
             return obj.get_content() if obj else None
         if artifact_type == "profile":
             from backend.models import UserProfile
-            obj = UserProfile.query.get(artifact_id)
+            obj = db.session.get(UserProfile, artifact_id)
             return obj.get_content() if obj else None
         if artifact_type == "todo":
             from backend.models import UserTodo
-            obj = UserTodo.query.get(artifact_id)
+            obj = db.session.get(UserTodo, artifact_id)
             return obj.get_content() if obj else None
         return None
 
@@ -569,11 +572,12 @@ class ExportQuoteResolver:
             return self._node_cache[node_id]
 
         # Fetch from database
+        from backend.extensions import db
         from backend.models import Node
         from backend.utils.privacy import can_user_access_node
         from backend.utils.tokens import approximate_token_count
 
-        node = Node.query.get(node_id)
+        node = db.session.get(Node, node_id)
         if not node or not can_user_access_node(node, self.user_id):
             return None
 
@@ -816,8 +820,9 @@ def resolve_quotes_for_export(
                 )
 
             # Get username for formatting
+            from backend.extensions import db
             from backend.models import Node
-            quoted_node = Node.query.get(quoted_id)
+            quoted_node = db.session.get(Node, quoted_id)
             username = quoted_node.user.username if quoted_node and quoted_node.user else "Unknown"
             return f'\n--- Quoted from @{username} (node #{quoted_id}) ---\n{embedded_content}\n--- End quote ---\n'
         else:
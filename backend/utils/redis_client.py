@@ -0,0 +1,31 @@
+"""Process-wide Redis clients on the Celery broker.
+
+Helpers that talk to the broker Redis from hot paths (the SSE push
+nudges run in the ``after_commit`` hook of every chunk write) must not
+build a connection pool per call: that costs a TCP connect each time and,
+with Redis down, a connect timeout on every commit. One client per broker
+URL is created lazily and shared; redis-py clients are thread-safe and
+their pools reset themselves after a fork, so prefork Celery workers are
+fine too.
+"""
+import threading
+
+_DEFAULT_URL = "redis://localhost:6379/0"
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(config):
+    """Return the shared Redis client for ``config['CELERY_BROKER_URL']``."""
+    url = config.get("CELERY_BROKER_URL", _DEFAULT_URL)
+    client = _clients.get(url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(url)
+            if client is None:
+                import redis
+                client = redis.Redis.from_url(
+                    url, socket_connect_timeout=2, socket_timeout=2)
+                _clients[url] = client
+    return client
@@ -1,6 +1,7 @@
 """Shared helpers for voice/conversation session routes."""
 
 from flask_login import current_user
+from backend.extensions import db
 from backend.models import Node
 from backend.utils.llm_nodes import create_llm_placeholder
 
@@ -26,7 +27,7 @@ def ancestors_have_prompt(node, user_id, prompt_key):
         if prompt is not None and prompt.prompt_key in keys:
             return True
         if current.parent_id:
-            current = Node.query.get(current.parent_id)
+            current = db.session.get(Node, current.parent_id)
         else:
             break
     return False
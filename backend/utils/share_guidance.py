@@ -23,8 +23,9 @@ def share_enabled_for_user(config, user_id):
     """Env flag AND the user's own opt-in (#228 dark ship). Constant per
     user per environment, so both prompt-render paths stay byte-identical
     between the pre-warm and generation."""
+    from backend.extensions import db
     from backend.models import User
     if not config.get("SHARE_V1", False):
         return False
-    owner = User.query.get(user_id)
+    owner = db.session.get(User, user_id)
     return bool(owner and owner.public_sharing_enabled)
@@ -0,0 +1,30 @@
+"""DB-side timestamp constructs.
+
+The naive-UTC serialization helpers live in ``timefmt`` (stdlib only);
+this module holds the SQLAlchemy side of the same convention.
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class sql_utcnow(FunctionElement):
+    """DB-side "now" as a naive-UTC timestamp, for writes that should use
+    the database clock instead of the app server's ``datetime.utcnow()``.
+
+    Postgres ``now()`` is a ``timestamptz`` that would be shifted into the
+    session timezone on its way into our naive columns, so it is pinned to
+    UTC explicitly; SQLite's ``CURRENT_TIMESTAMP`` is already UTC.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(sql_utcnow)
+def _compile_sql_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(sql_utcnow, "postgresql")
+def _compile_sql_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
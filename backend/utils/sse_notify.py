@@ -0,0 +1,175 @@
+"""Redis Pub/Sub wake-ups for the SSE streams (routes/sse.py).
+
+The SSE generators discover new transcript/TTS chunks by polling the DB.
+With push enabled, every commit that touches a streamed entity PUBLISHes
+a tiny nudge on that entity's channel, and a subscribed generator sleeps
+in ``pubsub.get_message()`` instead of ``time.sleep()`` — it wakes the
+moment a worker commits and otherwise polls only at a slow fallback rate.
+
+The nudge carries no payload: the DB stays the single source of truth
+(catch-up on ``last_chunk``, terminal states, ordering), and encrypted
+content never leaves Postgres in plaintext. Any Redis failure degrades to
+the plain polling loop.
+
+Channels are collected from mapper events, so every code path that writes
+a chunk or a status (Celery tasks, routes, scripts) notifies without
+having to remember to. Gated on ``SSE_PUSH_NOTIFY`` so bare test apps
+incur zero broker traffic.
+"""
+import logging
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from backend.models import Draft, Node, NodeTranscriptChunk, TTSChunk, UserProfile
+from backend.utils.redis_client import get_client
+
+logger = logging.getLogger(__name__)
+
+_CHANNEL_PREFIX = "wop:sse:"
+# Session.info key holding the channels to publish once the commit lands
+_PENDING_KEY = "sse_notify_channels"
+
+
+def transcript_channel(node_id=None, session_id=None):
+    """Channel for a node's (or a draft session's) transcription stream."""
+    if session_id is not None:
+        return f"{_CHANNEL_PREFIX}transcript:session:{session_id}"
+    return f"{_CHANNEL_PREFIX}transcript:node:{node_id}"
+
+
+def tts_channel(chunk_fk_attr, entity_id):
+    """Channel for a TTS stream; ``chunk_fk_attr`` is 'node_id' or 'profile_id'."""
+    owner = "profile" if chunk_fk_attr == "profile_id" else "node"
+    return f"{_CHANNEL_PREFIX}tts:{owner}:{entity_id}"
+
+
+def _enabled(config):
+    return bool(config.get("SSE_PUSH_NOTIFY"))
+
+
+# ── Publishing ───────────────────────────────────────────────────────────
+
+def _changed(target, *attrs):
+    """True if any of *attrs* is being written by the current flush."""
+    state = inspect(target)
+    return any(state.attrs[a].history.has_changes() for a in attrs)
+
+
+def _channels_for(target):
+    if isinstance(target, NodeTranscriptChunk):
+        if target.session_id is not None:
+            return [transcript_channel(session_id=target.session_id)]
+        if target.node_id is not None:
+            return [transcript_channel(node_id=target.node_id)]
+    elif isinstance(target, TTSChunk):
+        if target.profile_id is not None:
+            return [tts_channel("profile_id", target.profile_id)]
+        if target.node_id is not None:
+            return [tts_channel("node_id", target.node_id)]
+    elif isinstance(target, Draft):
+        if target.session_id is not None:
+            return [transcript_channel(session_id=target.session_id)]
+    elif isinstance(target, Node):
+        channels = []
+        if _changed(target, "transcription_status",
+                    "streaming_completed_chunks"):
+            channels.append(transcript_channel(node_id=target.id))
+        if _changed(target, "tts_task_status", "tts_task_progress"):
+            channels.append(tts_channel("node_id", target.id))
+        return channels
+    elif isinstance(target, UserProfile):
+        if _changed(target, "tts_task_status", "tts_task_progress"):
+            return [tts_channel("profile_id", target.id)]
+    return []
+
+
+def _collect(mapper, connection, target):
+    """Mapper hook: remember which stream channels this write should nudge."""
+    session = object_session(target)
+    if session is None:
+        return
+    channels = _channels_for(target)
+    if channels:
+        session.info.setdefault(_PENDING_KEY, set()).update(channels)
+
+
+for _model in (NodeTranscriptChunk, TTSChunk, Draft, Node, UserProfile):
+    event.listen(_model, "after_insert", _collect)
+    event.listen(_model, "after_update", _collect)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session):
+    channels = session.info.pop(_PENDING_KEY, None)
+    if not channels:
+        return
+    try:
+        from flask import current_app, has_app_context
+        if not has_app_context() or not _enabled(current_app.config):
+            return
+        pipe = get_client(current_app.config).pipeline(transaction=False)
+        for channel in channels:
+            pipe.publish(channel, b"1")
+        pipe.execute()
+    except Exception:
+        logger.warning("SSE push notify failed; streams fall back to polling",
+                       exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ── Subscribing ──────────────────────────────────────────────────────────
+
+def subscribe(config, channel):
+    """Return a Pub/Sub subscribed to *channel*, or None.
+
+    None (push disabled or Redis unreachable) makes ``wait_for_update``
+    a plain sleep, i.e. the stream keeps polling exactly as before.
+    """
+    if not _enabled(config):
+        return None
+    try:
+        pubsub = get_client(config).pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        return pubsub
+    except Exception:
+        logger.warning("SSE push subscribe failed; polling instead",
+                       exc_info=True)
+        return None
+
+
+def wait_for_update(pubsub, timeout):
+    """Block up to *timeout* seconds; return True if a nudge arrived.
+
+    Drains any further queued nudges so a burst of commits costs one poll.
+    """
+    if pubsub is None:
+        time.sleep(timeout)
+        return False
+    start = time.time()
+    try:
+        message = pubsub.get_message(timeout=timeout)
+        if message is None:
+            return False
+        while pubsub.get_message(timeout=0) is not None:
+            pass
+        return True
+    except Exception:
+        logger.warning("SSE push wait failed; polling instead", exc_info=True)
+        time.sleep(max(0.0, timeout - (time.time() - start)))
+        return False
+
+
+def close(pubsub):
+    """Unsubscribe and release the Pub/Sub connection (None-safe)."""
+    if pubsub is None:
+        return
+    try:
+        pubsub.close()
+    except Exception:
+        logger.debug("SSE push close failed", exc_info=True)
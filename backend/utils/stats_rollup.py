@@ -0,0 +1,133 @@
+"""Daily token rollup behind the /stats endpoint.
+
+/stats used to run SUM(distributed_tokens) GROUP BY date(created_at) over
+the whole node table on every request. Completed days never change (short
+of edits and purges, which the periodic rebuild picks up), so they live in
+the DailyNodeTokens table and each request only sums today's nodes live.
+
+Days are UTC, matching the naive-UTC ``created_at`` timestamps. On top
+of that, ``cached_daily_token_series`` memoizes each series in Redis for
+STATS_CACHE_SECONDS, so dashboard refreshes within that window skip the
+DB entirely.
+"""
+import json
+import logging
+from datetime import datetime, time, timedelta
+
+from sqlalchemy import func, insert, select
+
+from backend.extensions import db
+from backend.models import DailyNodeTokens, Node
+from backend.utils.redis_client import get_client
+
+logger = logging.getLogger(__name__)
+
+_CACHE_KEY_PREFIX = "wop:stats:series:"
+
+
+def _today_start():
+    return datetime.combine(datetime.utcnow().date(), time.min)
+
+
+def refresh_daily_node_tokens():
+    """Rebuild the rollup for every completed day; return the row count.
+
+    Delete + INSERT ... SELECT in one transaction, so readers keep seeing
+    the previous rollup until the commit lands.
+    """
+    day = func.date(Node.created_at)
+    source = db.session.query(
+        Node.user_id,
+        day,
+        func.coalesce(func.sum(Node.distributed_tokens), 0),
+    ).filter(
+        Node.created_at < _today_start(),
+    ).group_by(Node.user_id, day)
+
+    db.session.query(DailyNodeTokens).delete(synchronize_session=False)
+    result = db.session.execute(
+        insert(DailyNodeTokens).from_select(
+            ["user_id", "day", "tokens"], source.statement))
+    db.session.commit()
+    return result.rowcount
+
+
+def _as_date(value):
+    # SQLite hands func.date() back as a string
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+
+def _live_daily_tokens(user_id, since):
+    # Narrow Core select: only the two aggregated columns come back, served
+    # by ix_node_user_created / ix_node_created_at for the usual "today" range.
+    day = func.date(Node.created_at).label("day")
+    stmt = select(day, func.sum(Node.distributed_tokens).label("tokens"))
+    if since is not None:
+        stmt = stmt.where(Node.created_at >= since)
+    if user_id is not None:
+        stmt = stmt.where(Node.user_id == user_id)
+    return db.session.execute(stmt.group_by(day)).all()
+
+
+def daily_token_series(user_id=None):
+    """Gap-filled ``[{"date", "tokens"}]`` from the first active day to today.
+
+    ``user_id=None`` gives the global series. Days after the newest rolled
+    up day (today, plus yesterday until the first refresh after midnight)
+    are summed live; before the first refresh that is the whole table.
+    """
+    rolled_up_to = db.session.execute(select(func.max(DailyNodeTokens.day))).scalar()
+    if rolled_up_to is None:
+        rows = _live_daily_tokens(user_id, None)
+    else:
+        stmt = select(DailyNodeTokens.day, func.sum(DailyNodeTokens.tokens))
+        if user_id is not None:
+            stmt = stmt.where(DailyNodeTokens.user_id == user_id)
+        rows = db.session.execute(stmt.group_by(DailyNodeTokens.day)).all()
+        live_since = datetime.combine(_as_date(rolled_up_to) + timedelta(days=1), time.min)
+        rows += _live_daily_tokens(user_id, live_since)
+
+    tokens_by_day = {}
+    for day, tokens in rows:
+        day = _as_date(day)
+        tokens_by_day[day] = tokens_by_day.get(day, 0) + int(tokens or 0)
+    if not tokens_by_day:
+        return []
+
+    day, today = min(tokens_by_day), datetime.utcnow().date()
+    series = []
+    while day <= today:
+        series.append({"date": day.strftime("%Y-%m-%d"),
+                       "tokens": tokens_by_day.get(day, 0)})
+        day += timedelta(days=1)
+    return series
+
+
+def cached_daily_token_series(config, user_id=None):
+    """``daily_token_series`` memoized in Redis for STATS_CACHE_SECONDS.
+
+    Keyed by user (or "global") and UTC day, so a cached series never
+    spans midnight. Any Redis failure degrades to computing it directly.
+    """
+    ttl = config.get("STATS_CACHE_SECONDS", 0)
+    if not ttl:
+        return daily_token_series(user_id)
+
+    key = (f"{_CACHE_KEY_PREFIX}{user_id if user_id is not None else 'global'}:"
+           f"{datetime.utcnow().date().isoformat()}")
+    try:
+        blob = get_client(config).get(key)
+        if blob is not None:
+            return json.loads(blob)
+    except Exception:
+        logger.warning("Stats cache read failed; computing series",
+                       exc_info=True)
+
+    series = daily_token_series(user_id)
+    try:
+        get_client(config).setex(key, ttl, json.dumps(series, separators=(",", ":")))
+    except Exception:
+        logger.warning("Stats cache write failed", exc_info=True)
+    return series
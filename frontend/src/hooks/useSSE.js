@@ -168,23 +168,29 @@ export function useTranscriptionSSE(nodeId, options = {}) {
   const backendUrl = process.env.REACT_APP_BACKEND_URL || '';
   const url = nodeId ? `${backendUrl}/api/sse/nodes/${nodeId}/transcription-stream` : null;
 
-  const eventHandlers = {
-    chunk_complete: (data) => {
-      setChunks(prev => {
-        // Add or update chunk
-        const existing = prev.find(c => c.index === data.chunk_index);
-        if (existing) {
-          return prev.map(c =>
-            c.index === data.chunk_index ? { ...c, text: data.text } : c
-          );
-        }
-        return [...prev, { index: data.chunk_index, text: data.text }].sort(
-          (a, b) => a.index - b.index
+  const handleChunkComplete = (data) => {
+    setChunks(prev => {
+      // Add or update chunk
+      const existing = prev.find(c => c.index === data.chunk_index);
+      if (existing) {
+        return prev.map(c =>
+          c.index === data.chunk_index ? { ...c, text: data.text } : c
         );
-      });
-      if (onChunkComplete) {
-        onChunkComplete(data);
       }
+      return [...prev, { index: data.chunk_index, text: data.text }].sort(
+        (a, b) => a.index - b.index
+      );
+    });
+    if (onChunkComplete) {
+      onChunkComplete(data);
+    }
+  };
+
+  const eventHandlers = {
+    chunk_complete: handleChunkComplete,
+    // Several chunks finished at once — the server folds them into one frame
+    chunks_batch: (data) => {
+      (data.chunks || []).forEach(handleChunkComplete);
     },
     chunk_error: (data) => {
       if (onError) {
@@ -295,8 +301,8 @@ export function useDraftTranscriptionSSE(sessionId, options = {}) {
 
   // Memoize eventHandlers to prevent unnecessary reconnections
   // Handlers use refs internally to always call latest callbacks
-  const eventHandlers = useMemo(() => ({
-    chunk_complete: (data) => {
+  const eventHandlers = useMemo(() => {
+    const handleChunkComplete = (data) => {
       // Track last event time for stale connection detection
       lastEventTimeRef.current = Date.now();
       // Track last received chunk for reconnection (ref doesn't trigger re-renders)
@@ -317,40 +323,48 @@ export function useDraftTranscriptionSSE(sessionId, options = {}) {
       if (onChunkCompleteRef.current) {
         onChunkCompleteRef.current(data);
       }
-    },
-    chunk_error: (data) => {
-      lastEventTimeRef.current = Date.now();
-      if (onErrorRef.current) {
-        onErrorRef.current(data);
-      }
-    },
-    content_update: (data) => {
-      lastEventTimeRef.current = Date.now();
-      setDraftContent(data.content);
-      if (onContentUpdateRef.current) {
-        onContentUpdateRef.current(data);
-      }
-    },
-    all_complete: (data) => {
-      lastEventTimeRef.current = Date.now();
-      setIsComplete(true);
-      setFinalContent(data.content);
-      setDraftContent(data.content);
-      if (onAllCompleteRef.current) {
-        onAllCompleteRef.current(data);
-      }
-    },
-    error: (data) => {
-      lastEventTimeRef.current = Date.now();
-      if (onErrorRef.current) {
-        onErrorRef.current(data);
-      }
-    },
-    heartbeat: () => {
-      // Track last event time for stale connection detection
-      lastEventTimeRef.current = Date.now();
-    },
-  }), []); // Empty deps - handlers use refs internally
+    };
+
+    return {
+      chunk_complete: handleChunkComplete,
+      // Several chunks finished at once — the server folds them into one frame
+      chunks_batch: (data) => {
+        (data.chunks || []).forEach(handleChunkComplete);
+      },
+      chunk_error: (data) => {
+        lastEventTimeRef.current = Date.now();
+        if (onErrorRef.current) {
+          onErrorRef.current(data);
+        }
+      },
+      content_update: (data) => {
+        lastEventTimeRef.current = Date.now();
+        setDraftContent(data.content);
+        if (onContentUpdateRef.current) {
+          onContentUpdateRef.current(data);
+        }
+      },
+      all_complete: (data) => {
+        lastEventTimeRef.current = Date.now();
+        setIsComplete(true);
+        setFinalContent(data.content);
+        setDraftContent(data.content);
+        if (onAllCompleteRef.current) {
+          onAllCompleteRef.current(data);
+        }
+      },
+      error: (data) => {
+        lastEventTimeRef.current = Date.now();
+        if (onErrorRef.current) {
+          onErrorRef.current(data);
+        }
+      },
+      heartbeat: () => {
+        // Track last event time for stale connection detection
+        lastEventTimeRef.current = Date.now();
+      },
+    };
+  }, []); // Empty deps - handlers use refs internally
 
   const { isConnected, error, disconnect } = useSSE(url, {
     enabled,
@@ -472,8 +486,8 @@ export function useTTSStreamSSE(entityId, options = {}) {
 
   // Memoize eventHandlers to prevent unnecessary reconnections
   // Handlers use refs internally to always call latest callbacks
-  const eventHandlers = useMemo(() => ({
-    chunk_ready: (data) => {
+  const eventHandlers = useMemo(() => {
+    const handleChunkReady = (data) => {
       if (receivedIndicesRef.current.has(data.chunk_index)) return;
       receivedIndicesRef.current.add(data.chunk_index);
       setAudioChunks(prev => {
@@ -492,18 +506,26 @@ export function useTTSStreamSSE(entityId, options = {}) {
       if (onChunkReadyRef.current) {
         onChunkReadyRef.current(data);
       }
-    },
-    all_complete: (data) => {
-      setIsComplete(true);
-      setFinalUrl(data.tts_url);
-      if (onAllCompleteRef.current) {
-        onAllCompleteRef.current(data);
-      }
-    },
-    heartbeat: () => {
-      // Keep-alive, no action needed
-    },
-  }), []); // Empty deps - handlers use refs internally
+    };
+
+    return {
+      chunk_ready: handleChunkReady,
+      // Several chunks found in one server poll arrive as a single frame
+      chunks_batch: (data) => {
+        (data.chunks || []).forEach(handleChunkReady);
+      },
+      all_complete: (data) => {
+        setIsComplete(true);
+        setFinalUrl(data.tts_url);
+        if (onAllCompleteRef.current) {
+          onAllCompleteRef.current(data);
+        }
+      },
+      heartbeat: () => {
+        // Keep-alive, no action needed
+      },
+    };
+  }, []); // Empty deps - handlers use refs internally
 
   const { isConnected, error, disconnect } = useSSE(url, {
     enabled,